@@ -2,24 +2,49 @@ from flask import Flask
 from flask_migrate import Migrate
 from flask_restx import Api
 from flask_cors import CORS
-from config import Config
-from extensions import db, jwt
+from config import get_config
+from extensions import db, jwt, cache
 import logging
 
 
-def create_app(config_class=Config):
+def create_app(config_class=None):
     app = Flask(__name__)
-    app.config.from_object(config_class)
+    app.config.from_object(config_class or get_config())
+
+    from utils.db_pool import engine_options, init_db_pool
+    from utils.db_routing import replica_binds, router
+
+    # 连接池、超时等引擎参数（显式配置了 SQLALCHEMY_ENGINE_OPTIONS 时以其为准）
+    app.config.setdefault(
+        "SQLALCHEMY_ENGINE_OPTIONS",
+        engine_options(app.config, app.config["SQLALCHEMY_DATABASE_URI"]),
+    )
+    # 只读副本作为 replica_N bind 注册，由 router 为只读请求选择
+    app.config["SQLALCHEMY_BINDS"] = {
+        **replica_binds(app.config),
+        **app.config.get("SQLALCHEMY_BINDS", {}),
+    }
 
     # init extensions
     db.init_app(app)
+    init_db_pool(app)
+    router.init_app(app)
     jwt.init_app(app)
+    cache.init_app(app)
     CORS(app)
     # initialize migrate via extensions so CLI commands are registered on import
     from extensions import migrate
 
     migrate.init_app(app, db)
 
+    from utils.security import init_password_hashing
+
+    init_password_hashing(app)
+
+    from services.prescoring_service import init_prescoring
+
+    init_prescoring(app)
+
     # JWT错误处理器
     @jwt.expired_token_loader
     def expired_token_callback(jwt_header, jwt_payload):
@@ -43,18 +68,50 @@ def create_app(config_class=Config):
         app, version="1.0", title="智能面试官 API", description="基础 RESTful API"
     )
 
+    # 连接池耗尽：让客户端稍后重试，而不是返回通用的 500。
+    # API 路由的异常由 flask-restx 处理，必须注册在 api 上才会生效
+    from sqlalchemy.exc import TimeoutError as PoolTimeout
+
+    @api.errorhandler(PoolTimeout)
+    def handle_pool_timeout(e):
+        app.logger.error(f"数据库连接池耗尽: {str(e)}")
+        return {"message": "服务繁忙，请稍后重试"}, 503, {"Retry-After": "1"}
+
+    # 使用 orjson（未安装时回退到标准库 json）序列化响应
+    from utils.serialization import output_json
+
+    api.representations["application/json"] = output_json
+
+    from commands import register_commands
+
+    register_commands(app)
+
     # import and register namespaces
     from routes.auth import ns as auth_ns
     from routes.job import ns as job_ns
     from routes.interview import ns as interview_ns
     from routes.resume import ns as resume_ns
     from routes.user import ns as user_ns
+    from routes.analytics import ns as analytics_ns
+    from routes.templates import ns as templates_ns
+    from routes.question_bank import ns as question_bank_ns
+    from routes.system import ns as system_ns
 
     api.add_namespace(auth_ns, path="/api/auth")
     api.add_namespace(job_ns, path="/api/jobs")
     api.add_namespace(interview_ns, path="/api/interviews")
     api.add_namespace(resume_ns, path="/api/resumes")
     api.add_namespace(user_ns, path="/api/users")
+    api.add_namespace(analytics_ns, path="/api/analytics")
+    api.add_namespace(templates_ns, path="/api/templates")
+    api.add_namespace(question_bank_ns, path="/api/question-bank")
+    api.add_namespace(system_ns, path="/api/system")
+
+    # SQLite 的简历全文索引是虚拟表，不随 db.create_all() 创建
+    from services.resume_service import ResumeService
+
+    with app.app_context():
+        ResumeService.init_fts()
 
     # Ensure a super-admin user exists (configured via env vars or .env fallback)
     import os
@@ -0,0 +1,176 @@
+import json
+import multiprocessing
+import time
+import click
+
+
+def _worker_process(index, batch_size, poll_interval):
+    """`flask worker --processes N` 的子进程入口：各自创建应用和连接池"""
+    from app import create_app
+    from services.task_queue import default_worker_id, work
+
+    app = create_app()
+    with app.app_context():
+        try:
+            work(f"{default_worker_id()}-{index}", batch_size, poll_interval)
+        except KeyboardInterrupt:
+            pass
+
+
+def register_commands(app):
+    """注册 flask 命令行命令"""
+
+    @app.cli.command("reindex-resumes")
+    @click.option("--batch-size", default=500, show_default=True)
+    def reindex_resumes(batch_size):
+        """重建简历全文检索索引"""
+        from services.resume_service import ResumeService
+
+        count = ResumeService.reindex_all(batch_size)
+        click.echo(f"reindexed {count} resumes")
+
+    @app.cli.command("regrade-choices")
+    @click.option("--interview-id", type=int, default=None)
+    @click.option("--batch-size", default=500, show_default=True)
+    def regrade_choices(interview_id, batch_size):
+        """参考答案修改后，重新评分已提交面试的选择题"""
+        from services.interview_service import InterviewService
+
+        count = InterviewService.regrade_choice_questions(interview_id, batch_size)
+        click.echo(f"regraded {count} questions")
+
+    @app.cli.command("prescore-answers")
+    @click.option("--interview-id", type=int, default=None)
+    def prescore_answers(interview_id):
+        """计算文本/代码题答案与参考答案的相似度特征（补算历史数据）"""
+        from models.interview_question import InterviewQuestion
+        from services.prescoring_service import prescore_questions
+
+        query = InterviewQuestion.query
+        if interview_id is not None:
+            query = query.filter_by(interview_id=interview_id)
+        started = time.perf_counter()
+        count = prescore_questions(query)
+        elapsed = time.perf_counter() - started
+        click.echo(f"prescored {count} answers in {elapsed:.2f}s")
+
+    @app.cli.command("prune-question-bank")
+    def prune_question_bank():
+        """删除没有被任何面试或模板引用的题库题目"""
+        from services.question_bank_service import QuestionBankService
+
+        count = QuestionBankService.delete_unused()
+        click.echo(f"deleted {count} unused bank questions")
+
+    @app.cli.command("worker")
+    @click.option("--processes", default=1, show_default=True)
+    @click.option("--batch-size", default=10, show_default=True)
+    @click.option("--poll-interval", type=float, default=None)
+    @click.option("--once", is_flag=True, help="处理完当前队列后退出")
+    def worker(processes, batch_size, poll_interval, once):
+        """启动后台任务 worker"""
+        from services.task_queue import work, worker_metrics
+
+        if processes > 1 and not once:
+            context = multiprocessing.get_context("spawn")
+            children = [
+                context.Process(
+                    target=_worker_process, args=(i, batch_size, poll_interval)
+                )
+                for i in range(processes)
+            ]
+            for child in children:
+                child.start()
+            try:
+                for child in children:
+                    child.join()
+            except KeyboardInterrupt:
+                for child in children:
+                    child.join()
+            return
+
+        try:
+            count = work(
+                batch_size=batch_size,
+                poll_interval=poll_interval,
+                max_tasks=float("inf") if once else None,
+            )
+            click.echo(f"processed {count} tasks")
+        except KeyboardInterrupt:
+            pass
+        click.echo(json.dumps(worker_metrics(), indent=2))
+
+    @app.cli.command("task-stats")
+    @click.option(
+        "--window", default=3600, show_default=True, help="执行统计的时间窗口（秒）"
+    )
+    def task_stats(window):
+        """按任务名和状态统计后台任务队列，以及最近窗口内所有 worker 的执行次数和耗时"""
+        from services.task_queue import execution_stats, queue_stats
+
+        click.echo(
+            json.dumps(
+                {"queue": queue_stats(), "executed": execution_stats(window)},
+                indent=2,
+            )
+        )
+
+    @app.cli.command("rebuild-analytics")
+    def rebuild_analytics():
+        """从已完成的评价全量重建招聘指标汇总表"""
+        from services.analytics_service import rebuild_rollups
+
+        count = rebuild_rollups()
+        click.echo(f"rebuilt analytics from {count} evaluations")
+
+    @app.cli.command("import-users")
+    @click.argument("path", type=click.Path(exists=True, dir_okay=False))
+    @click.option("--chunk-size", default=500, show_default=True)
+    def import_users_command(path, chunk_size):
+        """从 CSV 批量导入用户（表头 username,email,password[,role]）"""
+        from services.user_service import import_users, read_import_csv
+
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            report = import_users(read_import_csv(f), chunk_size)
+        for error in report["errors"]:
+            click.echo(f"line {error['line']} {error['username']}: {error['error']}")
+        click.echo(
+            f"imported {report['created']} of {report['total']} rows, "
+            f"{report['failed']} failed"
+        )
+
+    @app.cli.command("fanout-template")
+    @click.argument("template_id", type=int)
+    @click.argument("path", type=click.Path(exists=True, dir_okay=False))
+    @click.option("--interviewer-id", type=int, help="默认为模板创建者")
+    @click.option("--chunk-size", default=500, show_default=True)
+    def fanout_template_command(template_id, path, interviewer_id, chunk_size):
+        """把模板分发给文件中的面试者（每行一个用户ID）"""
+        from models.interview_template import InterviewTemplate
+        from services.template_service import TemplateService
+
+        template = InterviewTemplate.query.get(template_id)
+        if template is None:
+            raise click.ClickException("template not found")
+        with open(path, encoding="utf-8-sig") as f:
+            try:
+                ids = [int(line) for line in f if line.strip()]
+            except ValueError:
+                raise click.ClickException("each line must be a user id")
+
+        def progress(done, total):
+            click.echo(f"{done}/{total}")
+
+        report, error = TemplateService.fan_out(
+            template_id,
+            interviewer_id or template.created_by,
+            ids,
+            chunk_size,
+            progress,
+        )
+        if error:
+            raise click.ClickException(error)
+        click.echo(
+            f"created {report['created']} interviews, "
+            f"skipped {len(report['skipped'])}, invalid {len(report['invalid'])}"
+        )
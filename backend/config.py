@@ -5,6 +5,10 @@ basedir = os.path.abspath(os.path.dirname(__file__))
 load_dotenv(os.path.join(basedir, ".env"))
 
 
+def _env_flag(name, default):
+    return os.environ.get(name, str(default)).lower() == "true"
+
+
 class Config:
     SECRET_KEY = os.environ.get("SECRET_KEY", "dev-secret")
     SQLALCHEMY_DATABASE_URI = os.environ.get(
@@ -12,3 +16,84 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     JWT_SECRET_KEY = os.environ.get("JWT_SECRET_KEY", "jwt-secret")
+    # 进程内用户缓存 TTL（秒），0 表示关闭。每个请求的角色检查都经过该缓存，
+    # 其他进程中的角色变更最多延迟 TTL 秒生效
+    USER_CACHE_TTL = int(os.environ.get("USER_CACHE_TTL", 30))
+    # 密码哈希: pbkdf2_sha256 | scrypt，KDF 在有界线程池中执行
+    PASSWORD_HASHER = os.environ.get("PASSWORD_HASHER", "pbkdf2_sha256")
+    PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", 4))
+    PASSWORD_HASH_QUEUE_SIZE = int(os.environ.get("PASSWORD_HASH_QUEUE_SIZE", 64))
+    # 服务层读缓存: memory（进程内 LRU+TTL）| redis
+    CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "memory")
+    CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL", "redis://localhost:6379/0")
+    CACHE_DEFAULT_TTL = int(os.environ.get("CACHE_DEFAULT_TTL", 60))
+    CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", 1024))
+    # 简历-岗位匹配索引检查数据库变化的最小间隔（秒）
+    MATCHING_SYNC_INTERVAL = float(os.environ.get("MATCHING_SYNC_INTERVAL", 5))
+    # 每次同步重新扫描水位线之前多少秒内变化的行，覆盖提交晚于 updated_at 的事务
+    MATCHING_SYNC_OVERLAP = float(os.environ.get("MATCHING_SYNC_OVERLAP", 60))
+    # 文本/代码题相似度预评分进程数，0 表示在请求内同步计算
+    PRESCORE_WORKERS = int(os.environ.get("PRESCORE_WORKERS", 2))
+    PRESCORE_CHUNK_SIZE = int(os.environ.get("PRESCORE_CHUNK_SIZE", 200))
+    # 后台任务队列（background_tasks 表 + `flask worker`）
+    TASK_QUEUE_ENABLED = os.environ.get("TASK_QUEUE_ENABLED", "false").lower() == "true"
+    TASK_MAX_ATTEMPTS = int(os.environ.get("TASK_MAX_ATTEMPTS", 3))
+    TASK_VISIBILITY_TIMEOUT = int(os.environ.get("TASK_VISIBILITY_TIMEOUT", 300))
+    TASK_RETRY_BACKOFF = int(os.environ.get("TASK_RETRY_BACKOFF", 10))
+    TASK_POLL_INTERVAL = float(os.environ.get("TASK_POLL_INTERVAL", 1.0))
+    # 模板分发每批面试者数量；超过 FANOUT_SYNC_LIMIT 人且启用任务队列时转为后台执行
+    FANOUT_CHUNK_SIZE = int(os.environ.get("FANOUT_CHUNK_SIZE", 500))
+    FANOUT_SYNC_LIMIT = int(os.environ.get("FANOUT_SYNC_LIMIT", 2000))
+    # 批量导入用户超过该行数且启用任务队列时转为后台执行（密码哈希较慢）
+    IMPORT_SYNC_LIMIT = int(os.environ.get("IMPORT_SYNC_LIMIT", 50))
+    # 数据库连接池与超时（SQLite 不使用这些设置），由 utils.db_pool.engine_options 转换为引擎参数
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 20))
+    # 连接池耗尽时等待空闲连接的秒数，超时返回 503 而不是一直挂起请求
+    DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", 10))
+    DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING = _env_flag("DB_POOL_PRE_PING", True)
+    DB_CONNECT_TIMEOUT = int(os.environ.get("DB_CONNECT_TIMEOUT", 10))
+    # 单条语句超时（毫秒），0 表示不限制
+    DB_STATEMENT_TIMEOUT_MS = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", 0))
+    # 经 PgBouncer 事务池模式连接：不在应用内做连接池，语句超时改为每个事务 SET LOCAL
+    DB_PGBOUNCER = _env_flag("DB_PGBOUNCER", False)
+    # 取连接等待超过该毫秒数时记录警告
+    DB_SLOW_CHECKOUT_MS = int(os.environ.get("DB_SLOW_CHECKOUT_MS", 200))
+    # 只读副本（逗号分隔的连接串），GET 请求的查询路由到副本，不配置则全部走主库
+    DATABASE_REPLICA_URLS = os.environ.get("DATABASE_REPLICA_URLS", "")
+    # 用户写入后多少秒内其请求仍读主库
+    REPLICA_STICKY_SECONDS = float(os.environ.get("REPLICA_STICKY_SECONDS", 5))
+    # 副本延迟超过该秒数或连接失败时回退到主库；检查间隔（秒）
+    REPLICA_MAX_LAG_SECONDS = float(os.environ.get("REPLICA_MAX_LAG_SECONDS", 10))
+    REPLICA_CHECK_INTERVAL = float(os.environ.get("REPLICA_CHECK_INTERVAL", 5))
+
+
+class DevelopmentConfig(Config):
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 5))
+
+
+class ProductionConfig(Config):
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 20))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 30))
+    DB_STATEMENT_TIMEOUT_MS = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", 30000))
+
+
+class PgBouncerConfig(ProductionConfig):
+    DB_PGBOUNCER = _env_flag("DB_PGBOUNCER", True)
+
+
+config_by_name = {
+    "development": DevelopmentConfig,
+    "production": ProductionConfig,
+    "pgbouncer": PgBouncerConfig,
+}
+
+
+def get_config(name=None):
+    """按 APP_ENV 选择配置，默认 development"""
+    name = name or os.environ.get("APP_ENV", "development")
+    if name not in config_by_name:
+        raise ValueError(f"unknown APP_ENV: {name}")
+    return config_by_name[name]
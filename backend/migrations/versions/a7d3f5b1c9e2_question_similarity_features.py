@@ -0,0 +1,26 @@
+"""question similarity features
+
+Revision ID: a7d3f5b1c9e2
+Revises: f4c8e1a9b2d6
+Create Date: 2026-10-18 14:21:40.118305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d3f5b1c9e2'
+down_revision = 'f4c8e1a9b2d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('interview_questions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('similarity', sa.JSON(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('interview_questions', schema=None) as batch_op:
+        batch_op.drop_column('similarity')
@@ -0,0 +1,26 @@
+"""background task result
+
+Revision ID: b3e9d2f7a1c4
+Revises: f1d6b8a3c5e7
+Create Date: 2026-10-18 21:12:07.530214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e9d2f7a1c4'
+down_revision = 'f1d6b8a3c5e7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('background_tasks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('result', sa.JSON(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('background_tasks', schema=None) as batch_op:
+        batch_op.drop_column('result')
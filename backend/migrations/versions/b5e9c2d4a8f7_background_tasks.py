@@ -0,0 +1,44 @@
+"""background tasks
+
+Revision ID: b5e9c2d4a8f7
+Revises: a7d3f5b1c9e2
+Create Date: 2026-10-18 15:47:03.602871
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5e9c2d4a8f7'
+down_revision = 'a7d3f5b1c9e2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('background_tasks',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=True),
+    sa.Column('status', sa.String(length=16), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('run_at', sa.DateTime(), nullable=False),
+    sa.Column('locked_until', sa.DateTime(), nullable=True),
+    sa.Column('locked_by', sa.String(length=64), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('background_tasks', schema=None) as batch_op:
+        batch_op.create_index('ix_background_tasks_status_run_at', ['status', 'run_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('background_tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_background_tasks_status_run_at')
+
+    op.drop_table('background_tasks')
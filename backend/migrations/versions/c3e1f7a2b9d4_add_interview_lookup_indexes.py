@@ -0,0 +1,43 @@
+"""add interview lookup indexes
+
+Revision ID: c3e1f7a2b9d4
+Revises: 06bfd387d486
+Create Date: 2026-10-18 09:12:37.415208
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e1f7a2b9d4'
+down_revision = '06bfd387d486'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 面试列表: interviewer_id/interviewee_id + status 过滤, 按 (created_at, id) 排序/游标分页
+    with op.batch_alter_table('interviews', schema=None) as batch_op:
+        batch_op.create_index('ix_interviews_interviewer_status_created', ['interviewer_id', 'status', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_interviews_interviewee_status_created', ['interviewee_id', 'status', 'created_at', 'id'], unique=False)
+
+    # 题目列表: interview_id 过滤, 按 order_index 排序
+    with op.batch_alter_table('interview_questions', schema=None) as batch_op:
+        batch_op.create_index('ix_interview_questions_interview_order', ['interview_id', 'order_index'], unique=False)
+
+    # 每场面试最多一条评价
+    with op.batch_alter_table('interview_evaluations', schema=None) as batch_op:
+        batch_op.create_index('ix_interview_evaluations_interview_id', ['interview_id'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('interview_evaluations', schema=None) as batch_op:
+        batch_op.drop_index('ix_interview_evaluations_interview_id')
+
+    with op.batch_alter_table('interview_questions', schema=None) as batch_op:
+        batch_op.drop_index('ix_interview_questions_interview_order')
+
+    with op.batch_alter_table('interviews', schema=None) as batch_op:
+        batch_op.drop_index('ix_interviews_interviewee_status_created')
+        batch_op.drop_index('ix_interviews_interviewer_status_created')
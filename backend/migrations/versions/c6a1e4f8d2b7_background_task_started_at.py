@@ -0,0 +1,26 @@
+"""background task started_at
+
+Revision ID: c6a1e4f8d2b7
+Revises: b3e9d2f7a1c4
+Create Date: 2026-10-19 10:02:44.913580
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6a1e4f8d2b7'
+down_revision = 'b3e9d2f7a1c4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('background_tasks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('started_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('background_tasks', schema=None) as batch_op:
+        batch_op.drop_column('started_at')
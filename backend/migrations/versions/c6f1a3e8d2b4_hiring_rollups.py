@@ -0,0 +1,39 @@
+"""hiring rollups
+
+Revision ID: c6f1a3e8d2b4
+Revises: b5e9c2d4a8f7
+Create Date: 2026-10-18 16:58:27.419036
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6f1a3e8d2b4'
+down_revision = 'b5e9c2d4a8f7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('hiring_rollups',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('dimension', sa.String(length=16), nullable=False),
+    sa.Column('dimension_id', sa.Integer(), nullable=False),
+    sa.Column('evaluated_count', sa.Integer(), nullable=False),
+    sa.Column('passed_count', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.Float(), nullable=False),
+    sa.Column('score_sq_sum', sa.Float(), nullable=False),
+    sa.Column('score_histogram', sa.JSON(), nullable=True),
+    sa.Column('duration_sum', sa.Float(), nullable=False),
+    sa.Column('duration_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('dimension', 'dimension_id', name='uq_hiring_rollups_dimension')
+    )
+    # 已有数据通过 `flask rebuild-analytics` 回填
+
+
+def downgrade():
+    op.drop_table('hiring_rollups')
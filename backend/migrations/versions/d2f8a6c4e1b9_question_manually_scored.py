@@ -0,0 +1,29 @@
+"""question manually scored flag
+
+Revision ID: d2f8a6c4e1b9
+Revises: c6a1e4f8d2b7
+Create Date: 2026-10-19 15:37:02.584116
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2f8a6c4e1b9'
+down_revision = 'c6a1e4f8d2b7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('interview_questions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('manually_scored', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+    # 自动评分从不写评语，有评语的题目都经过面试官人工评分
+    op.execute('UPDATE interview_questions SET manually_scored = true WHERE comments IS NOT NULL')
+
+
+def downgrade():
+    with op.batch_alter_table('interview_questions', schema=None) as batch_op:
+        batch_op.drop_column('manually_scored')
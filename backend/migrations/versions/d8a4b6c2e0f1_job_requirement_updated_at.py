@@ -0,0 +1,29 @@
+"""job requirement updated_at
+
+Revision ID: d8a4b6c2e0f1
+Revises: c3e1f7a2b9d4
+Create Date: 2026-10-18 10:05:12.530144
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8a4b6c2e0f1'
+down_revision = 'c3e1f7a2b9d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('job_requirements', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+    # 已有岗位以创建时间作为初始更新时间
+    op.execute('UPDATE job_requirements SET updated_at = created_at')
+
+
+def downgrade():
+    with op.batch_alter_table('job_requirements', schema=None) as batch_op:
+        batch_op.drop_column('updated_at')
@@ -0,0 +1,27 @@
+"""interview job index
+
+Revision ID: d9b4e7f2a6c1
+Revises: c6f1a3e8d2b4
+Create Date: 2026-10-18 17:40:55.208613
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9b4e7f2a6c1'
+down_revision = 'c6f1a3e8d2b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 岗位排行榜: 按 job_requirement_id 取面试，再经 interview_evaluations.interview_id 唯一索引关联评价
+    with op.batch_alter_table('interviews', schema=None) as batch_op:
+        batch_op.create_index('ix_interviews_job_requirement', ['job_requirement_id', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('interviews', schema=None) as batch_op:
+        batch_op.drop_index('ix_interviews_job_requirement')
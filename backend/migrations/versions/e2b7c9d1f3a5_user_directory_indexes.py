@@ -0,0 +1,36 @@
+"""user directory indexes
+
+Revision ID: e2b7c9d1f3a5
+Revises: d8a4b6c2e0f1
+Create Date: 2026-10-18 11:20:48.902317
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b7c9d1f3a5'
+down_revision = 'd8a4b6c2e0f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index('ix_users_role_created', ['role', 'created_at', 'id'], unique=False)
+
+    # 用户名/邮箱的子串搜索使用 pg_trgm GIN 索引，其他数据库不创建
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.create_index('ix_users_username_trgm', 'users', ['username'], unique=False, postgresql_using='gin', postgresql_ops={'username': 'gin_trgm_ops'})
+        op.create_index('ix_users_email_trgm', 'users', ['email'], unique=False, postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_users_email_trgm', table_name='users')
+        op.drop_index('ix_users_username_trgm', table_name='users')
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ix_users_role_created')
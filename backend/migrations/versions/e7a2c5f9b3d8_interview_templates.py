@@ -0,0 +1,64 @@
+"""interview templates
+
+Revision ID: e7a2c5f9b3d8
+Revises: d9b4e7f2a6c1
+Create Date: 2026-10-18 18:22:13.540917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a2c5f9b3d8'
+down_revision = 'd9b4e7f2a6c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('interview_templates',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('job_requirement_id', sa.Integer(), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['job_requirement_id'], ['job_requirements.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('interview_template_questions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('template_id', sa.Integer(), nullable=False),
+    sa.Column('question_text', sa.Text(), nullable=False),
+    sa.Column('question_type', sa.String(length=32), nullable=False),
+    sa.Column('options', sa.JSON(), nullable=True),
+    sa.Column('reference_answer', sa.Text(), nullable=True),
+    sa.Column('score', sa.Integer(), nullable=True),
+    sa.Column('order_index', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['template_id'], ['interview_templates.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('interview_template_questions', schema=None) as batch_op:
+        batch_op.create_index('ix_interview_template_questions_template_order', ['template_id', 'order_index'], unique=False)
+
+    with op.batch_alter_table('interviews', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('template_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key('fk_interviews_template_id', 'interview_templates', ['template_id'], ['id'])
+        # 同一模板对同一面试者只分发一次，重复执行分发时据此跳过
+        batch_op.create_index('uq_interviews_template_interviewee', ['template_id', 'interviewee_id'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('interviews', schema=None) as batch_op:
+        batch_op.drop_index('uq_interviews_template_interviewee')
+        batch_op.drop_constraint('fk_interviews_template_id', type_='foreignkey')
+        batch_op.drop_column('template_id')
+
+    with op.batch_alter_table('interview_template_questions', schema=None) as batch_op:
+        batch_op.drop_index('ix_interview_template_questions_template_order')
+
+    op.drop_table('interview_template_questions')
+    op.drop_table('interview_templates')
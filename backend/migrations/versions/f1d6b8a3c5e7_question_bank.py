@@ -0,0 +1,173 @@
+"""question bank
+
+Revision ID: f1d6b8a3c5e7
+Revises: e7a2c5f9b3d8
+Create Date: 2026-10-18 19:05:41.772310
+
+"""
+import hashlib
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1d6b8a3c5e7'
+down_revision = 'e7a2c5f9b3d8'
+branch_labels = None
+depends_on = None
+
+CONTENT_COLUMNS = ('question_text', 'question_type', 'options', 'reference_answer')
+BATCH_SIZE = 1000
+
+question_bank = sa.table(
+    'question_bank',
+    sa.column('id', sa.Integer),
+    sa.column('content_hash', sa.String),
+    sa.column('question_text', sa.Text),
+    sa.column('question_type', sa.String),
+    sa.column('options', sa.JSON),
+    sa.column('reference_answer', sa.Text),
+    sa.column('created_at', sa.DateTime),
+    sa.column('updated_at', sa.DateTime),
+)
+
+
+def _question_table(name):
+    return sa.table(
+        name,
+        sa.column('id', sa.Integer),
+        sa.column('bank_question_id', sa.Integer),
+        sa.column('question_text', sa.Text),
+        sa.column('question_type', sa.String),
+        sa.column('options', sa.JSON),
+        sa.column('reference_answer', sa.Text),
+    )
+
+
+def _hash(row):
+    # 与 models.question_bank.question_hash 保持一致
+    canonical = json.dumps(
+        [row[name] for name in CONTENT_COLUMNS],
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(',', ':'),
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _backfill(bind, table):
+    """把已有题目的内容按哈希写入题库，并回填 bank_question_id"""
+    from datetime import datetime
+
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(table.c.id, *(table.c[name] for name in CONTENT_COLUMNS))
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(BATCH_SIZE)
+        ).mappings().all()
+        if not rows:
+            break
+        hashes = {row['id']: _hash(row) for row in rows}
+        existing = dict(bind.execute(
+            sa.select(question_bank.c.content_hash, question_bank.c.id)
+            .where(question_bank.c.content_hash.in_(set(hashes.values())))
+        ).all())
+        missing = {}
+        now = datetime.utcnow()
+        for row in rows:
+            content_hash = hashes[row['id']]
+            if content_hash not in existing and content_hash not in missing:
+                missing[content_hash] = {
+                    'content_hash': content_hash,
+                    **{name: row[name] for name in CONTENT_COLUMNS},
+                    'question_type': row['question_type'] or 'text',
+                    'created_at': now,
+                    'updated_at': now,
+                }
+        if missing:
+            bind.execute(question_bank.insert(), list(missing.values()))
+            existing.update(bind.execute(
+                sa.select(question_bank.c.content_hash, question_bank.c.id)
+                .where(question_bank.c.content_hash.in_(list(missing)))
+            ).all())
+        bind.execute(
+            table.update()
+            .where(table.c.id == sa.bindparam('row_id'))
+            .values(bank_question_id=sa.bindparam('bank_id')),
+            [{'row_id': row_id, 'bank_id': existing[h]} for row_id, h in hashes.items()],
+        )
+        last_id = rows[-1]['id']
+
+
+def upgrade():
+    op.create_table('question_bank',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('question_text', sa.Text(), nullable=False),
+    sa.Column('question_type', sa.String(length=32), nullable=False),
+    sa.Column('options', sa.JSON(), nullable=True),
+    sa.Column('reference_answer', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('content_hash')
+    )
+
+    for name in ('interview_questions', 'interview_template_questions'):
+        with op.batch_alter_table(name, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('bank_question_id', sa.Integer(), nullable=True))
+
+    bind = op.get_bind()
+    for name in ('interview_questions', 'interview_template_questions'):
+        _backfill(bind, _question_table(name))
+
+    with op.batch_alter_table('interview_questions', schema=None) as batch_op:
+        batch_op.alter_column('bank_question_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_foreign_key('fk_interview_questions_bank_question_id', 'question_bank', ['bank_question_id'], ['id'])
+        batch_op.create_index(batch_op.f('ix_interview_questions_bank_question_id'), ['bank_question_id'], unique=False)
+        for column in CONTENT_COLUMNS:
+            batch_op.drop_column(column)
+
+    with op.batch_alter_table('interview_template_questions', schema=None) as batch_op:
+        batch_op.alter_column('bank_question_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_foreign_key('fk_interview_template_questions_bank_question_id', 'question_bank', ['bank_question_id'], ['id'])
+        for column in CONTENT_COLUMNS:
+            batch_op.drop_column(column)
+
+
+def downgrade():
+    for name in ('interview_questions', 'interview_template_questions'):
+        with op.batch_alter_table(name, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('question_text', sa.Text(), nullable=True))
+            batch_op.add_column(sa.Column('question_type', sa.String(length=32), nullable=True))
+            batch_op.add_column(sa.Column('options', sa.JSON(), nullable=True))
+            batch_op.add_column(sa.Column('reference_answer', sa.Text(), nullable=True))
+
+        table = _question_table(name)
+        op.execute(
+            table.update().values({
+                column: sa.select(question_bank.c[column])
+                .where(question_bank.c.id == table.c.bank_question_id)
+                .scalar_subquery()
+                for column in CONTENT_COLUMNS
+            })
+        )
+
+    with op.batch_alter_table('interview_template_questions', schema=None) as batch_op:
+        batch_op.alter_column('question_text', existing_type=sa.Text(), nullable=False)
+        batch_op.alter_column('question_type', existing_type=sa.String(length=32), nullable=False)
+        batch_op.drop_constraint('fk_interview_template_questions_bank_question_id', type_='foreignkey')
+        batch_op.drop_column('bank_question_id')
+
+    with op.batch_alter_table('interview_questions', schema=None) as batch_op:
+        batch_op.alter_column('question_text', existing_type=sa.Text(), nullable=False)
+        batch_op.alter_column('question_type', existing_type=sa.String(length=32), nullable=False)
+        batch_op.drop_index(batch_op.f('ix_interview_questions_bank_question_id'))
+        batch_op.drop_constraint('fk_interview_questions_bank_question_id', type_='foreignkey')
+        batch_op.drop_column('bank_question_id')
+
+    op.drop_table('question_bank')
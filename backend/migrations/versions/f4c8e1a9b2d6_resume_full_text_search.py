@@ -0,0 +1,46 @@
+"""resume full text search
+
+Revision ID: f4c8e1a9b2d6
+Revises: e2b7c9d1f3a5
+Create Date: 2026-10-18 13:02:11.774520
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4c8e1a9b2d6'
+down_revision = 'e2b7c9d1f3a5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('resumes', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('search_tokens', sa.Text(), nullable=True))
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        # search_tokens 已在应用层完成中英文分词，这里用 simple 配置生成 tsvector
+        op.execute(
+            "ALTER TABLE resumes ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(search_tokens, ''))) STORED"
+        )
+        op.create_index('ix_resumes_search_vector', 'resumes', ['search_vector'], unique=False, postgresql_using='gin')
+    elif dialect == 'sqlite':
+        op.execute('CREATE VIRTUAL TABLE IF NOT EXISTS resumes_fts USING fts5(tokens)')
+
+    # 已有简历的检索词通过 `flask reindex-resumes` 生成
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_resumes_search_vector', table_name='resumes')
+        op.drop_column('resumes', 'search_vector')
+    elif dialect == 'sqlite':
+        op.execute('DROP TABLE IF EXISTS resumes_fts')
+
+    with op.batch_alter_table('resumes', schema=None) as batch_op:
+        batch_op.drop_column('search_tokens')
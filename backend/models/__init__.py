@@ -1,6 +1,10 @@
 from .user import User
 from .job_requirement import JobRequirement
 from .interview import Interview
+from .question_bank import BankQuestion
 from .interview_question import InterviewQuestion
 from .interview_evaluation import InterviewEvaluation
 from .resume import Resume
+from .background_task import BackgroundTask
+from .hiring_rollup import HiringRollup
+from .interview_template import InterviewTemplate, TemplateQuestion
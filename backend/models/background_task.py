@@ -0,0 +1,73 @@
+from extensions import db
+from utils.serialization import compile_serializer
+from datetime import datetime
+
+TASK_STATUSES = ("queued", "running", "done", "failed")
+
+
+class BackgroundTask(db.Model):
+    __tablename__ = "background_tasks"
+    __table_args__ = (
+        db.Index("ix_background_tasks_status_run_at", "status", "run_at"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    # 任务名称（对应 services.task_queue 中注册的处理函数）
+    name = db.Column(db.String(64), nullable=False)
+
+    # 任务参数（JSON）
+    payload = db.Column(db.JSON, nullable=True)
+
+    # 状态: 'queued', 'running', 'done', 'failed'
+    status = db.Column(db.String(16), nullable=False, default="queued")
+
+    # 已领取次数与最大尝试次数
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=3)
+
+    # 最早可执行时间（重试退避时推后）
+    run_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    # 可见性超时：worker 崩溃后租约到期，任务可被重新领取
+    locked_until = db.Column(db.DateTime, nullable=True)
+    locked_by = db.Column(db.String(64), nullable=True)
+
+    # 最近一次被领取的时间，与 finished_at 一起计算执行耗时
+    started_at = db.Column(db.DateTime, nullable=True)
+
+    # 最近一次失败原因
+    last_error = db.Column(db.Text, nullable=True)
+
+    # 处理函数的返回值（JSON），如导入报告
+    result = db.Column(db.JSON, nullable=True)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    def to_dict(self):
+        return _serialize(self)
+
+
+_serialize = compile_serializer(
+    (
+        "id",
+        "name",
+        "payload",
+        "status",
+        "attempts",
+        "max_attempts",
+        "run_at",
+        "locked_until",
+        "locked_by",
+        "started_at",
+        "last_error",
+        "result",
+        "created_at",
+        "updated_at",
+        "finished_at",
+    )
+)
@@ -0,0 +1,64 @@
+from extensions import db
+from datetime import datetime
+
+ROLLUP_DIMENSIONS = ("job", "interviewer")
+
+# 得分百分比直方图的桶数（每桶 10%）
+SCORE_BUCKETS = 10
+
+
+class HiringRollup(db.Model):
+    """已完成评价的汇总数据，按岗位或面试官聚合，评价完成时增量更新"""
+
+    __tablename__ = "hiring_rollups"
+    __table_args__ = (
+        db.UniqueConstraint(
+            "dimension", "dimension_id", name="uq_hiring_rollups_dimension"
+        ),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    # 聚合维度: 'job'（岗位ID）或 'interviewer'（面试官ID）
+    dimension = db.Column(db.String(16), nullable=False)
+    dimension_id = db.Column(db.Integer, nullable=False)
+
+    # 已完成评价数 / 通过数
+    evaluated_count = db.Column(db.Integer, nullable=False, default=0)
+    passed_count = db.Column(db.Integer, nullable=False, default=0)
+
+    # 得分百分比的和与平方和（用于均值和标准差）
+    score_sum = db.Column(db.Float, nullable=False, default=0.0)
+    score_sq_sum = db.Column(db.Float, nullable=False, default=0.0)
+
+    # 得分百分比直方图，长度为 SCORE_BUCKETS 的计数列表
+    score_histogram = db.Column(db.JSON, nullable=True)
+
+    # 答题用时（completed_at - started_at）之和与样本数
+    duration_sum = db.Column(db.Float, nullable=False, default=0.0)
+    duration_count = db.Column(db.Integer, nullable=False, default=0)
+
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    def to_dict(self):
+        count = self.evaluated_count or 0
+        mean = self.score_sum / count if count else None
+        variance = max(self.score_sq_sum / count - mean * mean, 0.0) if count else None
+        return {
+            "dimension": self.dimension,
+            "dimension_id": self.dimension_id,
+            "evaluated_count": count,
+            "passed_count": self.passed_count,
+            "pass_rate": round(self.passed_count / count, 4) if count else None,
+            "avg_score": round(mean, 2) if count else None,
+            "score_stddev": round(variance**0.5, 2) if count else None,
+            "score_histogram": self.score_histogram or [0] * SCORE_BUCKETS,
+            "avg_duration_seconds": (
+                round(self.duration_sum / self.duration_count, 1)
+                if self.duration_count
+                else None
+            ),
+            "updated_at": self.updated_at,
+        }
@@ -1,10 +1,35 @@
 from extensions import db
+from utils.serialization import compile_serializer
 from datetime import datetime
+from operator import methodcaller
 from sqlalchemy.dialects.postgresql import JSON
 
 
 class Interview(db.Model):
     __tablename__ = "interviews"
+    __table_args__ = (
+        db.Index(
+            "ix_interviews_interviewer_status_created",
+            "interviewer_id",
+            "status",
+            "created_at",
+            "id",
+        ),
+        db.Index(
+            "ix_interviews_interviewee_status_created",
+            "interviewee_id",
+            "status",
+            "created_at",
+            "id",
+        ),
+        db.Index("ix_interviews_job_requirement", "job_requirement_id", "id"),
+        db.Index(
+            "uq_interviews_template_interviewee",
+            "template_id",
+            "interviewee_id",
+            unique=True,
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
@@ -21,6 +46,11 @@ class Interview(db.Model):
     # 面试者ID（可以为空，表示还未分配面试者）
     interviewee_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
 
+    # 来源模板ID（由模板分发创建时填写）
+    template_id = db.Column(
+        db.Integer, db.ForeignKey("interview_templates.id"), nullable=True
+    )
+
     # 面试状态: 'draft', 'assigned', 'in_progress', 'completed', 'evaluated'
     status = db.Column(db.String(32), nullable=False, default="draft")
 
@@ -51,44 +81,36 @@ class Interview(db.Model):
     )
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "job_requirement_id": self.job_requirement_id,
-            "interviewer_id": self.interviewer_id,
-            "interviewee_id": self.interviewee_id,
-            "status": self.status,
-            "question_count": self.question_count,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": (
-                self.completed_at.isoformat() if self.completed_at else None
-            ),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            # 包含关联数据
-            "job_requirement": (
-                self.job_requirement.to_dict() if self.job_requirement else None
-            ),
-            "interviewer": self.interviewer.to_dict() if self.interviewer else None,
-            "interviewee": self.interviewee.to_dict() if self.interviewee else None,
-        }
+        return _serialize(self)
 
     def to_simple_dict(self):
         """简化版本，不包含关联数据，避免循环引用"""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "job_requirement_id": self.job_requirement_id,
-            "interviewer_id": self.interviewer_id,
-            "interviewee_id": self.interviewee_id,
-            "status": self.status,
-            "question_count": self.question_count,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": (
-                self.completed_at.isoformat() if self.completed_at else None
-            ),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        return _serialize_simple(self)
+
+
+_SIMPLE_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "job_requirement_id",
+    "interviewer_id",
+    "interviewee_id",
+    "status",
+    "question_count",
+    "started_at",
+    "completed_at",
+    "created_at",
+    "updated_at",
+)
+
+_serialize_simple = compile_serializer(_SIMPLE_FIELDS)
+
+# 包含关联数据
+_serialize = compile_serializer(
+    _SIMPLE_FIELDS,
+    nested={
+        "job_requirement": methodcaller("to_dict"),
+        "interviewer": methodcaller("to_dict"),
+        "interviewee": methodcaller("to_dict"),
+    },
+)
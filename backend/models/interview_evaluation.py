@@ -1,9 +1,14 @@
 from extensions import db
+from utils.serialization import compile_serializer
 from datetime import datetime
+from operator import methodcaller
 
 
 class InterviewEvaluation(db.Model):
     __tablename__ = "interview_evaluations"
+    __table_args__ = (
+        db.Index("ix_interview_evaluations_interview_id", "interview_id", unique=True),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
@@ -53,29 +58,32 @@ class InterviewEvaluation(db.Model):
     evaluator = db.relationship("User", backref="evaluations")
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "interview_id": self.interview_id,
-            "evaluator_id": self.evaluator_id,
-            "total_score": self.total_score,
-            "max_score": self.max_score,
-            "overall_comments": self.overall_comments,
-            "skill_ratings": self.skill_ratings,
-            "recommendations": self.recommendations,
-            "is_passed": self.is_passed,
-            "is_finalized": self.is_finalized,
-            "decision_reason": self.decision_reason,
-            "evaluated_at": (
-                self.evaluated_at.isoformat() if self.evaluated_at else None
-            ),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            # 包含评价者信息
-            "evaluator": self.evaluator.to_dict() if self.evaluator else None,
-        }
+        return _serialize(self)
 
     def calculate_percentage(self):
         """计算得分百分比"""
         if self.max_score <= 0:
             return 0
         return round((self.total_score / self.max_score) * 100, 2)
+
+
+_serialize = compile_serializer(
+    (
+        "id",
+        "interview_id",
+        "evaluator_id",
+        "total_score",
+        "max_score",
+        "overall_comments",
+        "skill_ratings",
+        "recommendations",
+        "is_passed",
+        "is_finalized",
+        "decision_reason",
+        "evaluated_at",
+        "created_at",
+        "updated_at",
+    ),
+    # 包含评价者信息
+    nested={"evaluator": methodcaller("to_dict")},
+)
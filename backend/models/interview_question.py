@@ -1,26 +1,27 @@
 from extensions import db
+from utils.serialization import compile_serializer
 from datetime import datetime
 
+QUESTION_TYPES = ("single_choice", "multiple_choice", "text", "code")
+
 
 class InterviewQuestion(db.Model):
     __tablename__ = "interview_questions"
+    __table_args__ = (
+        db.Index(
+            "ix_interview_questions_interview_order", "interview_id", "order_index"
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
     # 关联的面试ID
     interview_id = db.Column(db.Integer, db.ForeignKey("interviews.id"), nullable=False)
 
-    # 题目内容
-    question_text = db.Column(db.Text, nullable=False)
-
-    # 题目类型: 'single_choice', 'multiple_choice', 'text', 'code'
-    question_type = db.Column(db.String(32), nullable=False, default="text")
-
-    # 选择题选项（JSON格式存储）
-    options = db.Column(db.JSON, nullable=True)
-
-    # 标准答案或参考答案
-    reference_answer = db.Column(db.Text, nullable=True)
+    # 题库条目ID（题目内容、类型、选项和参考答案存放在 question_bank 中共享）
+    bank_question_id = db.Column(
+        db.Integer, db.ForeignKey("question_bank.id"), nullable=False, index=True
+    )
 
     # 题目分值
     score = db.Column(db.Integer, default=10)
@@ -37,6 +38,14 @@ class InterviewQuestion(db.Model):
     # 面试官评语
     comments = db.Column(db.Text, nullable=True)
 
+    # 面试官是否人工评过分（人工评分不会被选择题重新评分覆盖）
+    manually_scored = db.Column(
+        db.Boolean, nullable=False, default=False, server_default=db.false()
+    )
+
+    # 文本/代码题与参考答案的相似度特征（后台预评分写入，供评价参考）
+    similarity = db.Column(db.JSON, nullable=True)
+
     # 创建时间
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
@@ -47,33 +56,63 @@ class InterviewQuestion(db.Model):
 
     # 关联关系
     interview = db.relationship("Interview", backref="questions")
+    bank_question = db.relationship("BankQuestion", lazy="joined", innerjoin=True)
+
+    # 题目内容从题库条目读取，保持原有的序列化字段不变
+    @property
+    def question_text(self):
+        return self.bank_question.question_text
+
+    @property
+    def question_type(self):
+        return self.bank_question.question_type
+
+    @property
+    def options(self):
+        return self.bank_question.options
+
+    @property
+    def reference_answer(self):
+        return self.bank_question.reference_answer
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "interview_id": self.interview_id,
-            "question_text": self.question_text,
-            "question_type": self.question_type,
-            "options": self.options,
-            "reference_answer": self.reference_answer,
-            "score": self.score,
-            "order_index": self.order_index,
-            "candidate_answer": self.candidate_answer,
-            "actual_score": self.actual_score,
-            "comments": self.comments,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        return _serialize(self)
 
     def to_candidate_dict(self):
         """面试者视角的数据，不包含参考答案和评分"""
-        return {
-            "id": self.id,
-            "interview_id": self.interview_id,
-            "question_text": self.question_text,
-            "question_type": self.question_type,
-            "options": self.options,
-            "score": self.score,
-            "order_index": self.order_index,
-            "candidate_answer": self.candidate_answer,
-        }
+        return _serialize_candidate(self)
+
+
+_serialize = compile_serializer(
+    (
+        "id",
+        "interview_id",
+        "bank_question_id",
+        "question_text",
+        "question_type",
+        "options",
+        "reference_answer",
+        "score",
+        "order_index",
+        "candidate_answer",
+        "actual_score",
+        "manually_scored",
+        "comments",
+        "similarity",
+        "created_at",
+        "updated_at",
+    )
+)
+
+_serialize_candidate = compile_serializer(
+    (
+        "id",
+        "interview_id",
+        "question_text",
+        "question_type",
+        "options",
+        "score",
+        "order_index",
+        "candidate_answer",
+    )
+)
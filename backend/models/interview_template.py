@@ -0,0 +1,114 @@
+from extensions import db
+from utils.serialization import compile_serializer
+from datetime import datetime
+
+
+class InterviewTemplate(db.Model):
+    """可复用的面试模板，一次分发给多名面试者"""
+
+    __tablename__ = "interview_templates"
+
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(255), nullable=False)
+    description = db.Column(db.Text, nullable=True)
+
+    # 关联的岗位ID
+    job_requirement_id = db.Column(
+        db.Integer, db.ForeignKey("job_requirements.id"), nullable=False
+    )
+
+    # 创建者（面试官）
+    created_by = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    questions = db.relationship(
+        "TemplateQuestion",
+        backref="template",
+        order_by="TemplateQuestion.order_index",
+        cascade="all, delete-orphan",
+    )
+
+    def to_dict(self):
+        return _serialize(self)
+
+    def to_detail_dict(self):
+        """包含题目列表"""
+        return _serialize_detail(self)
+
+
+class TemplateQuestion(db.Model):
+    __tablename__ = "interview_template_questions"
+    __table_args__ = (
+        db.Index(
+            "ix_interview_template_questions_template_order",
+            "template_id",
+            "order_index",
+        ),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    template_id = db.Column(
+        db.Integer, db.ForeignKey("interview_templates.id"), nullable=False
+    )
+    bank_question_id = db.Column(
+        db.Integer, db.ForeignKey("question_bank.id"), nullable=False
+    )
+    score = db.Column(db.Integer, default=10)
+    order_index = db.Column(db.Integer, default=0)
+
+    bank_question = db.relationship("BankQuestion", lazy="joined", innerjoin=True)
+
+    @property
+    def question_text(self):
+        return self.bank_question.question_text
+
+    @property
+    def question_type(self):
+        return self.bank_question.question_type
+
+    @property
+    def options(self):
+        return self.bank_question.options
+
+    @property
+    def reference_answer(self):
+        return self.bank_question.reference_answer
+
+    def to_dict(self):
+        return _serialize_question(self)
+
+
+_serialize_question = compile_serializer(
+    (
+        "id",
+        "template_id",
+        "bank_question_id",
+        "question_text",
+        "question_type",
+        "options",
+        "reference_answer",
+        "score",
+        "order_index",
+    )
+)
+
+_TEMPLATE_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "job_requirement_id",
+    "created_by",
+    "created_at",
+    "updated_at",
+)
+
+_serialize = compile_serializer(_TEMPLATE_FIELDS)
+
+_serialize_detail = compile_serializer(
+    _TEMPLATE_FIELDS,
+    nested={"questions": lambda questions: [q.to_dict() for q in questions]},
+)
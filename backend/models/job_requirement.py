@@ -1,4 +1,5 @@
 from extensions import db
+from utils.serialization import compile_serializer
 from datetime import datetime
 from sqlalchemy.dialects.postgresql import JSON
 
@@ -10,12 +11,14 @@ class JobRequirement(db.Model):
     description = db.Column(db.Text, nullable=True)
     skills = db.Column(JSON, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "job_title": self.job_title,
-            "description": self.description,
-            "skills": self.skills,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
+        return _serialize(self)
+
+
+_serialize = compile_serializer(
+    ("id", "job_title", "description", "skills", "created_at", "updated_at")
+)
@@ -0,0 +1,64 @@
+import hashlib
+import json
+from extensions import db
+from utils.serialization import compile_serializer
+from datetime import datetime
+
+
+def question_hash(question_text, question_type, options, reference_answer):
+    """题目内容的 SHA-256 摘要，相同内容的题目共用一个题库条目
+
+    options 按 JSON 规范化（键排序、紧凑分隔符）后参与计算，分值不参与（分值属于具体面试）。
+    """
+    canonical = json.dumps(
+        [question_text, question_type, options, reference_answer],
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class BankQuestion(db.Model):
+    """题库：题目内容按内容哈希去重存储一次，面试题目通过 bank_question_id 引用"""
+
+    __tablename__ = "question_bank"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    # 题目内容的 SHA-256（question_hash）
+    content_hash = db.Column(db.String(64), nullable=False, unique=True)
+
+    # 题目内容
+    question_text = db.Column(db.Text, nullable=False)
+
+    # 题目类型: 'single_choice', 'multiple_choice', 'text', 'code'
+    question_type = db.Column(db.String(32), nullable=False, default="text")
+
+    # 选择题选项（JSON格式存储）
+    options = db.Column(db.JSON, nullable=True)
+
+    # 标准答案或参考答案
+    reference_answer = db.Column(db.Text, nullable=True)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    def to_dict(self):
+        return _serialize(self)
+
+
+_serialize = compile_serializer(
+    (
+        "id",
+        "content_hash",
+        "question_text",
+        "question_type",
+        "options",
+        "reference_answer",
+        "created_at",
+        "updated_at",
+    )
+)
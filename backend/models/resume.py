@@ -1,5 +1,7 @@
 from extensions import db
+from utils.serialization import compile_serializer
 from datetime import datetime
+from operator import methodcaller
 
 
 class Resume(db.Model):
@@ -15,6 +17,9 @@ class Resume(db.Model):
     # 简历内容（纯文本形式）
     content = db.Column(db.Text, nullable=False)
 
+    # 全文检索词（应用层分词结果，Postgres 上由生成列 search_vector 建 GIN 索引）
+    search_tokens = db.Column(db.Text, nullable=True)
+
     # 创建时间
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
@@ -27,21 +32,17 @@ class Resume(db.Model):
     user = db.relationship("User", backref=db.backref("resume", uselist=False))
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "content": self.content,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "user": self.user.to_dict() if self.user else None,
-        }
+        return _serialize(self)
 
     def to_simple_dict(self):
         """简化版本，不包含用户信息"""
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "content": self.content,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        return _serialize_simple(self)
+
+
+_SIMPLE_FIELDS = ("id", "user_id", "content", "created_at", "updated_at")
+
+_serialize_simple = compile_serializer(_SIMPLE_FIELDS)
+
+_serialize = compile_serializer(
+    _SIMPLE_FIELDS, nested={"user": methodcaller("to_dict")}
+)
@@ -1,9 +1,32 @@
 from extensions import db
+from sqlalchemy.orm import validates
+from utils.serialization import compile_serializer
 from datetime import datetime
 
 
+def normalize_email(email):
+    """邮箱统一去空白并转小写后再保存和查重，所有写入路径共用"""
+    return (email or "").strip().lower()
+
+
 class User(db.Model):
     __tablename__ = "users"
+    __table_args__ = (
+        db.Index("ix_users_role_created", "role", "created_at", "id"),
+        # 用户名/邮箱子串搜索（Postgres pg_trgm）
+        db.Index(
+            "ix_users_username_trgm",
+            "username",
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+        ),
+        db.Index(
+            "ix_users_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
@@ -12,10 +35,18 @@ class User(db.Model):
     role = db.Column(db.String(32), nullable=False, default="interviewee")
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    @validates("email")
+    def _normalize_email(self, key, email):
+        return normalize_email(email)
+
     def to_dict(self):
-        return {
-            "id": self.id,
-            "username": self.username,
-            "email": self.email,
-            "role": self.role,
-        }
+        return _serialize(self)
+
+    def to_admin_dict(self):
+        """用户管理视角，额外包含创建时间"""
+        return _serialize_admin(self)
+
+
+_serialize = compile_serializer(("id", "username", "email", "role"))
+
+_serialize_admin = compile_serializer(("id", "username", "email", "role", "created_at"))
@@ -0,0 +1,40 @@
+from flask_restx import Namespace, Resource
+from flask_jwt_extended import jwt_required
+from services.analytics_service import job_analytics, interviewer_analytics
+from utils.identity import current_identity
+from utils.roles import roles_required
+
+ns = Namespace("analytics", description="招聘数据统计")
+
+
+@ns.route("/jobs")
+class JobAnalytics(Resource):
+    @jwt_required()
+    @roles_required("interviewer", "admin")
+    def get(self):
+        """各岗位的通过率、得分分布和答题用时"""
+        return {"data": job_analytics()}, 200
+
+
+@ns.route("/jobs/<int:job_id>")
+class JobAnalyticsItem(Resource):
+    @jwt_required()
+    @roles_required("interviewer", "admin")
+    def get(self, job_id):
+        """单个岗位的招聘指标"""
+        items = job_analytics(job_id)
+        if not items:
+            return {"message": "该岗位暂无已完成的评价"}, 404
+        return {"data": items[0]}, 200
+
+
+@ns.route("/interviewers")
+class InterviewerAnalytics(Resource):
+    @jwt_required()
+    @roles_required("interviewer", "admin")
+    def get(self):
+        """各面试官的招聘指标（面试官只能看到自己的数据）"""
+        identity = current_identity()
+        if identity.role == "admin":
+            return {"data": interviewer_analytics()}, 200
+        return {"data": interviewer_analytics(identity.id)}, 200
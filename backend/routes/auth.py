@@ -1,10 +1,11 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
 from extensions import db
-from models.user import User
 from services.user_service import create_user, authenticate_user
+from utils.security import HashingBusy
 from flask_jwt_extended import create_access_token
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from utils.identity import load_user_info
 
 ns = Namespace("auth", description="用户认证")
 
@@ -49,6 +50,8 @@ class Register(Resource):
             )
         except ValueError as e:
             return {"message": str(e)}, 400
+        except HashingBusy:
+            return {"message": "服务繁忙，请稍后重试"}, 503
 
         return {"message": "user created", "user": user.to_dict()}, 201
 
@@ -58,11 +61,17 @@ class Login(Resource):
     @ns.expect(login_model)
     def post(self):
         data = request.json
-        user = authenticate_user(data["username"], data["password"])
+        try:
+            user = authenticate_user(data["username"], data["password"])
+        except HashingBusy:
+            return {"message": "服务繁忙，请稍后重试"}, 503
         if not user:
             # return a uniform message for any authentication failure
             return {"message": "用户名密码错误"}, 401
-        access_token = create_access_token(identity=str(user.id))
+        # the role claim is informational for clients; roles_required re-checks it
+        access_token = create_access_token(
+            identity=str(user.id), additional_claims={"role": user.role}
+        )
         return {"access_token": access_token, "user": user.to_dict()}, 200
 
 
@@ -71,8 +80,8 @@ class Me(Resource):
     @jwt_required()
     def get(self):
         user_id = int(get_jwt_identity())
-        # lightweight user info
-        user = User.query.get(user_id)
+        # lightweight user info (served from the user cache when enabled)
+        user = load_user_info(user_id)
         if not user:
             return {"message": "not found"}, 404
-        return user.to_dict()
+        return user
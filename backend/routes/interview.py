@@ -2,8 +2,10 @@ from flask import request, jsonify
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from services.interview_service import InterviewService
-from models.user import User
 from utils.roles import roles_required
+from utils.identity import current_identity
+from utils.pagination import parse_limit
+from utils.conditional import weak_etag, cache_headers, not_modified
 
 ns = Namespace("interviews", description="面试管理相关接口")
 
@@ -34,6 +36,15 @@ question_model = ns.model(
     },
 )
 
+bulk_question_model = ns.model(
+    "BulkQuestions",
+    {
+        "questions": fields.List(
+            fields.Nested(question_model), required=True, description="题目列表"
+        ),
+    },
+)
+
 evaluation_model = ns.model(
     "Evaluation",
     {
@@ -56,14 +67,31 @@ class InterviewList(Resource):
         """获取面试列表"""
         current_user_id = int(get_jwt_identity())  # 转换为整数
         status = request.args.get("status")
+        try:
+            limit = parse_limit(request.args.get("limit"))
+        except ValueError:
+            return {"message": "limit 必须为正整数"}, 400
+        cursor = request.args.get("cursor")
+
+        version = InterviewService.interviews_version(
+            interviewer_id=current_user_id, status=status
+        )
+        etag = weak_etag(*version, limit, cursor)
+        cached = not_modified(etag, version[0])
+        if cached:
+            return cached
 
-        interviews, error = InterviewService.get_interviews_by_interviewer(
-            current_user_id, status
+        page, error = InterviewService.get_interviews_by_interviewer(
+            current_user_id, status, limit, cursor
         )
         if error:
             return {"message": error}, 400
 
-        return {"data": interviews}, 200
+        return (
+            {"data": page["items"], "next_cursor": page["next_cursor"]},
+            200,
+            cache_headers(etag, version[0]),
+        )
 
     @jwt_required()
     @roles_required("interviewer", "admin")
@@ -91,12 +119,13 @@ class InterviewDetail(Resource):
         """获取面试详情"""
         current_user_id = int(get_jwt_identity())  # 转换为整数
 
-        interview, error = InterviewService.get_interview_by_id(interview_id)
-        if error:
-            return {"message": error}, 404
+        # 先用一条轻量查询拿到权限字段和版本，304 时不加载和序列化面试详情
+        interview = InterviewService.interview_version(interview_id)
+        if not interview:
+            return {"message": "面试不存在"}, 404
 
         # 检查权限：面试官、面试者或管理员
-        current_user = User.query.get(current_user_id)
+        current_user = current_identity()
 
         # 调试信息
         print(f"权限检查 - 当前用户ID: {current_user_id}, 角色: {current_user.role}")
@@ -117,7 +146,17 @@ class InterviewDetail(Resource):
         else:
             return {"message": "无权限访问此面试"}, 403
 
-        return {"data": interview}, 200
+        etag = weak_etag(*interview["version"])
+        last_modified = interview["updated_at"]
+        cached = not_modified(etag, last_modified)
+        if cached:
+            return cached
+
+        data, error = InterviewService.get_interview_by_id(interview_id)
+        if error:
+            return {"message": error}, 404
+
+        return {"data": data}, 200, cache_headers(etag, last_modified)
 
     @jwt_required()
     @roles_required("interviewer", "admin")
@@ -132,7 +171,7 @@ class InterviewDetail(Resource):
         if error:
             return {"message": error}, 404
 
-        current_user = User.query.get(current_user_id)
+        current_user = current_identity()
         if (
             current_user.role != "admin"
             and interview["interviewer_id"] != current_user_id
@@ -156,7 +195,7 @@ class InterviewDetail(Resource):
         if error:
             return {"message": error}, 404
 
-        current_user = User.query.get(current_user_id)
+        current_user = current_identity()
 
         # 调试信息
         print(
@@ -177,6 +216,44 @@ class InterviewDetail(Resource):
         return {"message": "面试删除成功"}, 200
 
 
+@ns.route("/<int:interview_id>/full")
+class InterviewFull(Resource):
+    @jwt_required()
+    @roles_required("interviewer", "interviewee", "admin")
+    def get(self, interview_id):
+        """一次获取面试详情、题目、评价和简历"""
+        current_user_id = int(get_jwt_identity())
+        current_user = current_identity()
+
+        # 一条聚合查询拿到权限字段和各部分的更新时间
+        interview = InterviewService.interview_full_version(interview_id)
+        if not interview:
+            return {"message": "面试不存在"}, 404
+
+        # 检查权限：与面试详情接口一致
+        if current_user.role == "admin":
+            pass
+        elif interview["interviewer_id"] == current_user_id:
+            pass
+        elif interview["interviewee_id"] == current_user_id:
+            if interview["status"] == "draft":
+                return {"message": "该面试尚未派发，暂时无法查看"}, 403
+        else:
+            return {"message": "无权限访问此面试"}, 403
+
+        for_candidate = current_user.role == "interviewee"
+        etag = weak_etag(*interview["version"], for_candidate)
+        cached = not_modified(etag)
+        if cached:
+            return cached
+
+        data, error = InterviewService.get_interview_full(interview_id, for_candidate)
+        if error:
+            return {"message": error}, 404
+
+        return {"data": data}, 200, cache_headers(etag)
+
+
 @ns.route("/<int:interview_id>/assign")
 class InterviewAssign(Resource):
     @jwt_required()
@@ -195,7 +272,7 @@ class InterviewAssign(Resource):
         if error:
             return {"message": error}, 404
 
-        current_user = User.query.get(current_user_id)
+        current_user = current_identity()
         if (
             current_user.role != "admin"
             and interview["interviewer_id"] != current_user_id
@@ -224,7 +301,7 @@ class InterviewQuestions(Resource):
         if error:
             return {"message": error}, 404
 
-        current_user = User.query.get(current_user_id)
+        current_user = current_identity()
         if (
             current_user.role != "admin"
             and interview["interviewer_id"] != current_user_id
@@ -234,13 +311,20 @@ class InterviewQuestions(Resource):
 
         # 面试者只能看到适合的题目内容
         for_candidate = current_user.role == "interviewee"
+
+        version = InterviewService.questions_version(interview_id)
+        etag = weak_etag(*version, for_candidate)
+        cached = not_modified(etag, version[0])
+        if cached:
+            return cached
+
         questions, error = InterviewService.get_interview_questions(
             interview_id, for_candidate
         )
         if error:
             return {"message": error}, 400
 
-        return {"data": questions}, 200
+        return {"data": questions}, 200, cache_headers(etag, version[0])
 
     @jwt_required()
     @roles_required("interviewer", "admin")
@@ -255,7 +339,7 @@ class InterviewQuestions(Resource):
         if error:
             return {"message": error}, 404
 
-        current_user = User.query.get(current_user_id)
+        current_user = current_identity()
         if (
             current_user.role != "admin"
             and interview["interviewer_id"] != current_user_id
@@ -269,6 +353,37 @@ class InterviewQuestions(Resource):
         return {"data": question, "message": "题目添加成功"}, 201
 
 
+@ns.route("/<int:interview_id>/questions/bulk")
+class InterviewQuestionsBulk(Resource):
+    @jwt_required()
+    @roles_required("interviewer", "admin")
+    @ns.expect(bulk_question_model)
+    def post(self, interview_id):
+        """批量添加面试题目（全部成功或全部失败）"""
+        current_user_id = int(get_jwt_identity())
+        data = request.get_json() or {}
+
+        # 检查权限
+        interview, error = InterviewService.get_interview_by_id(interview_id)
+        if error:
+            return {"message": error}, 404
+
+        current_user = current_identity()
+        if (
+            current_user.role != "admin"
+            and interview["interviewer_id"] != current_user_id
+        ):
+            return {"message": "无权限添加题目"}, 403
+
+        questions, error = InterviewService.add_questions_bulk(
+            interview_id, data.get("questions")
+        )
+        if error:
+            return {"message": error}, 400
+
+        return {"data": questions, "message": f"成功添加 {len(questions)} 道题目"}, 201
+
+
 @ns.route("/questions/<int:question_id>")
 class QuestionDetail(Resource):
     @jwt_required()
@@ -321,7 +436,7 @@ class QuestionAnswer(Resource):
             return {"message": "面试不存在"}, 404
 
         # 检查权限
-        current_user = User.query.get(current_user_id)
+        current_user = current_identity()
         if current_user.role != "admin" and interview.interviewee_id != current_user_id:
             return {"message": "无权限提交此题目答案"}, 403
 
@@ -336,6 +451,27 @@ class QuestionAnswer(Resource):
         return {"data": question, "message": "答案提交成功"}, 200
 
 
+@ns.route("/<int:interview_id>/answers")
+class InterviewAnswers(Resource):
+    @jwt_required()
+    @roles_required("interviewee", "admin")
+    def post(self, interview_id):
+        """批量提交答案，body: {"answers": {question_id: answer}}"""
+        current_user_id = int(get_jwt_identity())
+        data = request.get_json() or {}
+
+        result, error = InterviewService.submit_answers(
+            interview_id,
+            current_user_id,
+            data.get("answers"),
+            is_admin=current_identity().role == "admin",
+        )
+        if error:
+            return {"message": error}, 400
+
+        return {"data": result, "message": "答案保存成功"}, 200
+
+
 @ns.route("/questions/<int:question_id>/score")
 class QuestionScore(Resource):
     @jwt_required()
@@ -369,7 +505,7 @@ class InterviewEvaluations(Resource):
         if error:
             return {"message": error}, 404
 
-        current_user = User.query.get(current_user_id)
+        current_user = current_identity()
         if (
             current_user.role != "admin"
             and interview["interviewer_id"] != current_user_id
@@ -377,11 +513,17 @@ class InterviewEvaluations(Resource):
         ):
             return {"message": "无权限查看此面试评价"}, 403
 
+        version = InterviewService.evaluation_version(interview_id)
+        etag = weak_etag(*version)
+        cached = not_modified(etag, version[0])
+        if cached:
+            return cached
+
         evaluation, error = InterviewService.get_evaluation(interview_id)
         if error:
             return {"message": error}, 404
 
-        return {"data": evaluation}, 200
+        return {"data": evaluation}, 200, cache_headers(etag, version[0])
 
     @jwt_required()
     @roles_required("interviewer", "admin")
@@ -396,7 +538,7 @@ class InterviewEvaluations(Resource):
         if error:
             return {"message": error}, 404
 
-        current_user = User.query.get(current_user_id)
+        current_user = current_identity()
         if (
             current_user.role != "admin"
             and interview["interviewer_id"] != current_user_id
@@ -437,14 +579,31 @@ class MyInterviews(Resource):
         """获取我的面试列表"""
         current_user_id = int(get_jwt_identity())
         status = request.args.get("status")
+        try:
+            limit = parse_limit(request.args.get("limit"))
+        except ValueError:
+            return {"message": "limit 必须为正整数"}, 400
+        cursor = request.args.get("cursor")
+
+        version = InterviewService.interviews_version(
+            interviewee_id=current_user_id, status=status
+        )
+        etag = weak_etag(*version, limit, cursor)
+        cached = not_modified(etag, version[0])
+        if cached:
+            return cached
 
-        interviews, error = InterviewService.get_interviews_by_interviewee(
-            current_user_id, status
+        page, error = InterviewService.get_interviews_by_interviewee(
+            current_user_id, status, limit, cursor
         )
         if error:
             return {"message": error}, 400
 
-        return {"data": interviews}, 200
+        return (
+            {"data": page["items"], "next_cursor": page["next_cursor"]},
+            200,
+            cache_headers(etag, version[0]),
+        )
 
 
 @ns.route("/<int:interview_id>/start")
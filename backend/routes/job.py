@@ -1,7 +1,19 @@
-from flask import request
-from flask_restx import Namespace, Resource, fields
-from services.job_service import create_job, get_job, list_jobs, update_job, delete_job
-from flask_jwt_extended import jwt_required
+from flask import Response, request, stream_with_context
+from flask_restx import Namespace, Resource, fields, marshal
+from services.job_service import (
+    create_job,
+    get_job,
+    list_jobs,
+    update_job,
+    delete_job,
+    jobs_version,
+)
+from services.matching_service import candidates_for_job, jobs_for_candidate
+from services.analytics_service import job_leaderboard
+from services.export_service import EXPORT_HEADER, iter_job_export
+from utils.export import XLSX_MIMETYPE, iter_csv, iter_xlsx, xlsx_available
+from utils.conditional import weak_etag, cache_headers, not_modified
+from flask_jwt_extended import jwt_required, get_jwt_identity
 from utils.roles import roles_required
 
 ns = Namespace("jobs", description="岗位管理")
@@ -14,15 +26,20 @@ job_model = ns.model(
         "description": fields.String(required=False),
         "skills": fields.List(fields.String, required=False),
         "created_at": fields.String(description="创建时间"),
+        "updated_at": fields.String(description="更新时间"),
     },
 )
 
 
 @ns.route("/")
 class JobList(Resource):
-    @ns.marshal_list_with(job_model)
+    @ns.response(200, "Success", [job_model])
     def get(self):
-        return list_jobs()
+        etag = weak_etag(*jobs_version())
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        return marshal(list_jobs(), job_model), 200, cache_headers(etag)
 
     @ns.expect(job_model)
     @jwt_required()  # 临时改为只需要登录，不限制角色
@@ -38,7 +55,11 @@ class JobItem(Resource):
         job = get_job(job_id)
         if not job:
             ns.abort(404)
-        return job.to_dict()
+        etag = weak_etag(job["id"], job["updated_at"])
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        return job, 200, cache_headers(etag)
 
     @ns.expect(job_model)
     @jwt_required()  # 临时改为只需要登录，不限制角色
@@ -53,3 +74,107 @@ class JobItem(Resource):
     def delete(self, job_id):
         delete_job(job_id)
         return {"message": "deleted"}
+
+
+def _parse_top(default):
+    try:
+        return min(max(int(request.args.get("top", default)), 1), 200)
+    except ValueError:
+        ns.abort(400, "无效的 top 参数")
+
+
+@ns.route("/<int:job_id>/candidates")
+class JobCandidates(Resource):
+    @ns.doc(params={"top": "返回的候选人数量，默认 50"})
+    @jwt_required()
+    @roles_required("interviewer", "admin")
+    def get(self, job_id):
+        """按简历与岗位技能的匹配度排序候选人"""
+        items, error = candidates_for_job(job_id, _parse_top(50))
+        if error:
+            return {"message": error}, 404
+        return {"data": items}, 200
+
+
+@ns.route("/recommended")
+class RecommendedJobs(Resource):
+    @ns.doc(params={"top": "返回的岗位数量，默认 10"})
+    @jwt_required()
+    @roles_required("interviewee")
+    def get(self):
+        """根据当前面试者的简历推荐岗位"""
+        items, error = jobs_for_candidate(int(get_jwt_identity()), _parse_top(10))
+        if error:
+            return {"message": error}, 404
+        return {"data": items}, 200
+
+
+def _parse_flag(name):
+    value = request.args.get(name)
+    if value in (None, ""):
+        return None
+    if value.lower() in ("true", "1"):
+        return True
+    if value.lower() in ("false", "0"):
+        return False
+    ns.abort(400, f"无效的 {name} 参数")
+
+
+@ns.route("/<int:job_id>/leaderboard")
+class JobLeaderboard(Resource):
+    @ns.doc(
+        params={
+            "page": "页码",
+            "per_page": "每页数量",
+            "is_passed": "按是否通过过滤",
+            "is_finalized": "按评价是否完成过滤",
+        }
+    )
+    @jwt_required()
+    @roles_required("interviewer", "admin")
+    def get(self, job_id):
+        """岗位候选人排行榜：得分百分比、排名和百分位"""
+        if not get_job(job_id):
+            return {"message": "岗位不存在"}, 404
+        try:
+            page = max(int(request.args.get("page", 1)), 1)
+            per_page = min(max(int(request.args.get("per_page", 20)), 1), 100)
+        except ValueError:
+            return {"message": "无效的分页参数"}, 400
+
+        items, total = job_leaderboard(
+            job_id,
+            page,
+            per_page,
+            is_passed=_parse_flag("is_passed"),
+            is_finalized=_parse_flag("is_finalized"),
+        )
+        return {"data": items, "total": total, "page": page, "per_page": per_page}, 200
+
+
+@ns.route("/<int:job_id>/export")
+class JobExport(Resource):
+    @ns.doc(params={"format": "csv（默认）或 xlsx"})
+    @jwt_required()
+    @roles_required("interviewer", "admin")
+    def get(self, job_id):
+        """导出岗位下所有面试的逐题得分和评价，流式输出"""
+        if not get_job(job_id):
+            return {"message": "岗位不存在"}, 404
+        fmt = request.args.get("format", "csv").lower()
+        rows = iter_job_export(job_id)
+        if fmt == "csv":
+            body, mimetype = iter_csv(EXPORT_HEADER, rows), "text/csv"
+        elif fmt == "xlsx":
+            if not xlsx_available():
+                return {"message": "服务器未安装 openpyxl，无法导出 xlsx"}, 400
+            body, mimetype = iter_xlsx(EXPORT_HEADER, rows), XLSX_MIMETYPE
+        else:
+            return {"message": "不支持的导出格式"}, 400
+
+        filename = f"job_{job_id}_interviews.{fmt}"
+        return Response(
+            stream_with_context(body),
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        )
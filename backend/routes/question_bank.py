@@ -0,0 +1,80 @@
+from flask import request
+from flask_restx import Namespace, Resource, fields
+from flask_jwt_extended import jwt_required
+from services.question_bank_service import QuestionBankService
+from utils.pagination import parse_limit
+from utils.roles import roles_required
+
+ns = Namespace("question-bank", description="题库相关接口")
+
+bank_question_model = ns.model(
+    "BankQuestion",
+    {
+        "question_text": fields.String(description="题目内容"),
+        "question_type": fields.String(
+            description="题目类型",
+            enum=["single_choice", "multiple_choice", "text", "code"],
+        ),
+        "options": fields.Raw(description="选择题选项(JSON)"),
+        "reference_answer": fields.String(description="参考答案"),
+    },
+)
+
+
+@ns.route("/")
+class BankQuestionList(Resource):
+    @ns.doc(
+        params={
+            "type": "题目类型",
+            "q": "题目内容关键字",
+            "limit": "每页数量",
+            "cursor": "分页游标",
+        }
+    )
+    @jwt_required()
+    @roles_required("interviewer", "admin")
+    def get(self):
+        """题库列表，附带每道题被面试引用的次数"""
+        try:
+            limit = parse_limit(request.args.get("limit"))
+        except ValueError:
+            return {"message": "limit 必须为正整数"}, 400
+        try:
+            data = QuestionBankService.get_bank_questions(
+                request.args.get("type"),
+                request.args.get("q"),
+                limit,
+                request.args.get("cursor"),
+            )
+        except ValueError:
+            return {"message": "无效的分页游标"}, 400
+        return {"data": data}, 200
+
+
+@ns.route("/<int:bank_question_id>")
+class BankQuestionDetail(Resource):
+    @jwt_required()
+    @roles_required("interviewer", "admin")
+    def get(self, bank_question_id):
+        """获取题库题目"""
+        question, error = QuestionBankService.get_bank_question(bank_question_id)
+        if error:
+            return {"message": error}, 404
+        return {"data": question}, 200
+
+    @ns.expect(bank_question_model)
+    @jwt_required()
+    @roles_required("admin")
+    def put(self, bank_question_id):
+        """集中修改题库题目，引用它的模板和未提交的面试立即生效
+
+        已有提交的面试引用该题时写入新条目并返回新条目，已提交面试的题目保持不变。
+        """
+        data = request.get_json() or {}
+        question, error = QuestionBankService.update_bank_question(
+            bank_question_id, data
+        )
+        if error:
+            status = 404 if error == "题库题目不存在" else 400
+            return {"message": error}, status
+        return {"message": "题目更新成功", "data": question}, 200
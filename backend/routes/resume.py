@@ -1,5 +1,6 @@
 from flask import request, jsonify
 from flask_restx import Namespace, Resource, fields
+from sqlalchemy.exc import TimeoutError as PoolTimeout
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from services.resume_service import ResumeService
 from models.user import User
@@ -42,6 +43,8 @@ class MyResumeResource(Resource):
                 return {"data": None, "message": "暂无简历"}, 200
 
             return {"data": resume.to_simple_dict(), "message": "获取简历成功"}, 200
+        except PoolTimeout:
+            raise
         except Exception as e:
             return {"message": f"获取简历失败: {str(e)}"}, 500
 
@@ -62,6 +65,8 @@ class MyResumeResource(Resource):
             return {"data": resume.to_simple_dict(), "message": "简历保存成功"}, 200
         except ValueError as e:
             return {"message": str(e)}, 400
+        except PoolTimeout:
+            raise
         except Exception as e:
             return {"message": f"保存简历失败: {str(e)}"}, 500
 
@@ -77,6 +82,8 @@ class MyResumeResource(Resource):
             return {"message": "简历删除成功"}, 200
         except ValueError as e:
             return {"message": str(e)}, 404
+        except PoolTimeout:
+            raise
         except Exception as e:
             return {"message": f"删除简历失败: {str(e)}"}, 500
 
@@ -94,5 +101,40 @@ class UserResumeResource(Resource):
                 return {"message": "简历不存在"}, 404
 
             return {"data": resume.to_simple_dict(), "message": "获取简历成功"}, 200
+        except PoolTimeout:
+            raise
         except Exception as e:
             return {"message": f"获取简历失败: {str(e)}"}, 500
+
+
+@ns.route("/search")
+class ResumeSearchResource(Resource):
+    @ns.doc(
+        "search_resumes", params={"q": "关键词", "page": "页码", "per_page": "每页数量"}
+    )
+    @jwt_required()
+    @roles_required("interviewer", "admin")
+    def get(self):
+        """全文检索简历（面试官和管理员可见），按相关度排序并返回高亮摘要"""
+        q = (request.args.get("q") or "").strip()
+        if not q:
+            return {"message": "请提供搜索关键词"}, 400
+        try:
+            page = max(int(request.args.get("page", 1)), 1)
+            per_page = min(max(int(request.args.get("per_page", 20)), 1), 100)
+        except ValueError:
+            return {"message": "无效的分页参数"}, 400
+
+        try:
+            items, total = ResumeService.search_resumes(q, page, per_page)
+            return {
+                "data": items,
+                "total": total,
+                "page": page,
+                "per_page": per_page,
+                "message": "搜索成功",
+            }, 200
+        except PoolTimeout:
+            raise
+        except Exception as e:
+            return {"message": f"搜索简历失败: {str(e)}"}, 500
@@ -0,0 +1,60 @@
+from flask import request
+from flask_restx import Namespace, Resource
+from flask_jwt_extended import jwt_required
+from extensions import cache, db
+from utils.db_pool import pool_stats
+from utils.db_routing import router
+from services.task_queue import execution_stats, queue_stats
+from utils.roles import roles_required
+
+ns = Namespace("system", description="运行状态")
+
+
+@ns.route("/db-pool")
+class DatabasePool(Resource):
+    @jwt_required()
+    @roles_required("admin")
+    def get(self):
+        """当前进程各数据库连接池的占用数、取连接等待时间分布和超时次数"""
+        return {"data": pool_stats(db.engines)}, 200
+
+
+@ns.route("/db-replicas")
+class DatabaseReplicas(Resource):
+    @jwt_required()
+    @roles_required("admin")
+    def get(self):
+        """只读副本的健康状态和最近一次检测到的延迟"""
+        return {"data": router.status()}, 200
+
+
+@ns.route("/tasks")
+class TaskQueue(Resource):
+    @ns.doc(params={"window": "执行统计的时间窗口（秒），默认 3600"})
+    @jwt_required()
+    @roles_required("admin")
+    def get(self):
+        """后台任务队列积压情况，以及最近窗口内所有 worker 的执行次数和耗时"""
+        try:
+            window = int(request.args.get("window", 3600))
+        except ValueError:
+            return {"message": "window 必须为整数"}, 400
+        if window <= 0:
+            return {"message": "window 必须为正整数"}, 400
+        return {
+            "data": {"queue": queue_stats(), "executed": execution_stats(window)}
+        }, 200
+
+
+@ns.route("/cache")
+class CacheStats(Resource):
+    @jwt_required()
+    @roles_required("admin")
+    def get(self):
+        """服务层读缓存的后端和命中率（仅统计处理本请求的进程）"""
+        return {
+            "data": {
+                "backend": type(cache.backend).__name__,
+                "namespaces": cache.stats(),
+            }
+        }, 200
@@ -0,0 +1,142 @@
+from flask import request, current_app
+from flask_restx import Namespace, Resource, fields
+from flask_jwt_extended import jwt_required
+from services.template_service import TemplateService
+from services.task_queue import enqueue
+from utils.identity import current_identity
+from utils.roles import roles_required
+
+ns = Namespace("templates", description="面试模板相关接口")
+
+template_question_model = ns.model(
+    "TemplateQuestion",
+    {
+        "question_text": fields.String(required=True, description="题目内容"),
+        "question_type": fields.String(
+            description="题目类型",
+            enum=["single_choice", "multiple_choice", "text", "code"],
+            default="text",
+        ),
+        "options": fields.Raw(description="选择题选项(JSON)"),
+        "reference_answer": fields.String(description="参考答案"),
+        "score": fields.Integer(description="分值", default=10),
+    },
+)
+
+template_model = ns.model(
+    "InterviewTemplate",
+    {
+        "title": fields.String(required=True, description="模板标题"),
+        "description": fields.String(description="模板描述"),
+        "job_requirement_id": fields.Integer(required=True, description="岗位需求ID"),
+        "questions": fields.List(
+            fields.Nested(template_question_model),
+            required=True,
+            description="题目列表",
+        ),
+    },
+)
+
+fanout_model = ns.model(
+    "TemplateFanOut",
+    {
+        "interviewee_ids": fields.List(
+            fields.Integer, required=True, description="面试者ID列表"
+        ),
+    },
+)
+
+
+def _get_owned_template(template_id):
+    """获取模板并检查权限：面试官只能操作自己创建的模板"""
+    template, error = TemplateService.get_template(template_id)
+    if error:
+        ns.abort(404, error)
+    identity = current_identity()
+    if identity.role != "admin" and template["created_by"] != identity.id:
+        ns.abort(403, "无权限操作此模板")
+    return template
+
+
+@ns.route("/")
+class TemplateList(Resource):
+    @jwt_required()
+    @roles_required("interviewer", "admin")
+    def get(self):
+        """获取模板列表（面试官只能看到自己创建的模板）"""
+        identity = current_identity()
+        creator_id = None if identity.role == "admin" else identity.id
+        return {"data": TemplateService.get_templates(creator_id)}, 200
+
+    @ns.expect(template_model)
+    @jwt_required()
+    @roles_required("interviewer", "admin")
+    def post(self):
+        """创建面试模板"""
+        data = request.get_json() or {}
+        template, error = TemplateService.create_template(data, current_identity().id)
+        if error:
+            return {"message": error}, 400
+        return {"message": "模板创建成功", "data": template}, 201
+
+
+@ns.route("/<int:template_id>")
+class TemplateDetail(Resource):
+    @jwt_required()
+    @roles_required("interviewer", "admin")
+    def get(self, template_id):
+        """获取模板详情及题目"""
+        return {"data": _get_owned_template(template_id)}, 200
+
+    @jwt_required()
+    @roles_required("interviewer", "admin")
+    def delete(self, template_id):
+        """删除模板（已分发的面试保留）"""
+        _get_owned_template(template_id)
+        success, error = TemplateService.delete_template(template_id)
+        if error:
+            return {"message": error}, 400
+        return {"message": "模板删除成功"}, 200
+
+
+@ns.route("/<int:template_id>/fanout")
+class TemplateFanOut(Resource):
+    @ns.expect(fanout_model)
+    @jwt_required()
+    @roles_required("interviewer", "admin")
+    def post(self, template_id):
+        """把模板分发给多名面试者，为每人创建一场已分配的面试
+
+        人数超过 FANOUT_SYNC_LIMIT 且启用任务队列时转为后台任务，返回 202，
+        可通过模板详情中的 interview_count 查看进度。
+        """
+        _get_owned_template(template_id)
+        interviewee_ids = (request.get_json() or {}).get("interviewee_ids")
+        interviewer_id = current_identity().id
+        config = current_app.config
+
+        if (
+            config.get("TASK_QUEUE_ENABLED")
+            and isinstance(interviewee_ids, list)
+            and len(interviewee_ids) > config.get("FANOUT_SYNC_LIMIT", 2000)
+        ):
+            task_row = enqueue(
+                "fanout_template",
+                {
+                    "template_id": template_id,
+                    "interviewer_id": interviewer_id,
+                    "interviewee_ids": interviewee_ids,
+                },
+                commit=True,
+            )
+            return {"message": "已提交后台分发", "task_id": task_row.id}, 202
+
+        report, error = TemplateService.fan_out(
+            template_id,
+            interviewer_id,
+            interviewee_ids,
+            config.get("FANOUT_CHUNK_SIZE", 500),
+        )
+        if error:
+            return {"message": error}, 400
+        return {"message": "分发完成", "data": report}, 201
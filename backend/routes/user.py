@@ -1,8 +1,19 @@
-from flask import request, jsonify
+import csv
+import io
+from flask import current_app, request, jsonify
 from flask_restx import Namespace, Resource, fields
+from sqlalchemy.exc import TimeoutError as PoolTimeout
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models.user import User
 from utils.roles import roles_required
+from utils.pagination import parse_limit
+from services.user_service import (
+    search_users,
+    import_users,
+    read_import_csv,
+    enqueue_import,
+    get_import_task,
+)
 
 ns = Namespace("users", description="用户管理相关接口")
 
@@ -25,34 +36,29 @@ class UserListResource(Resource):
     @jwt_required()
     @roles_required("interviewer", "admin")
     def get(self):
-        """获取用户列表（面试官和管理员可见）"""
+        """获取用户列表（面试官和管理员可见），支持 q 搜索和 limit/cursor 分页"""
         try:
             # 获取查询参数
             role = request.args.get("role")
-
-            # 构建查询
-            query = User.query
-            if role:
-                query = query.filter(User.role == role)
-
-            users = query.all()
+            q = (request.args.get("q") or "").strip()
+            try:
+                limit = parse_limit(request.args.get("limit"))
+                users, next_cursor = search_users(
+                    role, q, limit, request.args.get("cursor")
+                )
+            except ValueError:
+                return {"message": "无效的分页参数"}, 400
 
             # 转换为字典格式
-            users_data = []
-            for user in users:
-                users_data.append(
-                    {
-                        "id": user.id,
-                        "username": user.username,
-                        "email": user.email,
-                        "role": user.role,
-                        "created_at": (
-                            user.created_at.isoformat() if user.created_at else None
-                        ),
-                    }
-                )
+            users_data = [user.to_admin_dict() for user in users]
 
-            return {"data": users_data, "message": "获取用户列表成功"}, 200
+            return {
+                "data": users_data,
+                "next_cursor": next_cursor,
+                "message": "获取用户列表成功",
+            }, 200
+        except PoolTimeout:
+            raise
         except Exception as e:
             return {"message": f"获取用户列表失败: {str(e)}"}, 500
 
@@ -69,14 +75,61 @@ class UserResource(Resource):
             if not user:
                 return {"message": "用户不存在"}, 404
 
-            user_data = {
-                "id": user.id,
-                "username": user.username,
-                "email": user.email,
-                "role": user.role,
-                "created_at": user.created_at.isoformat() if user.created_at else None,
-            }
-
-            return {"data": user_data, "message": "获取用户信息成功"}, 200
+            return {"data": user.to_admin_dict(), "message": "获取用户信息成功"}, 200
+        except PoolTimeout:
+            raise
         except Exception as e:
             return {"message": f"获取用户信息失败: {str(e)}"}, 500
+
+
+@ns.route("/import")
+class UserImportResource(Resource):
+    @ns.doc("import_users")
+    @jwt_required()
+    @roles_required("admin")
+    def post(self):
+        """批量导入用户（管理员），上传 CSV 文件：username,email,password[,role]
+
+        超过 IMPORT_SYNC_LIMIT 行时转为后台任务，返回 202 和 task_id，通过
+        GET /import/<task_id> 查看状态和导入报告；未启用任务队列时拒绝大文件。
+        """
+        upload = request.files.get("file")
+        if upload is None:
+            return {"message": "请上传 CSV 文件"}, 400
+        config = current_app.config
+        try:
+            stream = io.TextIOWrapper(upload.stream, encoding="utf-8-sig")
+            rows = read_import_csv(stream)
+            rows = list(rows)
+            limit = config.get("IMPORT_SYNC_LIMIT", 50)
+            if len(rows) > limit:
+                if not config.get("TASK_QUEUE_ENABLED"):
+                    # 请求内逐行哈希密码会长时间占用 worker，大文件只允许后台导入
+                    return {
+                        "message": f"超过 {limit} 行的文件需要启用任务队列，"
+                        "或使用 flask import-users 命令导入"
+                    }, 400
+                task_row = enqueue_import(rows)
+                return {"message": "已提交后台导入", "task_id": task_row.id}, 202
+            report = import_users(rows)
+        except (UnicodeDecodeError, csv.Error) as e:
+            return {"message": f"CSV 文件格式错误: {str(e)}"}, 400
+        except PoolTimeout:
+            raise
+        except Exception as e:
+            return {"message": f"导入用户失败: {str(e)}"}, 500
+
+        return {"data": report, "message": "导入完成"}, 200
+
+
+@ns.route("/import/<int:task_id>")
+class UserImportStatusResource(Resource):
+    @ns.doc("get_import_status")
+    @jwt_required()
+    @roles_required("admin")
+    def get(self, task_id):
+        """查看后台导入任务状态，status 为 done 时 result 为导入报告"""
+        task = get_import_task(task_id)
+        if task is None:
+            return {"message": "导入任务不存在"}, 404
+        return {"data": task}, 200
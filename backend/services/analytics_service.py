@@ -0,0 +1,210 @@
+from sqlalchemy import Float, case, func, type_coerce
+from sqlalchemy.exc import IntegrityError
+from extensions import db
+from models.hiring_rollup import HiringRollup, SCORE_BUCKETS
+from models.interview import Interview
+from models.interview_evaluation import InterviewEvaluation
+from models.job_requirement import JobRequirement
+from models.user import User
+
+
+def _sample(evaluation, interview):
+    """从一条已完成的评价提取汇总所需的数据"""
+    pct = evaluation.calculate_percentage()
+    duration = None
+    if interview.started_at and interview.completed_at:
+        duration = (interview.completed_at - interview.started_at).total_seconds()
+    return {
+        "passed": bool(evaluation.is_passed),
+        "score": float(pct),
+        "bucket": min(max(int(pct // (100 / SCORE_BUCKETS)), 0), SCORE_BUCKETS - 1),
+        "duration": duration if duration is not None and duration >= 0 else None,
+    }
+
+
+def _empty_rollup(dimension, dimension_id):
+    return HiringRollup(
+        dimension=dimension,
+        dimension_id=dimension_id,
+        evaluated_count=0,
+        passed_count=0,
+        score_sum=0.0,
+        score_sq_sum=0.0,
+        score_histogram=[0] * SCORE_BUCKETS,
+        duration_sum=0.0,
+        duration_count=0,
+    )
+
+
+def _get_rollup(dimension, dimension_id):
+    """取汇总行并加行锁（Postgres），不存在时创建"""
+    query = HiringRollup.query.filter_by(dimension=dimension, dimension_id=dimension_id)
+    rollup = query.with_for_update().first()
+    if rollup is None:
+        try:
+            # 在保存点中插入，并发创建同一行时回退到读取对方插入的行
+            with db.session.begin_nested():
+                rollup = _empty_rollup(dimension, dimension_id)
+                db.session.add(rollup)
+        except IntegrityError:
+            rollup = query.with_for_update().one()
+    return rollup
+
+
+def _accumulate(rollup, sample, sign=1):
+    rollup.evaluated_count += sign
+    rollup.passed_count += sign if sample["passed"] else 0
+    rollup.score_sum += sign * sample["score"]
+    rollup.score_sq_sum += sign * sample["score"] ** 2
+    histogram = list(rollup.score_histogram or [0] * SCORE_BUCKETS)
+    histogram[sample["bucket"]] += sign
+    rollup.score_histogram = histogram
+    if sample["duration"] is not None:
+        rollup.duration_sum += sign * sample["duration"]
+        rollup.duration_count += sign
+
+
+def _dimensions(interview):
+    return (
+        ("job", interview.job_requirement_id),
+        ("interviewer", interview.interviewer_id),
+    )
+
+
+def record_evaluation(evaluation, interview, sign=1):
+    """评价完成时把结果计入岗位和面试官的汇总；sign=-1 用于撤销（删除面试）
+
+    只修改会话中的对象，随调用方事务提交。
+    """
+    sample = _sample(evaluation, interview)
+    for dimension, dimension_id in _dimensions(interview):
+        _accumulate(_get_rollup(dimension, dimension_id), sample, sign)
+
+
+def rebuild_rollups(batch_size=1000):
+    """从已完成的评价全量重建汇总表，返回计入的评价数"""
+    rollups = {}
+    count = 0
+    rows = (
+        db.session.query(InterviewEvaluation, Interview)
+        .join(Interview, InterviewEvaluation.interview_id == Interview.id)
+        .filter(InterviewEvaluation.is_finalized.is_(True))
+        .yield_per(batch_size)
+    )
+    for evaluation, interview in rows:
+        sample = _sample(evaluation, interview)
+        for key in _dimensions(interview):
+            rollup = rollups.get(key)
+            if rollup is None:
+                rollup = rollups[key] = _empty_rollup(*key)
+            _accumulate(rollup, sample)
+        count += 1
+
+    HiringRollup.query.delete()
+    db.session.add_all(rollups.values())
+    db.session.commit()
+    return count
+
+
+def job_analytics(job_id=None):
+    """按岗位的招聘指标，直接读取汇总表"""
+    query = db.session.query(HiringRollup, JobRequirement.job_title).join(
+        JobRequirement, JobRequirement.id == HiringRollup.dimension_id
+    )
+    query = query.filter(HiringRollup.dimension == "job")
+    if job_id is not None:
+        query = query.filter(HiringRollup.dimension_id == job_id)
+    return [
+        {**rollup.to_dict(), "job_title": job_title}
+        for rollup, job_title in query.order_by(HiringRollup.dimension_id)
+    ]
+
+
+def interviewer_analytics(interviewer_id=None):
+    """按面试官的招聘指标，直接读取汇总表"""
+    query = db.session.query(HiringRollup, User.username).join(
+        User, User.id == HiringRollup.dimension_id
+    )
+    query = query.filter(HiringRollup.dimension == "interviewer")
+    if interviewer_id is not None:
+        query = query.filter(HiringRollup.dimension_id == interviewer_id)
+    return [
+        {**rollup.to_dict(), "username": username}
+        for rollup, username in query.order_by(HiringRollup.dimension_id)
+    ]
+
+
+def job_leaderboard(job_id, page=1, per_page=20, is_passed=None, is_finalized=None):
+    """岗位候选人排行榜，返回 (items, total)
+
+    得分百分比、rank/dense_rank 和百分位（cume_dist）都在数据库中用窗口函数计算，
+    只把当前页的行取回应用层。
+    """
+    percentage = type_coerce(
+        case(
+            (
+                InterviewEvaluation.max_score > 0,
+                InterviewEvaluation.total_score * 100.0 / InterviewEvaluation.max_score,
+            ),
+            else_=0.0,
+        ),
+        Float,
+    )
+    ordering = {"order_by": percentage.desc()}
+    ranked = (
+        db.session.query(
+            InterviewEvaluation.id.label("evaluation_id"),
+            Interview.id.label("interview_id"),
+            Interview.interviewee_id.label("interviewee_id"),
+            InterviewEvaluation.total_score,
+            InterviewEvaluation.max_score,
+            InterviewEvaluation.is_passed,
+            InterviewEvaluation.is_finalized,
+            InterviewEvaluation.evaluated_at,
+            percentage.label("percentage"),
+            func.rank().over(**ordering).label("rank"),
+            func.dense_rank().over(**ordering).label("dense_rank"),
+            type_coerce(func.cume_dist().over(order_by=percentage), Float).label(
+                "cume_dist"
+            ),
+            func.count().over().label("total"),
+        )
+        .join(Interview, InterviewEvaluation.interview_id == Interview.id)
+        .filter(Interview.job_requirement_id == job_id)
+    )
+    if is_passed is not None:
+        ranked = ranked.filter(InterviewEvaluation.is_passed.is_(is_passed))
+    if is_finalized is not None:
+        ranked = ranked.filter(InterviewEvaluation.is_finalized.is_(is_finalized))
+    ranked = ranked.subquery()
+
+    rows = (
+        db.session.query(ranked, User.username)
+        .outerjoin(User, User.id == ranked.c.interviewee_id)
+        .order_by(ranked.c.rank, ranked.c.evaluation_id)
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+        .all()
+    )
+    total = rows[0].total if rows else 0
+    if not rows and page > 1:
+        total = db.session.query(func.count()).select_from(ranked).scalar()
+    items = [
+        {
+            "evaluation_id": row.evaluation_id,
+            "interview_id": row.interview_id,
+            "interviewee_id": row.interviewee_id,
+            "username": row.username,
+            "total_score": row.total_score,
+            "max_score": row.max_score,
+            "percentage": round(float(row.percentage), 2),
+            "rank": row.rank,
+            "dense_rank": row.dense_rank,
+            "percentile": round(float(row.cume_dist) * 100, 2),
+            "is_passed": row.is_passed,
+            "is_finalized": row.is_finalized,
+            "evaluated_at": row.evaluated_at,
+        }
+        for row in rows
+    ]
+    return items, total
@@ -0,0 +1,71 @@
+from sqlalchemy.orm import aliased
+from extensions import db
+from models.interview import Interview
+from models.interview_evaluation import InterviewEvaluation
+from models.interview_question import InterviewQuestion
+from models.question_bank import BankQuestion
+from models.user import User
+
+EXPORT_HEADER = (
+    "面试ID",
+    "面试标题",
+    "面试状态",
+    "面试者",
+    "面试者邮箱",
+    "开始时间",
+    "完成时间",
+    "题号",
+    "题目类型",
+    "题目",
+    "面试者答案",
+    "题目分值",
+    "得分",
+    "评语",
+    "总分",
+    "满分",
+    "是否通过",
+    "评价已完成",
+    "决定原因",
+)
+
+
+def iter_job_export(job_id, batch_size=1000):
+    """逐行产出岗位下所有面试的题目与评价，一道题一行
+
+    使用 yield_per 的服务端游标分批读取，只取导出需要的列，不构造 ORM 对象。
+    """
+    interviewee = aliased(User)
+    query = (
+        db.session.query(
+            Interview.id,
+            Interview.title,
+            Interview.status,
+            interviewee.username,
+            interviewee.email,
+            Interview.started_at,
+            Interview.completed_at,
+            InterviewQuestion.order_index,
+            BankQuestion.question_type,
+            BankQuestion.question_text,
+            InterviewQuestion.candidate_answer,
+            InterviewQuestion.score,
+            InterviewQuestion.actual_score,
+            InterviewQuestion.comments,
+            InterviewEvaluation.total_score,
+            InterviewEvaluation.max_score,
+            InterviewEvaluation.is_passed,
+            InterviewEvaluation.is_finalized,
+            InterviewEvaluation.decision_reason,
+        )
+        .outerjoin(interviewee, Interview.interviewee_id == interviewee.id)
+        .outerjoin(InterviewQuestion, InterviewQuestion.interview_id == Interview.id)
+        .outerjoin(BankQuestion, InterviewQuestion.bank_question_id == BankQuestion.id)
+        .outerjoin(
+            InterviewEvaluation, InterviewEvaluation.interview_id == Interview.id
+        )
+        .filter(Interview.job_requirement_id == job_id)
+        .order_by(Interview.id, InterviewQuestion.order_index, InterviewQuestion.id)
+        .yield_per(batch_size)
+    )
+    for row in query:
+        yield tuple(row)
@@ -1,16 +1,35 @@
 from extensions import db
 from models.interview import Interview
-from models.interview_question import InterviewQuestion
+from models.interview_question import InterviewQuestion, QUESTION_TYPES
+from models.question_bank import BankQuestion
 from models.interview_evaluation import InterviewEvaluation
 from models.user import User
 from models.job_requirement import JobRequirement
+from models.resume import Resume
+from collections import defaultdict
 from datetime import datetime
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import and_, or_
+from sqlalchemy.exc import SQLAlchemyError, TimeoutError as PoolTimeout
+from sqlalchemy import and_, or_, case, values, column, Integer, Text
+from sqlalchemy.orm import joinedload
+from utils.pagination import keyset_paginate
+from utils.conditional import aggregate_version
+from utils.grading import CHOICE_TYPES, grade_choice
+from services.prescoring_service import schedule_prescore, dispatch_prescore
+from services.analytics_service import record_evaluation
+from services.question_bank_service import QuestionBankService, CONTENT_FIELDS
 
 
 class InterviewService:
 
+    @staticmethod
+    def _with_relations(query):
+        """预加载 to_dict() 用到的关联数据，列表查询不再逐行触发懒加载"""
+        return query.options(
+            joinedload(Interview.job_requirement),
+            joinedload(Interview.interviewer),
+            joinedload(Interview.interviewee),
+        )
+
     @staticmethod
     def create_interview(data):
         """创建面试"""
@@ -27,46 +46,247 @@ class InterviewService:
             db.session.add(interview)
             db.session.commit()
             return interview.to_dict(), None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return None, str(e)
 
     @staticmethod
-    def get_interviews_by_interviewer(interviewer_id, status=None):
-        """获取面试官的面试列表"""
+    def get_interviews_by_interviewer(
+        interviewer_id, status=None, limit=None, cursor=None
+    ):
+        """获取面试官的面试列表（传入 limit 时按游标分页）"""
         try:
-            query = Interview.query.filter_by(interviewer_id=interviewer_id)
-            if status:
-                query = query.filter_by(status=status)
-            interviews = query.order_by(Interview.created_at.desc()).all()
-            return [interview.to_dict() for interview in interviews], None
+            query = InterviewService._with_relations(
+                InterviewService._interviewer_query(interviewer_id, status)
+            )
+            return InterviewService._paginate(query, limit, cursor)
+        except ValueError:
+            return None, "无效的分页游标"
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             return None, str(e)
 
     @staticmethod
-    def get_interviews_by_interviewee(interviewee_id, status=None):
+    def get_interviews_by_interviewee(
+        interviewee_id, status=None, limit=None, cursor=None
+    ):
         """获取面试者的面试列表（只返回已分配及之后状态的面试）"""
         try:
-            query = Interview.query.filter_by(interviewee_id=interviewee_id)
-
-            # 面试者只能看到非草稿状态的面试
-            query = query.filter(Interview.status != "draft")
-
-            if status:
-                query = query.filter_by(status=status)
-            interviews = query.order_by(Interview.created_at.desc()).all()
-            return [interview.to_dict() for interview in interviews], None
+            query = InterviewService._with_relations(
+                InterviewService._interviewee_query(interviewee_id, status)
+            )
+            return InterviewService._paginate(query, limit, cursor)
+        except ValueError:
+            return None, "无效的分页游标"
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             return None, str(e)
 
+    @staticmethod
+    def _interviewer_query(interviewer_id, status=None):
+        query = Interview.query.filter_by(interviewer_id=interviewer_id)
+        if status:
+            query = query.filter_by(status=status)
+        return query
+
+    @staticmethod
+    def _interviewee_query(interviewee_id, status=None):
+        query = Interview.query.filter_by(interviewee_id=interviewee_id)
+
+        # 面试者只能看到非草稿状态的面试
+        query = query.filter(Interview.status != "draft")
+
+        if status:
+            query = query.filter_by(status=status)
+        return query
+
+    # 版本查询：供条件 GET（ETag）使用，只做聚合不加载数据
+    @staticmethod
+    def interviews_version(interviewer_id=None, interviewee_id=None, status=None):
+        """面试列表的 (max(updated_at), count)"""
+        if interviewer_id is not None:
+            query = InterviewService._interviewer_query(interviewer_id, status)
+        else:
+            query = InterviewService._interviewee_query(interviewee_id, status)
+        return aggregate_version(query, Interview.updated_at)
+
+    @staticmethod
+    def interview_version(interview_id):
+        """面试详情的版本：面试和岗位的更新时间，一条查询完成
+
+        同时返回 interviewer_id/interviewee_id/status 供权限判断，面试不存在时返回 None。
+        """
+        row = (
+            db.session.query(
+                Interview.id,
+                Interview.interviewer_id,
+                Interview.interviewee_id,
+                Interview.status,
+                Interview.updated_at,
+                JobRequirement.updated_at,
+            )
+            .outerjoin(
+                JobRequirement, Interview.job_requirement_id == JobRequirement.id
+            )
+            .filter(Interview.id == interview_id)
+            .first()
+        )
+        if row is None:
+            return None
+        return {
+            "interviewer_id": row[1],
+            "interviewee_id": row[2],
+            "status": row[3],
+            "updated_at": row[4],
+            "version": (row[0], row[4], row[5]),
+        }
+
+    @staticmethod
+    def questions_version(interview_id):
+        """题目列表的 (max(updated_at), count, 题库条目 max(updated_at))
+
+        题库条目被集中修改时题目行不变，因此版本中也要包含题库条目的更新时间。
+        """
+        updated, count, bank_updated = (
+            db.session.query(
+                db.func.max(InterviewQuestion.updated_at),
+                db.func.count(InterviewQuestion.id),
+                db.func.max(BankQuestion.updated_at),
+            )
+            .join(BankQuestion, InterviewQuestion.bank_question_id == BankQuestion.id)
+            .filter(InterviewQuestion.interview_id == interview_id)
+            .one()
+        )
+        if updated is not None and bank_updated is not None:
+            updated = max(updated, bank_updated)
+        return updated, count, bank_updated
+
+    @staticmethod
+    def evaluation_version(interview_id):
+        """评价的 (updated_at, count)"""
+        return aggregate_version(
+            InterviewEvaluation.query.filter_by(interview_id=interview_id),
+            InterviewEvaluation.updated_at,
+        )
+
+    @staticmethod
+    def interview_full_version(interview_id):
+        """/full 接口的版本：面试、题目、评价和简历的更新时间，一条查询完成
+
+        同时返回 interviewer_id/interviewee_id/status 供权限判断，面试不存在时返回 None。
+        """
+        questions = InterviewQuestion.query.filter_by(interview_id=interview_id)
+        evaluations = InterviewEvaluation.query.filter_by(interview_id=interview_id)
+        resume_updated = (
+            db.session.query(Resume.updated_at)
+            .filter(Resume.user_id == Interview.interviewee_id)
+            .scalar_subquery()
+        )
+        row = (
+            db.session.query(
+                Interview.interviewer_id,
+                Interview.interviewee_id,
+                Interview.status,
+                Interview.updated_at,
+                questions.with_entities(
+                    db.func.max(InterviewQuestion.updated_at)
+                ).scalar_subquery(),
+                questions.with_entities(db.func.count()).scalar_subquery(),
+                questions.join(BankQuestion)
+                .with_entities(db.func.max(BankQuestion.updated_at))
+                .scalar_subquery(),
+                evaluations.with_entities(
+                    db.func.max(InterviewEvaluation.updated_at)
+                ).scalar_subquery(),
+                resume_updated,
+            )
+            .filter(Interview.id == interview_id)
+            .first()
+        )
+        if row is None:
+            return None
+        return {
+            "interviewer_id": row[0],
+            "interviewee_id": row[1],
+            "status": row[2],
+            "version": tuple(row[3:]),
+        }
+
+    @staticmethod
+    def _paginate(query, limit, cursor):
+        """按 (created_at, id) 游标分页并序列化"""
+        interviews, next_cursor = keyset_paginate(
+            query, Interview.created_at, Interview.id, limit, cursor
+        )
+        return {
+            "items": [interview.to_dict() for interview in interviews],
+            "next_cursor": next_cursor,
+        }, None
+
     @staticmethod
     def get_interview_by_id(interview_id):
         """根据ID获取面试详情"""
         try:
-            interview = Interview.query.get(interview_id)
+            interview = InterviewService._with_relations(Interview.query).get(
+                interview_id
+            )
             if not interview:
                 return None, "面试不存在"
             return interview.to_dict(), None
+        except PoolTimeout:
+            raise
+        except SQLAlchemyError as e:
+            return None, str(e)
+
+    @staticmethod
+    def get_interview_full(interview_id, for_candidate=False):
+        """一次性获取面试详情、题目、评价和面试者简历（固定 4 次查询）
+
+        面试者视角下题目不含参考答案和评分，也不返回简历。
+        """
+        try:
+            interview = InterviewService._with_relations(Interview.query).get(
+                interview_id
+            )
+            if not interview:
+                return None, "面试不存在"
+
+            questions = (
+                InterviewQuestion.query.filter_by(interview_id=interview_id)
+                .order_by(InterviewQuestion.order_index)
+                .all()
+            )
+            evaluation = (
+                InterviewEvaluation.query.options(
+                    joinedload(InterviewEvaluation.evaluator)
+                )
+                .filter_by(interview_id=interview_id)
+                .first()
+            )
+
+            resume = None
+            if not for_candidate and interview.interviewee_id:
+                resume = Resume.query.filter_by(
+                    user_id=interview.interviewee_id
+                ).first()
+
+            if for_candidate:
+                questions_data = [q.to_candidate_dict() for q in questions]
+            else:
+                questions_data = [q.to_dict() for q in questions]
+
+            return {
+                "interview": interview.to_dict(),
+                "questions": questions_data,
+                "evaluation": evaluation.to_dict() if evaluation else None,
+                "resume": resume.to_simple_dict() if resume else None,
+            }, None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             return None, str(e)
 
@@ -83,6 +303,16 @@ class InterviewService:
                 interview.title = data["title"]
             if "description" in data:
                 interview.description = data["description"]
+
+            # 已计入汇总的评价在岗位变化时要从旧岗位的汇总行移到新岗位
+            evaluation = None
+            if data.get("job_requirement_id", interview.job_requirement_id) != (
+                interview.job_requirement_id
+            ):
+                evaluation = InterviewService._finalized_evaluation(interview_id)
+            if evaluation:
+                record_evaluation(evaluation, interview, sign=-1)
+
             if "job_requirement_id" in data:
                 interview.job_requirement_id = data["job_requirement_id"]
             if "interviewee_id" in data:
@@ -92,13 +322,25 @@ class InterviewService:
             if "status" in data:
                 interview.status = data["status"]
 
+            if evaluation:
+                record_evaluation(evaluation, interview)
+
             interview.updated_at = datetime.utcnow()
             db.session.commit()
             return interview.to_dict(), None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return None, str(e)
 
+    @staticmethod
+    def _finalized_evaluation(interview_id):
+        """已完成（计入招聘指标汇总）的评价，没有时返回 None"""
+        return InterviewEvaluation.query.filter_by(
+            interview_id=interview_id, is_finalized=True
+        ).first()
+
     @staticmethod
     def delete_interview(interview_id):
         """删除面试"""
@@ -107,6 +349,11 @@ class InterviewService:
             if not interview:
                 return False, "面试不存在"
 
+            # 已计入汇总的评价需要先从汇总中扣除
+            evaluation = InterviewService._finalized_evaluation(interview_id)
+            if evaluation:
+                record_evaluation(evaluation, interview, sign=-1)
+
             # 删除相关的题目和评价
             InterviewQuestion.query.filter_by(interview_id=interview_id).delete()
             InterviewEvaluation.query.filter_by(interview_id=interview_id).delete()
@@ -114,6 +361,8 @@ class InterviewService:
             db.session.delete(interview)
             db.session.commit()
             return True, None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return False, str(e)
@@ -139,6 +388,8 @@ class InterviewService:
 
             db.session.commit()
             return interview.to_dict(), None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return None, str(e)
@@ -160,6 +411,8 @@ class InterviewService:
 
             db.session.commit()
             return interview.to_dict(), None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return None, str(e)
@@ -181,6 +434,8 @@ class InterviewService:
 
             db.session.commit()
             return interview.to_dict(), None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return None, str(e)
@@ -189,6 +444,10 @@ class InterviewService:
     @staticmethod
     def add_question(interview_id, question_data):
         """为面试添加题目"""
+        error = InterviewService.validate_questions([question_data])
+        if error:
+            return None, error
+
         try:
             interview = Interview.query.get(interview_id)
             if not interview:
@@ -202,12 +461,10 @@ class InterviewService:
                 or 0
             )
 
+            (bank_question_id,) = QuestionBankService.intern_questions([question_data])
             question = InterviewQuestion(
                 interview_id=interview_id,
-                question_text=question_data.get("question_text"),
-                question_type=question_data.get("question_type", "text"),
-                options=question_data.get("options"),
-                reference_answer=question_data.get("reference_answer"),
+                bank_question_id=bank_question_id,
                 score=question_data.get("score", 10),
                 order_index=max_order + 1,
             )
@@ -215,6 +472,81 @@ class InterviewService:
             db.session.add(question)
             db.session.commit()
             return question.to_dict(), None
+        except PoolTimeout:
+            raise
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            return None, str(e)
+
+    @staticmethod
+    def validate_questions(questions_data):
+        """校验题目列表，返回错误信息，通过时返回 None"""
+        if not isinstance(questions_data, list) or not questions_data:
+            return "请提供题目列表"
+
+        errors = []
+        for i, item in enumerate(questions_data):
+            if not isinstance(item, dict):
+                errors.append(f"第 {i + 1} 题格式不正确")
+                continue
+            text = item.get("question_text")
+            if not isinstance(text, str) or not text.strip():
+                errors.append(f"第 {i + 1} 题缺少题目内容")
+            if item.get("question_type", "text") not in QUESTION_TYPES:
+                errors.append(f"第 {i + 1} 题题目类型无效")
+            score = item.get("score", 10)
+            if not isinstance(score, int) or isinstance(score, bool) or score < 0:
+                errors.append(f"第 {i + 1} 题分值无效")
+        return "；".join(errors) if errors else None
+
+    @staticmethod
+    def add_questions_bulk(interview_id, questions_data):
+        """批量添加题目：统一校验，一条多行 INSERT，一次提交"""
+        error = InterviewService.validate_questions(questions_data)
+        if error:
+            return None, error
+
+        try:
+            interview = Interview.query.get(interview_id)
+            if not interview:
+                return None, "面试不存在"
+
+            max_order = (
+                db.session.query(db.func.max(InterviewQuestion.order_index))
+                .filter_by(interview_id=interview_id)
+                .scalar()
+                or 0
+            )
+
+            bank_ids = QuestionBankService.intern_questions(questions_data)
+            now = datetime.utcnow()
+            rows = [
+                {
+                    "interview_id": interview_id,
+                    "bank_question_id": bank_question_id,
+                    "score": item.get("score", 10),
+                    "order_index": max_order + i + 1,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i, (item, bank_question_id) in enumerate(
+                    zip(questions_data, bank_ids)
+                )
+            ]
+            db.session.execute(InterviewQuestion.__table__.insert().values(rows))
+            db.session.commit()
+
+            questions = (
+                InterviewQuestion.query.filter(
+                    InterviewQuestion.interview_id == interview_id,
+                    InterviewQuestion.order_index > max_order,
+                )
+                .order_by(InterviewQuestion.order_index)
+                .all()
+            )
+            return [question.to_dict() for question in questions], None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return None, str(e)
@@ -233,26 +565,35 @@ class InterviewService:
                 return [question.to_candidate_dict() for question in questions], None
             else:
                 return [question.to_dict() for question in questions], None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             return None, str(e)
 
     @staticmethod
     def update_question(question_id, question_data):
-        """更新题目"""
+        """更新题目
+
+        修改题目内容时只让本题改为引用新内容对应的题库条目（不存在则创建），
+        不影响引用原条目的其他面试；集中修改请使用题库接口。
+        """
         try:
             question = InterviewQuestion.query.get(question_id)
             if not question:
                 return None, "题目不存在"
 
             # 更新字段
-            if "question_text" in question_data:
-                question.question_text = question_data["question_text"]
-            if "question_type" in question_data:
-                question.question_type = question_data["question_type"]
-            if "options" in question_data:
-                question.options = question_data["options"]
-            if "reference_answer" in question_data:
-                question.reference_answer = question_data["reference_answer"]
+            if any(name in question_data for name in CONTENT_FIELDS):
+                content = {
+                    name: question_data.get(name, getattr(question, name))
+                    for name in CONTENT_FIELDS
+                }
+                error = InterviewService.validate_questions([content])
+                if error:
+                    return None, error
+                (question.bank_question_id,) = QuestionBankService.intern_questions(
+                    [content]
+                )
             if "score" in question_data:
                 question.score = question_data["score"]
             if "order_index" in question_data:
@@ -261,6 +602,8 @@ class InterviewService:
             question.updated_at = datetime.utcnow()
             db.session.commit()
             return question.to_dict(), None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return None, str(e)
@@ -276,6 +619,8 @@ class InterviewService:
             db.session.delete(question)
             db.session.commit()
             return True, None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return False, str(e)
@@ -293,10 +638,214 @@ class InterviewService:
 
             db.session.commit()
             return question.to_candidate_dict(), None
+        except PoolTimeout:
+            raise
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            return None, str(e)
+
+    @staticmethod
+    def submit_answers(interview_id, user_id, answers, is_admin=False):
+        """批量提交答案：一次校验权限和状态，只更新有变化的答案
+
+        answers 为 {question_id: answer}，返回 {"changed": [...], "unchanged": [...]}
+        """
+        if not isinstance(answers, dict) or not answers:
+            return None, "请提供答案"
+        try:
+            answers = {int(qid): answer for qid, answer in answers.items()}
+        except (TypeError, ValueError):
+            return None, "题目ID无效"
+        if not all(isinstance(answer, str) and answer for answer in answers.values()):
+            return None, "答案不能为空"
+
+        try:
+            interview = Interview.query.get(interview_id)
+            if not interview:
+                return None, "面试不存在"
+
+            if not is_admin and interview.interviewee_id != user_id:
+                return None, "无权限提交此面试答案"
+
+            if interview.status not in ["assigned", "in_progress"]:
+                return None, "面试状态不允许提交答案"
+
+            current = dict(
+                db.session.query(
+                    InterviewQuestion.id, InterviewQuestion.candidate_answer
+                )
+                .filter(
+                    InterviewQuestion.interview_id == interview_id,
+                    InterviewQuestion.id.in_(answers.keys()),
+                )
+                .all()
+            )
+            missing = sorted(set(answers) - set(current))
+            if missing:
+                return None, f"题目不属于该面试: {missing}"
+
+            changed = {
+                qid: answer for qid, answer in answers.items() if current[qid] != answer
+            }
+            if changed:
+                db.session.execute(
+                    InterviewService._bulk_question_update(
+                        "candidate_answer", changed, Text
+                    ),
+                    execution_options={"synchronize_session": False},
+                )
+                db.session.commit()
+
+            return {
+                "changed": sorted(changed),
+                "unchanged": sorted(set(answers) - set(changed)),
+            }, None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return None, str(e)
 
+    @staticmethod
+    def _bulk_question_update(column_name, changed, type_):
+        """把 {question_id: value} 写入题目表的一列，构造单条 UPDATE
+
+        Postgres 上用 UPDATE ... FROM (VALUES ...)，其他数据库用 CASE。
+        """
+        table = InterviewQuestion.__table__
+        now = datetime.utcnow()
+        if db.engine.dialect.name == "postgresql":
+            new_values = values(
+                column("id", Integer), column("value", type_), name="new_values"
+            ).data(list(changed.items()))
+            return (
+                table.update()
+                .where(table.c.id == new_values.c.id)
+                .values({column_name: new_values.c.value, "updated_at": now})
+            )
+        return (
+            table.update()
+            .where(table.c.id.in_(changed.keys()))
+            .values({column_name: case(changed, value=table.c.id), "updated_at": now})
+        )
+
+    @staticmethod
+    def _choice_rows(query):
+        """选择题自动评分需要的列"""
+        return (
+            query.join(
+                BankQuestion, InterviewQuestion.bank_question_id == BankQuestion.id
+            )
+            .with_entities(
+                InterviewQuestion.id,
+                BankQuestion.question_type,
+                BankQuestion.options,
+                BankQuestion.reference_answer,
+                InterviewQuestion.candidate_answer,
+                InterviewQuestion.score,
+                InterviewQuestion.actual_score,
+                InterviewQuestion.interview_id,
+            )
+            .filter(
+                BankQuestion.question_type.in_(CHOICE_TYPES),
+                # 面试官人工评过分的题目不再自动评分
+                InterviewQuestion.manually_scored.is_(False),
+            )
+        )
+
+    @staticmethod
+    def _grade_choices(rows):
+        """对一批选择题计算得分，只返回与当前 actual_score 不同的 {question_id: score}"""
+        changed = {}
+        for qid, qtype, options, reference, answer, score, actual, _ in rows:
+            graded = grade_choice(qtype, options, reference, answer, score)
+            if graded is not None and graded != actual:
+                changed[qid] = graded
+        return changed
+
+    @staticmethod
+    def auto_grade_interview(interview_id):
+        """自动评分一场面试的所有选择题并用一条 UPDATE 写回，不提交事务
+
+        返回更新的题目数。
+        """
+        rows = InterviewService._choice_rows(
+            InterviewQuestion.query.filter_by(interview_id=interview_id)
+        ).all()
+        changed = InterviewService._grade_choices(rows)
+        if changed:
+            db.session.execute(
+                InterviewService._bulk_question_update(
+                    "actual_score", changed, Integer
+                ),
+                execution_options={"synchronize_session": False},
+            )
+        return len(changed)
+
+    @staticmethod
+    def _refresh_evaluation_totals(deltas):
+        """题目得分变化后按差值调整评价总分，保留面试官在总分上的其他调整
+
+        deltas 为 {interview_id: 得分变化}，只修改会话中的对象，随调用方事务提交。
+        已完成的评价同时把旧分数从招聘指标汇总中移出、计入新分数。
+        """
+        evaluations = (
+            InterviewEvaluation.query.options(joinedload(InterviewEvaluation.interview))
+            .filter(InterviewEvaluation.interview_id.in_(deltas.keys()))
+            .all()
+        )
+        now = datetime.utcnow()
+        for evaluation in evaluations:
+            if evaluation.is_finalized:
+                record_evaluation(evaluation, evaluation.interview, sign=-1)
+            evaluation.total_score = max(
+                (evaluation.total_score or 0) + deltas[evaluation.interview_id], 0
+            )
+            evaluation.updated_at = now
+            if evaluation.is_finalized:
+                record_evaluation(evaluation, evaluation.interview)
+        return evaluations
+
+    @staticmethod
+    def regrade_choice_questions(interview_id=None, batch_size=500):
+        """按当前参考答案重新评分已提交面试的选择题，返回更新的题目数
+
+        只处理待评价和已完成的面试，跳过面试官人工评过分的题目；按题目 ID 分批，
+        每批一条 UPDATE，并按得分变化调整对应评价的总分后提交。
+        """
+        query = InterviewQuestion.query.join(Interview).filter(
+            Interview.status.in_(["pending_evaluation", "completed"])
+        )
+        if interview_id is not None:
+            query = query.filter(InterviewQuestion.interview_id == interview_id)
+        query = InterviewService._choice_rows(query).order_by(InterviewQuestion.id)
+
+        updated = 0
+        last_id = 0
+        while True:
+            rows = query.filter(InterviewQuestion.id > last_id).limit(batch_size).all()
+            if not rows:
+                break
+            changed = InterviewService._grade_choices(rows)
+            if changed:
+                deltas = defaultdict(int)
+                for row in rows:
+                    if row.id in changed:
+                        deltas[row.interview_id] += changed[row.id] - (
+                            row.actual_score or 0
+                        )
+                db.session.execute(
+                    InterviewService._bulk_question_update(
+                        "actual_score", changed, Integer
+                    ),
+                    execution_options={"synchronize_session": False},
+                )
+                InterviewService._refresh_evaluation_totals(deltas)
+                db.session.commit()
+                updated += len(changed)
+            last_id = rows[-1][0]
+        return updated
+
     # 评价相关方法
     @staticmethod
     def create_evaluation(interview_id, evaluator_id, evaluation_data):
@@ -336,9 +885,12 @@ class InterviewService:
                 interview.status = "completed"
                 evaluation.is_finalized = True  # 标记评价已完成
                 interview.updated_at = datetime.utcnow()
+                record_evaluation(evaluation, interview)
 
             db.session.commit()
             return evaluation.to_dict(), None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return None, str(e)
@@ -353,6 +905,8 @@ class InterviewService:
             if not evaluation:
                 return None, "评价不存在"
             return evaluation.to_dict(), None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             return None, str(e)
 
@@ -395,9 +949,12 @@ class InterviewService:
                 if interview:
                     interview.status = "completed"
                     interview.updated_at = datetime.utcnow()
+                    record_evaluation(evaluation, interview)
 
             db.session.commit()
             return evaluation.to_dict(), None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return None, str(e)
@@ -411,11 +968,14 @@ class InterviewService:
                 return None, "题目不存在"
 
             question.actual_score = score
+            question.manually_scored = True
             question.comments = comments
             question.updated_at = datetime.utcnow()
 
             db.session.commit()
             return question.to_dict(), None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return None, str(e)
@@ -464,9 +1024,18 @@ class InterviewService:
                 interview.started_at = interview.created_at
 
             interview.updated_at = datetime.utcnow()
+
+            # 选择题自动评分和预评分任务，与状态变更在同一事务中提交
+            InterviewService.auto_grade_interview(interview_id)
+            schedule_prescore(interview_id)
             db.session.commit()
+            result = interview.to_dict()
 
-            return interview.to_dict(), None
+            # 文本/代码题的相似度预评分在后台执行
+            dispatch_prescore(interview_id)
+            return result, None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return None, str(e)
@@ -497,6 +1066,8 @@ class InterviewService:
             db.session.commit()
 
             return interview.to_dict(), None
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return None, str(e)
@@ -541,6 +1112,8 @@ class InterviewService:
             db.session.commit()
             return interview.to_dict(), None
 
+        except PoolTimeout:
+            raise
         except SQLAlchemyError as e:
             db.session.rollback()
             return None, str(e)
@@ -1,5 +1,6 @@
-from extensions import db
+from extensions import db, cache
 from models.job_requirement import JobRequirement
+from utils.conditional import aggregate_version
 
 
 def create_job(data):
@@ -10,15 +11,20 @@ def create_job(data):
     )
     db.session.add(job)
     db.session.commit()
+    cache.invalidate("jobs")
     return job
 
 
+@cache.memoize("jobs")
 def get_job(jid):
-    return JobRequirement.query.get(jid)
+    job = JobRequirement.query.get(jid)
+    return job.to_dict() if job else None
 
 
+@cache.memoize("jobs")
 def list_jobs():
-    return JobRequirement.query.order_by(JobRequirement.created_at.desc()).all()
+    jobs = JobRequirement.query.order_by(JobRequirement.created_at.desc()).all()
+    return [job.to_dict() for job in jobs]
 
 
 def update_job(jid, data):
@@ -29,6 +35,7 @@ def update_job(jid, data):
     job.description = data.get("description", job.description)
     job.skills = data.get("skills", job.skills)
     db.session.commit()
+    cache.invalidate("jobs")
     return job
 
 
@@ -37,3 +44,10 @@ def delete_job(jid):
     if job:
         db.session.delete(job)
         db.session.commit()
+        cache.invalidate("jobs")
+
+
+@cache.memoize("jobs")
+def jobs_version():
+    """岗位列表的 (max(updated_at), count)，用于 ETag"""
+    return aggregate_version(JobRequirement.query, JobRequirement.updated_at)
@@ -0,0 +1,196 @@
+import threading
+import time
+from datetime import timedelta
+from flask import current_app
+from sqlalchemy import func
+from extensions import db
+from models.job_requirement import JobRequirement
+from models.resume import Resume
+from models.user import User
+from utils.db_routing import primary
+from utils.matching import TermIndex
+from utils.text_search import tokenize
+
+
+def _job_tokens(job_title, skills, description=None):
+    """岗位的匹配词：技能列表 + 岗位名称；未填写技能时退化为岗位描述"""
+    text = " ".join(skills or [])
+    if not skills and description:
+        text = description
+    return tokenize(f"{text} {job_title or ''}")
+
+
+class _Corpus:
+    """一类文档（简历或岗位）的进程内索引，按 updated_at 增量同步
+
+    updated_at 在 flush 时生成，而行在提交后才可见：提交较晚的事务可能带着早于水位线的
+    时间戳。因此每次检查都重新扫描水位线之前 overlap 秒内变化的行（重复索引是幂等的）；
+    行数对不上时按 ID 对账，删掉已不存在的行、补上缺失的行。
+    只有进程内第一次使用时整体加载，之后请求中不再整体重建。
+    """
+
+    def __init__(self, model, columns, to_tokens):
+        self.model = model
+        self.columns = columns
+        self.to_tokens = to_tokens
+        self.index = TermIndex()
+        self.loaded = False
+        self.watermark = None
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+    def sync(self, interval, overlap):
+        now = time.monotonic()
+        if self.loaded and now - self.checked_at < interval:
+            return
+        self.checked_at = now
+        # 水位线必须从主库读取，副本延迟会导致水位线之前的变更被漏掉
+        with primary():
+            if self.loaded:
+                self._sync(overlap)
+            else:
+                self.rebuild()
+
+    def _index_rows(self, *criteria):
+        query = db.session.query(self.model.id, *self.columns).filter(*criteria)
+        for row_id, *values in query.yield_per(1000):
+            self.index.add(row_id, self.to_tokens(*values))
+
+    def _sync(self, overlap):
+        updated_col = self.model.updated_at
+        latest, count = db.session.query(
+            func.max(updated_col), func.count(self.model.id)
+        ).one()
+        if self.watermark is None:
+            self._index_rows()
+        else:
+            self._index_rows(updated_col >= self.watermark - timedelta(seconds=overlap))
+        if latest is not None and (self.watermark is None or latest > self.watermark):
+            self.watermark = latest
+        if count != len(self.index):
+            self._reconcile()
+
+    def _reconcile(self):
+        """按 ID 对账：删除的行移出索引，扫描窗口外补进来的行加入索引"""
+        ids = {row_id for (row_id,) in db.session.query(self.model.id)}
+        for row_id in set(self.index.ids()) - ids:
+            self.index.remove(row_id)
+        missing = ids.difference(self.index.ids())
+        if missing:
+            self._index_rows(self.model.id.in_(missing))
+
+    def rebuild(self):
+        self.index.clear()
+        query = db.session.query(
+            self.model.id, self.model.updated_at, *self.columns
+        ).yield_per(1000)
+        latest = None
+        for row_id, updated_at, *values in query:
+            self.index.add(row_id, self.to_tokens(*values))
+            if updated_at is not None and (latest is None or updated_at > latest):
+                latest = updated_at
+        self.watermark = latest
+        self.loaded = True
+
+
+class MatchingEngine:
+    """简历与岗位的双向匹配，两类索引各用一把锁，互不阻塞"""
+
+    def __init__(self):
+        self.resumes = _Corpus(Resume, (Resume.content,), tokenize)
+        self.jobs = _Corpus(
+            JobRequirement,
+            (
+                JobRequirement.job_title,
+                JobRequirement.skills,
+                JobRequirement.description,
+            ),
+            _job_tokens,
+        )
+
+    def _sync(self, corpus):
+        config = current_app.config
+        corpus.sync(
+            config.get("MATCHING_SYNC_INTERVAL", 5),
+            config.get("MATCHING_SYNC_OVERLAP", 60),
+        )
+
+    def rank_resumes(self, tokens, top):
+        with self.resumes.lock:
+            self._sync(self.resumes)
+            index = self.resumes.index
+            # 词项字典在更新时整体替换，带出锁后仍然可以安全读取
+            return [
+                (resume_id, score, index.terms(resume_id))
+                for resume_id, score in index.search(tokens, top)
+            ]
+
+    def rank_jobs(self, tokens, top):
+        with self.jobs.lock:
+            self._sync(self.jobs)
+            return self.jobs.index.search(tokens, top)
+
+
+engine = MatchingEngine()
+
+
+def candidates_for_job(job_id, top=50):
+    """为岗位按匹配度排序候选人，返回 (items, error)"""
+    job = JobRequirement.query.get(job_id)
+    if not job:
+        return None, "岗位不存在"
+
+    ranked = engine.rank_resumes(
+        _job_tokens(job.job_title, job.skills, job.description), top
+    )
+    if not ranked:
+        return [], None
+
+    rows = (
+        db.session.query(Resume.id, User)
+        .join(User, Resume.user_id == User.id)
+        .filter(Resume.id.in_([resume_id for resume_id, _, _ in ranked]))
+        .all()
+    )
+    users = dict(rows)
+    skill_tokens = {skill: set(tokenize(skill)) for skill in job.skills or []}
+
+    items = []
+    for resume_id, score, terms in ranked:
+        user = users.get(resume_id)
+        if user is None:
+            continue
+        items.append(
+            {
+                "resume_id": resume_id,
+                "user": user.to_dict(),
+                "score": round(score, 4),
+                "matched_skills": [
+                    skill
+                    for skill, tokens in skill_tokens.items()
+                    if tokens and all(token in terms for token in tokens)
+                ],
+            }
+        )
+    return items, None
+
+
+def jobs_for_candidate(user_id, top=10):
+    """为面试者按简历匹配度推荐岗位，返回 (items, error)"""
+    resume = Resume.query.filter_by(user_id=user_id).first()
+    if not resume:
+        return None, "简历不存在"
+
+    ranked = engine.rank_jobs(tokenize(resume.content), top)
+    if not ranked:
+        return [], None
+
+    jobs = JobRequirement.query.filter(
+        JobRequirement.id.in_([job_id for job_id, _ in ranked])
+    ).all()
+    by_id = {job.id: job for job in jobs}
+    return [
+        {"job": by_id[job_id].to_dict(), "score": round(score, 4)}
+        for job_id, score in ranked
+        if job_id in by_id
+    ], None
@@ -0,0 +1,140 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from flask import current_app
+from sqlalchemy import bindparam
+from extensions import db
+from models.interview_question import InterviewQuestion
+from models.question_bank import BankQuestion
+from services.task_queue import enqueue
+from utils.similarity import similarity_batch
+
+PRESCORE_TYPES = ("text", "code")
+
+_settings = {"workers": 2, "chunk_size": 200}
+_dispatcher = None
+_pool = None
+_lock = threading.Lock()
+
+
+def init_prescoring(app):
+    """根据配置设置预评分进程池大小；PRESCORE_WORKERS=0 时在调用线程内同步计算"""
+    global _dispatcher, _pool
+    with _lock:
+        for executor in (_dispatcher, _pool):
+            if executor is not None:
+                executor.shutdown(wait=False)
+        _settings["workers"] = app.config.get("PRESCORE_WORKERS", 2)
+        _settings["chunk_size"] = app.config.get("PRESCORE_CHUNK_SIZE", 200)
+        _dispatcher = None
+        _pool = None
+
+
+def _executors():
+    global _dispatcher, _pool
+    with _lock:
+        if _dispatcher is None:
+            _dispatcher = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="prescore"
+            )
+        if _pool is None and _settings["workers"] > 0:
+            # spawn：派发线程存在时 fork 不安全，子进程也不需要继承数据库连接
+            _pool = ProcessPoolExecutor(
+                max_workers=_settings["workers"],
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _dispatcher, _pool
+
+
+def compute_features(rows):
+    """计算 [(id, type, reference, answer)] 的相似度特征
+
+    相似度是纯 Python 的 CPU 计算，按 chunk 分发到进程池，避免和请求线程争抢 GIL。
+    """
+    _, pool = _executors()
+    if pool is None or len(rows) <= _settings["chunk_size"]:
+        return similarity_batch(rows)
+    size = _settings["chunk_size"]
+    chunks = [rows[i : i + size] for i in range(0, len(rows), size)]
+    return [item for batch in pool.map(similarity_batch, chunks) for item in batch]
+
+
+def _store(results):
+    """executemany 写回 similarity 列"""
+    if not results:
+        return
+    table = InterviewQuestion.__table__
+    db.session.execute(
+        table.update()
+        .where(table.c.id == bindparam("qid"))
+        .values(similarity=bindparam("features")),
+        [{"qid": qid, "features": features} for qid, features in results],
+    )
+
+
+def prescore_questions(query):
+    """为查询到的文本/代码题计算并保存相似度特征，返回处理的题目数"""
+    rows = (
+        query.join(BankQuestion, InterviewQuestion.bank_question_id == BankQuestion.id)
+        .with_entities(
+            InterviewQuestion.id,
+            BankQuestion.question_type,
+            BankQuestion.reference_answer,
+            InterviewQuestion.candidate_answer,
+        )
+        .filter(
+            BankQuestion.question_type.in_(PRESCORE_TYPES),
+            BankQuestion.reference_answer.isnot(None),
+            InterviewQuestion.candidate_answer.isnot(None),
+        )
+        .order_by(InterviewQuestion.id)
+        .all()
+    )
+    results = compute_features([tuple(row) for row in rows])
+    _store(results)
+    db.session.commit()
+    return len(results)
+
+
+def prescore_interview(interview_id):
+    return prescore_questions(
+        InterviewQuestion.query.filter_by(interview_id=interview_id)
+    )
+
+
+def _run(app, interview_id):
+    with app.app_context():
+        _prescore_logged(interview_id)
+        db.session.remove()
+
+
+def _prescore_logged(interview_id):
+    try:
+        prescore_interview(interview_id)
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"面试 {interview_id} 预评分失败: {str(e)}")
+
+
+def schedule_prescore(interview_id):
+    """提交面试时安排相似度预评分，在业务事务提交之前调用
+
+    启用任务队列（TASK_QUEUE_ENABLED）时把任务加入当前会话，与面试状态变更在同一事务中
+    提交，由 `flask worker` 执行；否则什么都不做，提交后由 dispatch_prescore 在进程内执行。
+    """
+    if current_app.config.get("TASK_QUEUE_ENABLED"):
+        enqueue("prescore_interview", {"interview_id": interview_id})
+
+
+def dispatch_prescore(interview_id):
+    """未启用任务队列时，在业务事务提交之后于进程内执行预评分，不阻塞请求
+
+    在派发线程中执行；PRESCORE_WORKERS=0 时在当前请求内同步计算（开发和调试用）。
+    """
+    if current_app.config.get("TASK_QUEUE_ENABLED"):
+        return
+    if _settings["workers"] == 0:
+        _prescore_logged(interview_id)
+        return
+    dispatcher, _ = _executors()
+    dispatcher.submit(_run, current_app._get_current_object(), interview_id)
@@ -0,0 +1,203 @@
+from extensions import db
+from models.interview import Interview
+from models.interview_question import InterviewQuestion, QUESTION_TYPES
+from models.interview_template import TemplateQuestion
+from models.question_bank import BankQuestion, question_hash
+from datetime import datetime
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+from utils.pagination import keyset_paginate
+
+# 题库条目的内容字段（参与内容哈希）
+CONTENT_FIELDS = ("question_text", "question_type", "options", "reference_answer")
+
+# 已提交的面试：作答和自动评分基于提交时的题目内容，修改题库不能影响它们
+SUBMITTED_STATUSES = ("pending_evaluation", "completed")
+
+
+class QuestionBankService:
+    @staticmethod
+    def _bank_row(item):
+        """由题目数据构造题库行（含内容哈希）"""
+        row = {
+            "question_text": item["question_text"],
+            "question_type": item.get("question_type", "text"),
+            "options": item.get("options"),
+            "reference_answer": item.get("reference_answer"),
+        }
+        row["content_hash"] = question_hash(*(row[name] for name in CONTENT_FIELDS))
+        return row
+
+    @staticmethod
+    def _lookup(hashes):
+        return dict(
+            db.session.query(BankQuestion.content_hash, BankQuestion.id).filter(
+                BankQuestion.content_hash.in_(hashes)
+            )
+        )
+
+    @staticmethod
+    def intern_questions(questions_data):
+        """把题目内容写入题库（已存在的直接复用），返回与输入一一对应的题库ID
+
+        一条查询找出已有条目，缺失的用一条多行 INSERT 补齐；不提交事务，随调用方一起提交。
+        """
+        rows = {}
+        hashes = []
+        for item in questions_data:
+            row = QuestionBankService._bank_row(item)
+            rows.setdefault(row["content_hash"], row)
+            hashes.append(row["content_hash"])
+
+        ids = QuestionBankService._lookup(rows.keys())
+        missing = [row for content_hash, row in rows.items() if content_hash not in ids]
+        if missing:
+            now = datetime.utcnow()
+            for row in missing:
+                row["created_at"] = row["updated_at"] = now
+            table = BankQuestion.__table__
+            try:
+                with db.session.begin_nested():
+                    db.session.execute(table.insert().values(missing))
+            except IntegrityError:
+                # 并发写入了相同内容：逐条插入，已存在的跳过
+                for row in missing:
+                    try:
+                        with db.session.begin_nested():
+                            db.session.execute(table.insert().values(row))
+                    except IntegrityError:
+                        pass
+            ids = QuestionBankService._lookup(rows.keys())
+        return [ids[content_hash] for content_hash in hashes]
+
+    @staticmethod
+    def _usage_counts(bank_ids):
+        return dict(
+            db.session.query(
+                InterviewQuestion.bank_question_id, func.count(InterviewQuestion.id)
+            )
+            .filter(InterviewQuestion.bank_question_id.in_(bank_ids))
+            .group_by(InterviewQuestion.bank_question_id)
+        )
+
+    @staticmethod
+    def get_bank_questions(question_type=None, keyword=None, limit=None, cursor=None):
+        """题库列表，按 (created_at, id) 游标分页，附带被面试引用的次数
+
+        cursor 无效时抛出 ValueError。
+        """
+        query = BankQuestion.query
+        if question_type:
+            query = query.filter(BankQuestion.question_type == question_type)
+        if keyword:
+            query = query.filter(BankQuestion.question_text.contains(keyword))
+        questions, next_cursor = keyset_paginate(
+            query, BankQuestion.created_at, BankQuestion.id, limit, cursor
+        )
+        usage = QuestionBankService._usage_counts([q.id for q in questions])
+        items = [
+            {**question.to_dict(), "usage_count": usage.get(question.id, 0)}
+            for question in questions
+        ]
+        return {"items": items, "next_cursor": next_cursor}
+
+    @staticmethod
+    def get_bank_question(bank_question_id):
+        question = BankQuestion.query.get(bank_question_id)
+        if not question:
+            return None, "题库题目不存在"
+        usage = QuestionBankService._usage_counts([question.id])
+        return {**question.to_dict(), "usage_count": usage.get(question.id, 0)}, None
+
+    @staticmethod
+    def _used_by_submitted(bank_question_id):
+        return (
+            db.session.query(InterviewQuestion.id)
+            .join(Interview, InterviewQuestion.interview_id == Interview.id)
+            .filter(
+                InterviewQuestion.bank_question_id == bank_question_id,
+                Interview.status.in_(SUBMITTED_STATUSES),
+            )
+            .first()
+            is not None
+        )
+
+    @staticmethod
+    def _fork(question, values, content_hash):
+        """写时复制：新内容写入新条目，未提交的面试和模板改为引用新条目，
+        已提交面试继续引用原条目，原有内容和得分不变"""
+        fork = BankQuestion(content_hash=content_hash, **values)
+        db.session.add(fork)
+        db.session.flush()
+        unsubmitted = db.session.query(Interview.id).filter(
+            Interview.status.notin_(SUBMITTED_STATUSES)
+        )
+        InterviewQuestion.query.filter(
+            InterviewQuestion.bank_question_id == question.id,
+            InterviewQuestion.interview_id.in_(unsubmitted),
+        ).update(
+            {"bank_question_id": fork.id, "updated_at": datetime.utcnow()},
+            synchronize_session=False,
+        )
+        TemplateQuestion.query.filter_by(bank_question_id=question.id).update(
+            {"bank_question_id": fork.id}, synchronize_session=False
+        )
+        return fork
+
+    @staticmethod
+    def update_bank_question(bank_question_id, data):
+        """修改题库条目，引用它的模板和未提交的面试随之生效
+
+        没有已提交面试引用时直接修改该条目；否则写时复制到新条目（返回新条目，ID 不同），
+        已提交面试的题目内容保持不变，自动评分结果仍与题目一致。
+        """
+        try:
+            question = BankQuestion.query.get(bank_question_id)
+            if not question:
+                return None, "题库题目不存在"
+
+            values = {name: getattr(question, name) for name in CONTENT_FIELDS}
+            values.update({k: v for k, v in data.items() if k in CONTENT_FIELDS})
+            text = values["question_text"]
+            if not isinstance(text, str) or not text.strip():
+                return None, "题目内容不能为空"
+            if values["question_type"] not in QUESTION_TYPES:
+                return None, "题目类型无效"
+
+            content_hash = question_hash(*(values[name] for name in CONTENT_FIELDS))
+            if content_hash != question.content_hash:
+                duplicate = BankQuestion.query.filter_by(
+                    content_hash=content_hash
+                ).first()
+                if duplicate:
+                    return None, f"题库中已存在相同的题目（ID {duplicate.id}）"
+                if QuestionBankService._used_by_submitted(question.id):
+                    question = QuestionBankService._fork(question, values, content_hash)
+                    db.session.commit()
+                    return question.to_dict(), None
+            for name, value in values.items():
+                setattr(question, name, value)
+            question.content_hash = content_hash
+            db.session.commit()
+            return question.to_dict(), None
+        except IntegrityError:
+            db.session.rollback()
+            return None, "题库中已存在相同的题目"
+        except PoolTimeout:
+            raise
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            return None, str(e)
+
+    @staticmethod
+    def delete_unused():
+        """删除没有被任何面试或模板引用的题库条目，返回删除数"""
+        used = db.session.query(InterviewQuestion.bank_question_id).union(
+            db.session.query(TemplateQuestion.bank_question_id)
+        )
+        count = BankQuestion.query.filter(~BankQuestion.id.in_(used)).delete(
+            synchronize_session=False
+        )
+        db.session.commit()
+        return count
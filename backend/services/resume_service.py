@@ -2,6 +2,13 @@ from models.resume import Resume
 from models.user import User
 from extensions import db
 from flask import current_app
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload
+from utils.text_search import index_text, tokenize, query_terms, build_snippet
+
+# 数据库 URL -> SQLite 上 resumes_fts 是否可用
+_fts_tables = {}
 
 
 class ResumeService:
@@ -26,8 +33,12 @@ class ResumeService:
             if user.role != "interviewee":
                 raise ValueError("只有面试者可以创建简历")
 
-            resume = Resume(user_id=user_id, content=content)
+            resume = Resume(
+                user_id=user_id, content=content, search_tokens=index_text(content)
+            )
             db.session.add(resume)
+            db.session.flush()
+            ResumeService._sync_fts(resume)
             db.session.commit()
             return resume
         except Exception as e:
@@ -44,6 +55,8 @@ class ResumeService:
                 raise ValueError("简历不存在")
 
             resume.content = content
+            resume.search_tokens = index_text(content)
+            ResumeService._sync_fts(resume)
             db.session.commit()
             return resume
         except Exception as e:
@@ -59,6 +72,7 @@ class ResumeService:
             if not resume:
                 raise ValueError("简历不存在")
 
+            ResumeService._sync_fts(resume, delete=True)
             db.session.delete(resume)
             db.session.commit()
             return True
@@ -75,3 +89,148 @@ class ResumeService:
             return ResumeService.update_resume(user_id, content)
         else:
             return ResumeService.create_resume(user_id, content)
+
+    @staticmethod
+    def init_fts():
+        """应用启动时确保 SQLite 上存在 resumes_fts
+
+        FTS5 虚拟表不在模型元数据中，db.create_all() 建的库没有这张表；SQLite 未编译
+        FTS5 时记录警告，写入时跳过同步，检索退化为 LIKE。
+        """
+        engine = db.engine
+        if engine.dialect.name != "sqlite":
+            return
+        try:
+            created = not inspect(engine).has_table("resumes_fts")
+            if created:
+                with engine.begin() as conn:
+                    conn.exec_driver_sql(
+                        "CREATE VIRTUAL TABLE IF NOT EXISTS resumes_fts USING fts5(tokens)"
+                    )
+                current_app.logger.info(
+                    "已创建 resumes_fts，已有简历需运行 flask reindex-resumes 建立索引"
+                )
+            _fts_tables[str(engine.url)] = True
+        except SQLAlchemyError as e:
+            current_app.logger.warning(f"简历全文索引不可用: {str(e)}")
+            _fts_tables[str(engine.url)] = False
+
+    @staticmethod
+    def _fts_available():
+        engine = db.engine
+        return engine.dialect.name == "sqlite" and _fts_tables.get(str(engine.url))
+
+    @staticmethod
+    def _sync_fts(resume, delete=False):
+        """SQLite 上同步 FTS5 表 resumes_fts；Postgres 的 search_vector 是生成列，无需处理"""
+        if not ResumeService._fts_available():
+            return
+        db.session.execute(
+            text("DELETE FROM resumes_fts WHERE rowid = :id"), {"id": resume.id}
+        )
+        if not delete:
+            db.session.execute(
+                text("INSERT INTO resumes_fts (rowid, tokens) VALUES (:id, :tokens)"),
+                {"id": resume.id, "tokens": resume.search_tokens or ""},
+            )
+
+    @staticmethod
+    def reindex_all(batch_size=500):
+        """重建所有简历的检索词（历史数据或分词规则变化后使用）"""
+        count = 0
+        last_id = 0
+        while True:
+            resumes = (
+                Resume.query.filter(Resume.id > last_id)
+                .order_by(Resume.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not resumes:
+                break
+            for resume in resumes:
+                resume.search_tokens = index_text(resume.content)
+                ResumeService._sync_fts(resume)
+            db.session.commit()
+            count += len(resumes)
+            last_id = resumes[-1].id
+        return count
+
+    @staticmethod
+    def search_resumes(query, page=1, per_page=20):
+        """全文检索简历，按相关度排序分页，返回 (items, total)
+
+        Postgres 使用 search_vector @@ plainto_tsquery + ts_rank，SQLite 使用 FTS5 + bm25，
+        其他数据库（及不支持 FTS5 的 SQLite）退化为对原文的 LIKE 过滤。
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return [], 0
+        offset = (page - 1) * per_page
+        dialect = db.engine.dialect.name
+
+        if dialect == "postgresql":
+            params = {"q": " ".join(tokens), "limit": per_page, "offset": offset}
+            total = db.session.execute(
+                text(
+                    "SELECT count(*) FROM resumes "
+                    "WHERE search_vector @@ plainto_tsquery('simple', :q)"
+                ),
+                params,
+            ).scalar()
+            rows = db.session.execute(
+                text(
+                    "SELECT id, ts_rank(search_vector, query) AS rank "
+                    "FROM resumes, plainto_tsquery('simple', :q) AS query "
+                    "WHERE search_vector @@ query "
+                    "ORDER BY rank DESC, id LIMIT :limit OFFSET :offset"
+                ),
+                params,
+            ).all()
+        elif ResumeService._fts_available():
+            match = " ".join(f'"{token}"' for token in tokens)
+            params = {"q": match, "limit": per_page, "offset": offset}
+            total = db.session.execute(
+                text("SELECT count(*) FROM resumes_fts WHERE resumes_fts MATCH :q"),
+                params,
+            ).scalar()
+            # bm25 越小越相关，取负数保持“越大越相关”
+            rows = db.session.execute(
+                text(
+                    "SELECT rowid, -bm25(resumes_fts) AS rank FROM resumes_fts "
+                    "WHERE resumes_fts MATCH :q "
+                    "ORDER BY rank DESC, rowid LIMIT :limit OFFSET :offset"
+                ),
+                params,
+            ).all()
+        else:
+            like = Resume.query.filter(
+                *[Resume.content.ilike(f"%{term}%") for term in query_terms(query)]
+            )
+            total = like.count()
+            rows = [
+                (resume.id, 0.0)
+                for resume in like.order_by(Resume.id).offset(offset).limit(per_page)
+            ]
+
+        ranks = dict(rows)
+        resumes = (
+            Resume.query.options(joinedload(Resume.user))
+            .filter(Resume.id.in_(ranks.keys()))
+            .all()
+        )
+        by_id = {resume.id: resume for resume in resumes}
+        terms = query_terms(query)
+        items = [
+            {
+                "resume_id": resume_id,
+                "user_id": by_id[resume_id].user_id,
+                "user": by_id[resume_id].user.to_dict(),
+                "rank": round(float(rank), 6),
+                "snippet": build_snippet(by_id[resume_id].content, terms),
+                "updated_at": by_id[resume_id].updated_at,
+            }
+            for resume_id, rank in rows
+            if resume_id in by_id
+        ]
+        return items, total
@@ -0,0 +1,389 @@
+import importlib
+import os
+import socket
+import threading
+import time
+import traceback
+from collections import defaultdict
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import and_, func, or_
+from sqlalchemy.exc import SQLAlchemyError
+from extensions import db
+from models.background_task import BackgroundTask
+
+# 任务名 -> 处理函数
+TASKS = {}
+
+# 结束（成功或最终失败）后清空 payload 的任务，payload 中含有敏感数据
+SENSITIVE_TASKS = set()
+
+# 注册任务处理函数的模块，worker 启动时导入
+TASK_MODULES = ("services.tasks",)
+
+_metrics = defaultdict(
+    lambda: {"succeeded": 0, "failed": 0, "retried": 0, "seconds": 0.0, "max": 0.0}
+)
+_metrics_lock = threading.Lock()
+
+# 当前线程正在执行的任务 (task_id, worker_id)，供处理函数续租和保存进度
+_current = threading.local()
+
+
+class LeaseLost(Exception):
+    """任务租约已过期并被其他 worker 领取，当前执行应当停止"""
+
+
+def task(name, sensitive=False):
+    """注册后台任务处理函数，payload 以关键字参数传入，返回值保存到 result
+
+    sensitive=True 时任务结束后清空 payload（如含明文密码的导入数据）。
+    """
+
+    def decorator(fn):
+        TASKS[name] = fn
+        if sensitive:
+            SENSITIVE_TASKS.add(name)
+        return fn
+
+    return decorator
+
+
+def load_tasks():
+    for module in TASK_MODULES:
+        importlib.import_module(module)
+
+
+def enqueue(name, payload=None, delay=0, max_attempts=None, commit=False):
+    """写入一条任务
+
+    默认只加入当前会话，随调用方的业务事务一起提交，保证业务数据和任务同时生效。
+    """
+    config = current_app.config
+    task_row = BackgroundTask(
+        name=name,
+        payload=payload or {},
+        status="queued",
+        max_attempts=max_attempts or config.get("TASK_MAX_ATTEMPTS", 3),
+        run_at=datetime.utcnow() + timedelta(seconds=delay),
+    )
+    db.session.add(task_row)
+    if commit:
+        db.session.commit()
+    return task_row
+
+
+def _claimable(now):
+    return or_(
+        and_(BackgroundTask.status == "queued", BackgroundTask.run_at <= now),
+        # 租约过期的 running 任务视为 worker 已崩溃，可以重新领取
+        and_(BackgroundTask.status == "running", BackgroundTask.locked_until < now),
+    )
+
+
+def claim(worker_id, limit=1, visibility_timeout=300):
+    """领取最多 limit 个可执行任务并加租约，返回任务 ID 列表
+
+    Postgres 上用 SELECT ... FOR UPDATE SKIP LOCKED，多个 worker 互不阻塞；
+    其他数据库逐条做带条件的 UPDATE，以影响行数判断是否抢到。
+    """
+    now = datetime.utcnow()
+    table = BackgroundTask.__table__
+    lease = {
+        "status": "running",
+        "locked_by": worker_id,
+        "locked_until": now + timedelta(seconds=visibility_timeout),
+        "attempts": table.c.attempts + 1,
+        "started_at": now,
+        "updated_at": now,
+    }
+    candidates = BackgroundTask.query.with_entities(BackgroundTask.id).filter(
+        _claimable(now)
+    )
+    candidates = candidates.order_by(BackgroundTask.run_at, BackgroundTask.id).limit(
+        limit
+    )
+
+    if db.engine.dialect.name == "postgresql":
+        ids = [row.id for row in candidates.with_for_update(skip_locked=True).all()]
+        if ids:
+            db.session.execute(table.update().where(table.c.id.in_(ids)).values(lease))
+    else:
+        ids = []
+        for (task_id,) in candidates.all():
+            result = db.session.execute(
+                table.update()
+                .where(table.c.id == task_id, _claimable(now))
+                .values(lease)
+            )
+            if result.rowcount == 1:
+                ids.append(task_id)
+    db.session.commit()
+    return ids
+
+
+def current_task():
+    """当前线程正在执行的 (task_id, worker_id)，不在任务中时为 (None, None)"""
+    return getattr(_current, "task", (None, None))
+
+
+def renew_lease(task_id=None, worker_id=None, result=None, commit=True):
+    """延长任务租约，执行时间可能超过 TASK_VISIBILITY_TIMEOUT 的处理函数应定期调用
+
+    result 不为 None 时同时保存到任务的 result 列（如阶段性进度）。默认随当前会话提交，
+    处理函数可以借此把一段已完成的工作和进度放在同一事务中提交。
+    租约已被其他 worker 接管时回滚并抛出 LeaseLost。
+    """
+    if task_id is None:
+        task_id, worker_id = current_task()
+    now = datetime.utcnow()
+    values = {
+        "locked_until": now
+        + timedelta(seconds=current_app.config.get("TASK_VISIBILITY_TIMEOUT", 300)),
+        "updated_at": now,
+    }
+    if result is not None:
+        values["result"] = result
+    table = BackgroundTask.__table__
+    renewed = db.session.execute(
+        table.update()
+        .where(
+            table.c.id == task_id,
+            table.c.locked_by == worker_id,
+            table.c.status == "running",
+        )
+        .values(values)
+    )
+    if renewed.rowcount != 1:
+        db.session.rollback()
+        raise LeaseLost(f"task {task_id} is no longer leased by {worker_id}")
+    if commit:
+        db.session.commit()
+
+
+def _finish(task_id, worker_id, values, name=None):
+    """只有仍持有租约时才更新任务，避免覆盖已被其他 worker 重新领取的任务
+
+    没有更新到任何行（租约已被接管）时记录错误，返回 False。
+    """
+    table = BackgroundTask.__table__
+    if name in SENSITIVE_TASKS and "finished_at" in values:
+        values = {**values, "payload": None}
+    updated = db.session.execute(
+        table.update()
+        .where(table.c.id == task_id, table.c.locked_by == worker_id)
+        .values(updated_at=datetime.utcnow(), **values)
+    )
+    db.session.commit()
+    if updated.rowcount != 1:
+        current_app.logger.error(
+            f"任务 {name}#{task_id} 的租约已被其他 worker 接管，"
+            f"本次执行结果（{values.get('status')}）未保存"
+        )
+        return False
+    return True
+
+
+def _record(name, outcome, seconds):
+    with _metrics_lock:
+        metric = _metrics[name]
+        metric[outcome] += 1
+        metric["seconds"] += seconds
+        metric["max"] = max(metric["max"], seconds)
+
+
+def run_task(task_id, worker_id):
+    """执行一个已领取的任务，失败时按指数退避重试，超过最大次数标记为 failed"""
+    task_row = BackgroundTask.query.get(task_id)
+    if task_row is None:
+        return None
+    name, payload = task_row.name, task_row.payload or {}
+    attempts, max_attempts = task_row.attempts, task_row.max_attempts
+    handler = TASKS.get(name)
+    now = datetime.utcnow()
+
+    if handler is None or attempts > max_attempts:
+        reason = "unknown task" if handler is None else "visibility timeout exceeded"
+        _finish(
+            task_id,
+            worker_id,
+            {"status": "failed", "last_error": reason, "finished_at": now},
+            name,
+        )
+        _record(name, "failed", 0.0)
+        return "failed"
+
+    started = time.perf_counter()
+    try:
+        _current.task = (task_id, worker_id)
+        try:
+            result = handler(**payload)
+        finally:
+            _current.task = (None, None)
+        db.session.commit()
+    except LeaseLost:
+        # 其他 worker 已接管该任务，由它负责完成和记录结果
+        db.session.rollback()
+        current_app.logger.warning(f"任务 {name}#{task_id} 的租约已被接管，停止执行")
+        return "lost"
+    except Exception:
+        db.session.rollback()
+        elapsed = time.perf_counter() - started
+        error = traceback.format_exc(limit=5)
+        current_app.logger.error(f"任务 {name}#{task_id} 执行失败: {error}")
+        if attempts < max_attempts:
+            backoff = current_app.config.get("TASK_RETRY_BACKOFF", 10)
+            _finish(
+                task_id,
+                worker_id,
+                {
+                    "status": "queued",
+                    "last_error": error,
+                    "locked_by": None,
+                    "locked_until": None,
+                    "run_at": datetime.utcnow()
+                    + timedelta(seconds=backoff * 2 ** (attempts - 1)),
+                },
+            )
+            _record(name, "retried", elapsed)
+            return "retried"
+        _finish(
+            task_id,
+            worker_id,
+            {
+                "status": "failed",
+                "last_error": error,
+                "finished_at": datetime.utcnow(),
+            },
+            name,
+        )
+        _record(name, "failed", elapsed)
+        return "failed"
+
+    elapsed = time.perf_counter() - started
+    _finish(
+        task_id,
+        worker_id,
+        {
+            "status": "done",
+            "last_error": None,
+            "result": result,
+            "locked_until": None,
+            "finished_at": datetime.utcnow(),
+        },
+        name,
+    )
+    _record(name, "succeeded", elapsed)
+    return "done"
+
+
+def worker_metrics():
+    """当前进程内按任务名统计的执行次数和耗时"""
+    with _metrics_lock:
+        return {
+            name: {
+                **metric,
+                "avg": metric["seconds"]
+                / max(metric["succeeded"] + metric["failed"] + metric["retried"], 1),
+            }
+            for name, metric in _metrics.items()
+        }
+
+
+def execution_stats(window_seconds=3600):
+    """最近 window_seconds 秒内结束的任务按任务名统计执行次数和耗时（秒）
+
+    从 background_tasks 表计算，`flask worker --processes N` 的各个子进程都计入，
+    worker_metrics() 只反映当前进程。
+    """
+    since = datetime.utcnow() - timedelta(seconds=window_seconds)
+    rows = (
+        db.session.query(
+            BackgroundTask.name,
+            BackgroundTask.status,
+            BackgroundTask.attempts,
+            BackgroundTask.started_at,
+            BackgroundTask.finished_at,
+        )
+        .filter(
+            BackgroundTask.status.in_(("done", "failed")),
+            BackgroundTask.finished_at >= since,
+        )
+        .yield_per(1000)
+    )
+    stats = defaultdict(
+        lambda: {"succeeded": 0, "failed": 0, "retried": 0, "seconds": 0.0, "max": 0.0}
+    )
+    for name, status, attempts, started_at, finished_at in rows:
+        metric = stats[name]
+        metric["succeeded" if status == "done" else "failed"] += 1
+        metric["retried"] += max(attempts - 1, 0)
+        if started_at is not None:
+            seconds = max((finished_at - started_at).total_seconds(), 0.0)
+            metric["seconds"] += seconds
+            metric["max"] = max(metric["max"], seconds)
+    return {
+        name: {
+            **metric,
+            "avg": metric["seconds"] / max(metric["succeeded"] + metric["failed"], 1),
+        }
+        for name, metric in stats.items()
+    }
+
+
+def queue_stats():
+    """按任务名和状态统计队列，并给出最早待执行任务的等待时间（秒）"""
+    rows = (
+        db.session.query(
+            BackgroundTask.name,
+            BackgroundTask.status,
+            func.count(BackgroundTask.id),
+            func.min(BackgroundTask.run_at),
+        )
+        .group_by(BackgroundTask.name, BackgroundTask.status)
+        .all()
+    )
+    now = datetime.utcnow()
+    stats = defaultdict(dict)
+    for name, status, count, oldest in rows:
+        stats[name][status] = count
+        if status == "queued" and oldest is not None:
+            stats[name]["oldest_queued_seconds"] = max(
+                (now - oldest).total_seconds(), 0
+            )
+    return dict(stats)
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def work(worker_id=None, batch_size=10, poll_interval=None, max_tasks=None):
+    """worker 主循环：领取、执行，队列为空时休眠 poll_interval 秒
+
+    max_tasks 用于处理完指定数量后退出（--once 和调试）。
+    """
+    load_tasks()
+    config = current_app.config
+    worker_id = worker_id or default_worker_id()
+    poll_interval = poll_interval or config.get("TASK_POLL_INTERVAL", 1.0)
+    visibility_timeout = config.get("TASK_VISIBILITY_TIMEOUT", 300)
+    processed = 0
+
+    while max_tasks is None or processed < max_tasks:
+        try:
+            ids = claim(worker_id, batch_size, visibility_timeout)
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            current_app.logger.error(f"领取任务失败: {str(e)}")
+            ids = []
+        if not ids:
+            if max_tasks is not None:
+                break
+            time.sleep(poll_interval)
+            continue
+        for task_id in ids:
+            run_task(task_id, worker_id)
+            processed += 1
+        db.session.remove()
+    return processed
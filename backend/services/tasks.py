@@ -0,0 +1,63 @@
+"""后台任务处理函数，由 `flask worker` 执行"""
+
+from services.task_queue import current_task, renew_lease, task
+
+
+@task("prescore_interview")
+def prescore_interview(interview_id):
+    from services.prescoring_service import prescore_interview as run
+
+    run(interview_id)
+
+
+@task("regrade_choices")
+def regrade_choices(interview_id=None):
+    from services.interview_service import InterviewService
+
+    InterviewService.regrade_choice_questions(interview_id)
+
+
+@task("reindex_resumes")
+def reindex_resumes():
+    from services.resume_service import ResumeService
+
+    ResumeService.reindex_all()
+
+
+@task("fanout_template")
+def fanout_template(template_id, interviewer_id, interviewee_ids):
+    from flask import current_app
+    from services.template_service import TemplateService
+
+    def progress(done, total):
+        current_app.logger.info(f"模板 {template_id} 分发进度: {done}/{total}")
+
+    report, error = TemplateService.fan_out(
+        template_id,
+        interviewer_id,
+        interviewee_ids,
+        current_app.config.get("FANOUT_CHUNK_SIZE", 500),
+        progress,
+    )
+    if error:
+        raise RuntimeError(error)
+    current_app.logger.info(
+        f"模板 {template_id} 分发完成: 新建 {report['created']}，"
+        f"跳过 {len(report['skipped'])}，无效 {len(report['invalid'])}"
+    )
+
+
+@task("import_users", sensitive=True)
+def import_users(rows):
+    from models.background_task import BackgroundTask
+    from services.user_service import import_users as run
+
+    # 大文件的导入可能超过租约时长：每块数据与进度、续租在同一事务中提交，
+    # 被重新领取（worker 崩溃或重试）时从上次保存的进度继续，不重复导入
+    task_id, worker_id = current_task()
+    saved = BackgroundTask.query.get(task_id).result
+
+    def checkpoint(report):
+        renew_lease(task_id, worker_id, result=report)
+
+    return run(rows, report=saved, checkpoint=checkpoint)
@@ -0,0 +1,228 @@
+from extensions import db
+from models.interview import Interview
+from models.interview_question import InterviewQuestion
+from models.interview_template import InterviewTemplate, TemplateQuestion
+from models.job_requirement import JobRequirement
+from models.user import User
+from datetime import datetime
+from sqlalchemy import func, literal, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+from services.interview_service import InterviewService
+from services.question_bank_service import QuestionBankService
+
+# 从模板复制到面试题目的列（题目内容在题库中，只复制引用）
+_COPIED_COLUMNS = ("bank_question_id", "score", "order_index")
+
+
+class TemplateService:
+    @staticmethod
+    def create_template(data, creator_id):
+        """创建面试模板及其题目"""
+        title = (data.get("title") or "").strip()
+        if not title:
+            return None, "请提供模板标题"
+        questions_data = data.get("questions")
+        error = InterviewService.validate_questions(questions_data)
+        if error:
+            return None, error
+
+        try:
+            if not JobRequirement.query.get(data.get("job_requirement_id")):
+                return None, "岗位需求不存在"
+
+            template = InterviewTemplate(
+                title=title,
+                description=data.get("description"),
+                job_requirement_id=data["job_requirement_id"],
+                created_by=creator_id,
+            )
+            bank_ids = QuestionBankService.intern_questions(questions_data)
+            template.questions = [
+                TemplateQuestion(
+                    bank_question_id=bank_question_id,
+                    score=item.get("score", 10),
+                    order_index=i + 1,
+                )
+                for i, (item, bank_question_id) in enumerate(
+                    zip(questions_data, bank_ids)
+                )
+            ]
+            db.session.add(template)
+            db.session.commit()
+            return template.to_detail_dict(), None
+        except PoolTimeout:
+            raise
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            return None, str(e)
+
+    @staticmethod
+    def get_templates(creator_id=None):
+        """获取模板列表，creator_id 为空时返回全部"""
+        query = InterviewTemplate.query
+        if creator_id is not None:
+            query = query.filter_by(created_by=creator_id)
+        templates = query.order_by(InterviewTemplate.created_at.desc()).all()
+        return [template.to_dict() for template in templates]
+
+    @staticmethod
+    def get_template(template_id):
+        """获取模板详情，interview_count 为已分发的面试数（可用于查看后台分发进度）"""
+        template = InterviewTemplate.query.get(template_id)
+        if not template:
+            return None, "模板不存在"
+        result = template.to_detail_dict()
+        result["interview_count"] = (
+            db.session.query(func.count(Interview.id))
+            .filter(Interview.template_id == template_id)
+            .scalar()
+        )
+        return result, None
+
+    @staticmethod
+    def delete_template(template_id):
+        """删除模板，已分发的面试保留，只解除与模板的关联"""
+        try:
+            template = InterviewTemplate.query.get(template_id)
+            if not template:
+                return False, "模板不存在"
+            Interview.query.filter_by(template_id=template_id).update(
+                {"template_id": None}, synchronize_session=False
+            )
+            db.session.delete(template)
+            db.session.commit()
+            return True, None
+        except PoolTimeout:
+            raise
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            return False, str(e)
+
+    @staticmethod
+    def _fan_out_chunk(template, interviewer_id, chunk, question_count):
+        """在一个事务中为一批面试者创建面试和题目，返回 (新建数, 已存在, 无效)"""
+        valid = {
+            user_id
+            for (user_id,) in db.session.query(User.id).filter(
+                User.id.in_(chunk), User.role == "interviewee"
+            )
+        }
+        existing = {
+            user_id
+            for (user_id,) in db.session.query(Interview.interviewee_id).filter(
+                Interview.template_id == template.id,
+                Interview.interviewee_id.in_(valid),
+            )
+        }
+        targets = [user_id for user_id in chunk if user_id in valid - existing]
+        invalid = [user_id for user_id in chunk if user_id not in valid]
+        skipped = [user_id for user_id in chunk if user_id in existing]
+        if not targets:
+            return 0, skipped, invalid
+
+        now = datetime.utcnow()
+        db.session.execute(
+            Interview.__table__.insert().values(
+                [
+                    {
+                        "title": template.title,
+                        "description": template.description,
+                        "job_requirement_id": template.job_requirement_id,
+                        "interviewer_id": interviewer_id,
+                        "interviewee_id": user_id,
+                        "template_id": template.id,
+                        "status": "assigned",
+                        "question_count": question_count,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for user_id in targets
+                ]
+            )
+        )
+
+        # 题目用一条 INSERT ... SELECT 在数据库内复制：模板题目 × 本批新建的面试。
+        # (template_id, interviewee_id) 唯一，本批 targets 对应的面试只可能是刚插入的这些
+        copied = [getattr(TemplateQuestion, name) for name in _COPIED_COLUMNS]
+        source = (
+            select(
+                Interview.id,
+                *copied,
+                literal(now, db.DateTime),
+                literal(now, db.DateTime),
+            )
+            .select_from(Interview)
+            .join(
+                TemplateQuestion, TemplateQuestion.template_id == Interview.template_id
+            )
+            .where(
+                Interview.template_id == template.id,
+                Interview.interviewee_id.in_(targets),
+            )
+        )
+        db.session.execute(
+            InterviewQuestion.__table__.insert().from_select(
+                ["interview_id", *_COPIED_COLUMNS, "created_at", "updated_at"], source
+            )
+        )
+        db.session.commit()
+        return len(targets), skipped, invalid
+
+    @staticmethod
+    def fan_out(
+        template_id, interviewer_id, interviewee_ids, chunk_size=500, progress=None
+    ):
+        """把模板一次分发给多名面试者，每人一场已分配的面试
+
+        按 chunk_size 分批，每批一个事务：校验面试者、一条多行 INSERT 创建面试、
+        一条 INSERT ... SELECT 复制题目。已由该模板分发过的面试者会被跳过，
+        因此中途失败后可以用同样的参数重新执行。每批提交后调用 progress(done, total)。
+
+        返回 {"total", "created", "skipped", "invalid"}，skipped/invalid 为面试者ID列表。
+        """
+        template = InterviewTemplate.query.get(template_id)
+        if not template:
+            return None, "模板不存在"
+        question_count = (
+            db.session.query(func.count(TemplateQuestion.id))
+            .filter(TemplateQuestion.template_id == template_id)
+            .scalar()
+        )
+        if not question_count:
+            return None, "模板中没有题目"
+
+        if not isinstance(interviewee_ids, list) or not interviewee_ids:
+            return None, "请提供面试者ID列表"
+        if not all(
+            isinstance(user_id, int) and not isinstance(user_id, bool)
+            for user_id in interviewee_ids
+        ):
+            return None, "面试者ID必须为整数"
+        ids = list(dict.fromkeys(interviewee_ids))
+
+        report = {"total": len(ids), "created": 0, "skipped": [], "invalid": []}
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start : start + chunk_size]
+            # 并发分发同一模板时可能触发唯一约束，回滚后重新检查已存在的面试再试一次
+            for attempt in range(2):
+                try:
+                    created, skipped, invalid = TemplateService._fan_out_chunk(
+                        template, interviewer_id, chunk, question_count
+                    )
+                    break
+                except IntegrityError as e:
+                    db.session.rollback()
+                    if attempt:
+                        return None, str(e)
+                except PoolTimeout:
+                    raise
+                except SQLAlchemyError as e:
+                    db.session.rollback()
+                    return None, str(e)
+            report["created"] += created
+            report["skipped"].extend(skipped)
+            report["invalid"].extend(invalid)
+            if progress is not None:
+                progress(start + len(chunk), len(ids))
+        return report, None
@@ -1,6 +1,19 @@
+import csv
+import re
+from datetime import datetime
+from itertools import islice
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
 from extensions import db
-from models.user import User
-from utils.security import hash_password, check_password
+from models.background_task import BackgroundTask
+from models.user import User, normalize_email
+from services.task_queue import enqueue
+from utils.pagination import keyset_paginate
+from utils.security import hash_password, hash_passwords, check_password, needs_rehash
+
+IMPORT_COLUMNS = ("username", "email", "password", "role")
+IMPORT_ROLES = ("interviewee", "interviewer")
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 
 def create_user(username, email, password, role="interviewee"):
@@ -21,4 +34,190 @@ def authenticate_user(username, password):
         return None
     if not check_password(password, user.password_hash):
         return None
+    # transparently upgrade hashes made with an old algorithm or parameters
+    if needs_rehash(user.password_hash):
+        user.password_hash = hash_password(password)
+        db.session.commit()
     return user
+
+
+def search_users(role=None, q=None, limit=None, cursor=None):
+    """按角色过滤、按用户名/邮箱子串搜索的用户目录，按 (created_at, id) 游标分页
+
+    Postgres 上 ILIKE '%q%' 由 pg_trgm GIN 索引支持；其他数据库退化为普通 LIKE 扫描。
+    cursor 无效时抛出 ValueError。
+    """
+    query = User.query
+    if role:
+        query = query.filter(User.role == role)
+    if q:
+        escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = f"%{escaped}%"
+        query = query.filter(
+            or_(
+                User.username.ilike(pattern, escape="\\"),
+                User.email.ilike(pattern, escape="\\"),
+            )
+        )
+    return keyset_paginate(query, User.created_at, User.id, limit, cursor)
+
+
+def _validate_import_row(row, seen_usernames, seen_emails):
+    """校验导入的一行，返回错误信息或 None"""
+    username, email, password = row["username"], row["email"], row["password"]
+    if not username or not email or not password:
+        return "username, email and password are required"
+    if len(username) > 80 or len(email) > 120:
+        return "username or email too long"
+    if not _EMAIL_RE.match(email):
+        return "invalid email"
+    if row["role"] not in IMPORT_ROLES:
+        return f"role must be one of {', '.join(IMPORT_ROLES)}"
+    if username in seen_usernames:
+        return "duplicate username in file"
+    if email in seen_emails:
+        return "duplicate email in file"
+    return None
+
+
+def _existing_conflicts(chunk):
+    """一条查询找出与库中已有用户冲突的用户名和邮箱"""
+    usernames = [row["username"] for row in chunk]
+    emails = [row["email"] for row in chunk]
+    rows = (
+        db.session.query(User.username, User.email)
+        .filter(or_(User.username.in_(usernames), User.email.in_(emails)))
+        .all()
+    )
+    return {u for u, _ in rows}, {e for _, e in rows}
+
+
+def _insert_chunk(chunk, errors):
+    """检查冲突、并行哈希密码后用一条多行 INSERT 写入，返回成功数；由调用方提交"""
+    taken_usernames, taken_emails = _existing_conflicts(chunk)
+    fresh = []
+    for row in chunk:
+        if row["username"] in taken_usernames:
+            errors.append({**row["ref"], "error": "username already exists"})
+        elif row["email"] in taken_emails:
+            errors.append({**row["ref"], "error": "email already exists"})
+        else:
+            fresh.append(row)
+    if not fresh:
+        return 0
+
+    hashes = hash_passwords([row["password"] for row in fresh])
+    now = datetime.utcnow()
+    db.session.execute(
+        User.__table__.insert().values(
+            [
+                {
+                    "username": row["username"],
+                    "email": row["email"],
+                    "password_hash": pw,
+                    "role": row["role"],
+                    "created_at": now,
+                }
+                for row, pw in zip(fresh, hashes)
+            ]
+        )
+    )
+    return len(fresh)
+
+
+def read_import_csv(stream):
+    """逐行读取导入 CSV（表头 username,email,password[,role]），产出 (行号, dict)
+
+    dict 只包含 IMPORT_COLUMNS 中的列，多余的列忽略。
+    """
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, {name: row.get(name) for name in IMPORT_COLUMNS}
+
+
+def enqueue_import(rows):
+    """把导入提交为后台任务，密码哈希在 worker 中执行，返回任务行
+
+    payload 中含明文密码，任务结束后由任务队列清空。
+    """
+    return enqueue(
+        "import_users", {"rows": [[line, row] for line, row in rows]}, commit=True
+    )
+
+
+def get_import_task(task_id):
+    """导入任务的状态，执行中 result 为已处理部分的进度，完成后为导入报告；不返回 payload"""
+    task_row = BackgroundTask.query.filter_by(id=task_id, name="import_users").first()
+    if task_row is None:
+        return None
+    data = task_row.to_dict()
+    data.pop("payload", None)
+    return data
+
+
+def _normalize_import_row(raw):
+    return {
+        "username": (raw.get("username") or "").strip(),
+        "email": normalize_email(raw.get("email")),
+        "password": raw.get("password") or "",
+        "role": (raw.get("role") or "").strip() or "interviewee",
+    }
+
+
+def import_users(rows, chunk_size=500, report=None, checkpoint=None):
+    """批量导入用户，rows 为 (行号, dict) 迭代器，逐块处理不整体读入内存
+
+    返回 {"total", "created", "failed", "errors": [{"line", "username", "error"}]}。
+    每块写入后调用 checkpoint(report) 提交（默认直接提交会话），调用方可以借此把
+    进度和这一块的数据放在同一事务中保存。传入上次保存的 report 时从中断处继续：
+    前 report["total"] 行已经处理过，只重新校验以恢复文件内的查重状态。
+    """
+    if report is None:
+        report = {"total": 0, "created": 0, "failed": 0, "errors": []}
+    else:
+        report = {**report, "errors": list(report["errors"])}
+    checkpoint = checkpoint or (lambda _: db.session.commit())
+    seen_usernames, seen_emails = set(), set()
+    rows = iter(rows)
+    for _, raw in islice(rows, report["total"]):
+        row = _normalize_import_row(raw)
+        if _validate_import_row(row, seen_usernames, seen_emails) is None:
+            seen_usernames.add(row["username"])
+            seen_emails.add(row["email"])
+
+    while True:
+        batch = list(islice(rows, chunk_size))
+        if not batch:
+            break
+        chunk = []
+        for line, raw in batch:
+            report["total"] += 1
+            row = _normalize_import_row(raw)
+            row["ref"] = {"line": line, "username": row["username"]}
+            error = _validate_import_row(row, seen_usernames, seen_emails)
+            if error:
+                report["errors"].append({**row["ref"], "error": error})
+                continue
+            seen_usernames.add(row["username"])
+            seen_emails.add(row["email"])
+            chunk.append(row)
+
+        # 检查和插入之间可能有并发注册导致唯一约束冲突，回滚后重新检查冲突再试一次
+        for _ in range(2 if chunk else 0):
+            chunk_errors = []
+            try:
+                report["created"] += _insert_chunk(chunk, chunk_errors)
+                break
+            except IntegrityError:
+                db.session.rollback()
+        else:
+            chunk_errors = [
+                {**row["ref"], "error": "conflict while inserting"} for row in chunk
+            ]
+        report["errors"].extend(chunk_errors)
+        report["failed"] = len(report["errors"])
+        checkpoint(report)
+
+    report["failed"] = len(report["errors"])
+    report["errors"].sort(key=lambda e: e["line"])
+    return report
@@ -0,0 +1,74 @@
+"""并发登录吞吐量：pytest -m benchmark -s tests/benchmarks/test_login_throughput.py
+
+BENCH_LOGIN_THREADS 个线程持续登录 BENCH_LOGIN_SECONDS 秒，分别在单线程哈希池和
+PASSWORD_HASH_WORKERS 配置的哈希池下统计每秒登录数；哈希算法由 BENCH_HASHER 指定。
+"""
+
+import os
+import threading
+import time
+import pytest
+from conftest import make_app
+from extensions import db
+from models import User
+from utils.security import hash_passwords
+
+pytestmark = pytest.mark.benchmark
+
+THREADS = int(os.environ.get("BENCH_LOGIN_THREADS", 16))
+SECONDS = float(os.environ.get("BENCH_LOGIN_SECONDS", 5))
+HASHER = os.environ.get("BENCH_HASHER", "pbkdf2_sha256")
+
+
+def _run(app):
+    with app.app_context():
+        hashes = hash_passwords(["secret"] * THREADS)
+        db.session.add_all(
+            User(username=f"bench{i}", email=f"bench{i}@test.local", password_hash=pw)
+            for i, pw in enumerate(hashes)
+        )
+        db.session.commit()
+
+    statuses = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + SECONDS
+
+    def login(i):
+        client = app.test_client()
+        seen = []
+        while time.perf_counter() < deadline:
+            response = client.post(
+                "/api/auth/login", json={"username": f"bench{i}", "password": "secret"}
+            )
+            seen.append(response.status_code)
+        with lock:
+            statuses.extend(seen)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=login, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    with app.app_context():
+        db.engine.dispose()
+    return statuses, elapsed
+
+
+@pytest.mark.parametrize(
+    "workers", [1, int(os.environ.get("PASSWORD_HASH_WORKERS", 4))]
+)
+def test_login_throughput(tmp_path, workers):
+    app = make_app(tmp_path, PASSWORD_HASHER=HASHER, PASSWORD_HASH_WORKERS=workers)
+    statuses, elapsed = _run(app)
+
+    ok = statuses.count(200)
+    busy = statuses.count(503)
+    print(
+        f"\n{HASHER} workers={workers} threads={THREADS}: "
+        f"{ok / elapsed:.1f} logins/s, {busy} rejected with 503 ({os.cpu_count()} CPUs)"
+    )
+    # 超出哈希队列只允许返回 503，不应出现其他错误
+    assert ok > 0
+    assert set(statuses) <= {200, 503}
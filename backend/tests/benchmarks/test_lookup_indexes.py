@@ -0,0 +1,135 @@
+"""组合索引前后的热点查询耗时：pytest -m benchmark -s tests/benchmarks/test_lookup_indexes.py
+
+在 SQLite 中写入 BENCH_INDEX_ROWS 场面试（每场 5 道题、一半有评价），先在有索引时
+执行面试列表、题目列表和评价查询，再删除迁移 c3e1f7a2b9d4 的索引后重复，
+输出两次的平均耗时和查询计划。
+"""
+
+import os
+import random
+import time
+from datetime import datetime, timedelta
+import pytest
+import sqlalchemy as sa
+from conftest import create_schema
+from extensions import db
+
+pytestmark = pytest.mark.benchmark
+
+ROWS = int(os.environ.get("BENCH_INDEX_ROWS", 200_000))
+REPEAT = 200
+
+INDEXES = (
+    "ix_interviews_interviewer_status_created",
+    "ix_interviews_interviewee_status_created",
+    "ix_interview_questions_interview_order",
+    "ix_interview_evaluations_interview_id",
+)
+
+QUERIES = {
+    "interviewer list": (
+        "SELECT id FROM interviews WHERE interviewer_id = :user AND status = 'completed' "
+        "ORDER BY created_at DESC, id DESC LIMIT 20"
+    ),
+    "interviewee list": (
+        "SELECT id FROM interviews WHERE interviewee_id = :user AND status = 'completed' "
+        "ORDER BY created_at DESC, id DESC LIMIT 20"
+    ),
+    "questions": (
+        "SELECT id FROM interview_questions WHERE interview_id = :interview "
+        "ORDER BY order_index"
+    ),
+    "evaluation": "SELECT id FROM interview_evaluations WHERE interview_id = :interview",
+}
+
+
+def _seed(conn):
+    # 用 Core insert 而不是原始 SQL，列的 Python 端默认值照常生效
+    tables = db.metadata.tables
+    rng = random.Random(0)
+    now = datetime.utcnow()
+    conn.execute(
+        tables["question_bank"].insert(),
+        {"id": 1, "content_hash": "x", "question_text": "q", "question_type": "text"},
+    )
+    statuses = ("assigned", "in_progress", "completed")
+    conn.execute(
+        tables["interviews"].insert(),
+        [
+            {
+                "id": i,
+                "title": "t",
+                "job_requirement_id": 1,
+                "interviewer_id": rng.randrange(1, 200),
+                "interviewee_id": rng.randrange(200, ROWS // 5 + 201),
+                "status": rng.choice(statuses),
+                "created_at": now - timedelta(minutes=i),
+            }
+            for i in range(1, ROWS + 1)
+        ],
+    )
+    conn.execute(
+        tables["interview_questions"].insert(),
+        [
+            {"interview_id": i, "bank_question_id": 1, "order_index": order}
+            for i in range(1, ROWS + 1)
+            for order in range(5)
+        ],
+    )
+    conn.execute(
+        tables["interview_evaluations"].insert(),
+        [{"interview_id": i, "evaluator_id": 1} for i in range(1, ROWS + 1, 2)],
+    )
+
+
+def _measure(conn):
+    rng = random.Random(1)
+    params = [
+        {"user": rng.randrange(1, 200), "interview": rng.randrange(1, ROWS + 1)}
+        for _ in range(REPEAT)
+    ]
+    results = {}
+    for name, sql in QUERIES.items():
+        statement = sa.text(sql)
+        user = params[0]["user"] if name == "interviewer list" else 200
+        plan = conn.execute(
+            sa.text(f"EXPLAIN QUERY PLAN {sql}"), {"user": user, "interview": 1}
+        ).all()
+        started = time.perf_counter()
+        for values in params:
+            if name == "interviewee list":
+                values = {**values, "user": values["user"] + 200}
+            conn.execute(statement, values).all()
+        elapsed = (time.perf_counter() - started) / REPEAT
+        results[name] = (elapsed, " / ".join(row[-1] for row in plan))
+    return results
+
+
+def test_lookup_indexes(tmp_path):
+    url = f"sqlite:///{tmp_path}/bench.db"
+    create_schema(url)
+    engine = sa.create_engine(url)
+    with engine.begin() as conn:
+        _seed(conn)
+        conn.exec_driver_sql("ANALYZE")
+
+    with engine.connect() as conn:
+        indexed = _measure(conn)
+    with engine.begin() as conn:
+        for index in INDEXES:
+            conn.exec_driver_sql(f"DROP INDEX {index}")
+    with engine.connect() as conn:
+        plain = _measure(conn)
+    engine.dispose()
+
+    print(f"\n{ROWS} interviews, {ROWS * 5} questions, avg of {REPEAT} queries")
+    for name in QUERIES:
+        print(
+            f"{name:>16}: {indexed[name][0] * 1000:8.3f} ms with indexes, "
+            f"{plain[name][0] * 1000:8.3f} ms without"
+        )
+        print(f"{'':>16}  plan: {indexed[name][1]}")
+    # 每个热点查询都走组合索引；interviewee_id 上另有单列索引，只比较总耗时
+    for _, plan in indexed.values():
+        assert any(index in plan for index in INDEXES), plan
+    assert sum(t for t, _ in indexed.values()) < sum(t for t, _ in plain.values())
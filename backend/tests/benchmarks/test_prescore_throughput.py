@@ -0,0 +1,74 @@
+"""相似度预评分吞吐量：pytest -m benchmark -s tests/benchmarks/test_prescore_throughput.py
+
+BENCH_PRESCORE_ROWS 个约 60 词的文本/代码答案，分别在调用线程内计算和按
+PRESCORE_CHUNK_SIZE 分块交给 BENCH_PRESCORE_WORKERS 个进程计算，输出每秒答案数。
+"""
+
+import os
+import random
+import time
+import pytest
+from conftest import make_app
+from extensions import db
+from services.prescoring_service import compute_features
+from utils.similarity import FEATURES_VERSION, similarity_batch
+
+pytestmark = pytest.mark.benchmark
+
+ROWS = int(os.environ.get("BENCH_PRESCORE_ROWS", 5000))
+WORKERS = int(os.environ.get("BENCH_PRESCORE_WORKERS", os.cpu_count() or 2))
+
+WORDS = (
+    "索引 事务 缓存 并发 锁 线程 进程 队列 哈希 分页 查询 连接 主键 回滚 "
+    "index transaction cache latency throughput replica shard commit rollback"
+).split()
+
+CODE = """def {name}(items):
+    result = []
+    for item in items:
+        if item {op} {limit}:
+            result.append(item * {factor})
+    return sorted(result)
+"""
+
+
+def _rows():
+    rng = random.Random(0)
+    rows = []
+    for i in range(ROWS):
+        if i % 4 == 0:
+            reference = CODE.format(name="keep", op=">", limit=3, factor=2)
+            answer = CODE.format(
+                name=f"f{i}", op=rng.choice("<>"), limit=rng.randrange(9), factor=2
+            )
+            rows.append((i, "code", reference, answer))
+        else:
+            reference = " ".join(rng.choices(WORDS, k=60))
+            answer = " ".join(rng.choices(WORDS, k=60))
+            rows.append((i, "text", reference, answer))
+    return rows
+
+
+def test_prescore_throughput(tmp_path):
+    rows = _rows()
+    started = time.perf_counter()
+    inline = similarity_batch(rows)
+    inline_seconds = time.perf_counter() - started
+
+    app = make_app(tmp_path, PRESCORE_WORKERS=WORKERS)
+    with app.app_context():
+        # 先分发一次，让子进程启动和导入不计入耗时
+        compute_features(rows[: app.config.get("PRESCORE_CHUNK_SIZE", 200) + 1])
+        started = time.perf_counter()
+        pooled = compute_features(rows)
+        pooled_seconds = time.perf_counter() - started
+        db.engine.dispose()
+
+    print(
+        f"\n{ROWS} answers: inline {ROWS / inline_seconds:.0f}/s, "
+        f"{WORKERS} processes {ROWS / pooled_seconds:.0f}/s "
+        f"({os.cpu_count()} CPUs)"
+    )
+    # 进程池的结果与同步计算一致
+    assert pooled == inline
+    assert all(features["version"] == FEATURES_VERSION for _, features in inline)
@@ -0,0 +1,87 @@
+"""简历全文检索延迟：pytest -m benchmark -s tests/benchmarks/test_resume_search_latency.py
+
+写入 BENCH_RESUME_ROWS 份随机中英文简历，对比 FTS5 + bm25 检索与对原文 LIKE 过滤
+的单次查询耗时（第一页 20 条，含总数）。
+"""
+
+import os
+import random
+import time
+import pytest
+from conftest import make_app
+from extensions import db
+from models import Resume, User
+from services import resume_service
+from services.resume_service import ResumeService
+from utils.text_search import index_text
+
+pytestmark = pytest.mark.benchmark
+
+ROWS = int(os.environ.get("BENCH_RESUME_ROWS", 20_000))
+SKILLS = (
+    "Python Java Go Rust PostgreSQL Redis Kafka Kubernetes Docker Flask Django "
+    "React 分布式 微服务 高并发 数据库 缓存 消息队列 机器学习 推荐系统 搜索引擎"
+).split()
+QUERIES = ("PostgreSQL", "分布式 缓存", "Kafka 消息队列", "Rust")
+
+
+def _seed(app):
+    rng = random.Random(0)
+    with app.app_context():
+        users = [
+            {
+                "username": f"c{i}",
+                "email": f"c{i}@test.local",
+                "password_hash": "!",
+                "role": "interviewee",
+            }
+            for i in range(ROWS)
+        ]
+        db.session.execute(User.__table__.insert(), users)
+        ids = [
+            row.id
+            for row in db.session.query(User.id).filter(User.role == "interviewee")
+        ]
+        contents = [
+            f"{rng.randrange(1, 10)} 年经验，熟悉 " + "、".join(rng.sample(SKILLS, 5))
+            for _ in ids
+        ]
+        db.session.execute(
+            Resume.__table__.insert(),
+            [
+                {
+                    "user_id": user_id,
+                    "content": content,
+                    "search_tokens": index_text(content),
+                }
+                for user_id, content in zip(ids, contents)
+            ],
+        )
+        db.session.commit()
+        ResumeService.reindex_all()
+
+
+def _latency(app):
+    with app.app_context():
+        started = time.perf_counter()
+        totals = [ResumeService.search_resumes(q)[1] for q in QUERIES]
+        return (time.perf_counter() - started) / len(QUERIES), totals
+
+
+def test_resume_search_latency(tmp_path, monkeypatch):
+    app = make_app(tmp_path)
+    _seed(app)
+    fts, fts_totals = _latency(app)
+    with app.app_context():
+        url = str(db.engine.url)
+    # 关闭 FTS，检索退化为 LIKE
+    monkeypatch.setitem(resume_service._fts_tables, url, False)
+    like, like_totals = _latency(app)
+    with app.app_context():
+        db.engine.dispose()
+
+    print(
+        f"\n{ROWS} resumes: FTS5 {fts * 1000:.1f} ms/query, "
+        f"LIKE {like * 1000:.1f} ms/query"
+    )
+    assert fts_totals == like_totals and all(fts_totals)
@@ -0,0 +1,85 @@
+"""响应序列化：pytest -m benchmark -s tests/benchmarks/test_serialization_speed.py
+
+对比手写 to_dict + json.dumps（改造前）与编译的序列化函数 + utils.serialization.dumps，
+题目数由 BENCH_SERIALIZE_ROWS 指定。
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+import pytest
+from models import BankQuestion, InterviewQuestion
+from utils.serialization import dumps, loads
+
+pytestmark = pytest.mark.benchmark
+
+ROWS = int(os.environ.get("BENCH_SERIALIZE_ROWS", 5000))
+
+
+def _legacy_dict(q):
+    # 改造前 InterviewQuestion.to_dict 的写法
+    return {
+        "id": q.id,
+        "interview_id": q.interview_id,
+        "question_text": q.question_text,
+        "question_type": q.question_type,
+        "options": q.options,
+        "reference_answer": q.reference_answer,
+        "score": q.score,
+        "order_index": q.order_index,
+        "candidate_answer": q.candidate_answer,
+        "actual_score": q.actual_score,
+        "comments": q.comments,
+        "created_at": q.created_at.isoformat() if q.created_at else None,
+        "updated_at": q.updated_at.isoformat() if q.updated_at else None,
+    }
+
+
+def _best(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def test_question_serialization_speed(app):
+    now = datetime.utcnow()
+    with app.app_context():
+        questions = [
+            InterviewQuestion(
+                id=i,
+                interview_id=i // 10,
+                bank_question=BankQuestion(
+                    question_text=f"第 {i} 题：解释 Python 的 GIL",
+                    question_type="single_choice",
+                    options=["A", "B", "C", "D"],
+                    reference_answer="B",
+                ),
+                score=10,
+                order_index=i % 10,
+                candidate_answer="B",
+                actual_score=10,
+                comments="回答正确",
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(ROWS)
+        ]
+        legacy = _best(
+            lambda: json.dumps(
+                {"data": [_legacy_dict(q) for q in questions]}, ensure_ascii=False
+            ).encode("utf-8")
+        )
+        current = _best(lambda: dumps({"data": [q.to_dict() for q in questions]}))
+
+    print(
+        f"\n{ROWS} questions: to_dict+json.dumps {legacy * 1000:.1f} ms, "
+        f"compiled serializer+dumps {current * 1000:.1f} ms"
+    )
+    # 输出的日期格式与改造前一致
+    encoded = loads(dumps(questions[0].to_dict()))
+    assert encoded["created_at"].startswith(now.isoformat()[:19])
+    assert current < legacy
@@ -0,0 +1,88 @@
+import pytest
+import sqlalchemy as sa
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+from config import Config
+from extensions import db
+import models  # noqa: F401  注册全部模型
+
+
+class TestConfig(Config):
+    TESTING = True
+    # 应用启动时会创建超级管理员，scrypt 比默认的 PBKDF2 快得多
+    PASSWORD_HASHER = "scrypt"
+    CACHE_BACKEND = "memory"
+    # 用户缓存是进程级的，各测试的库中用户ID会重复
+    USER_CACHE_TTL = 0
+    PRESCORE_WORKERS = 0
+    TASK_QUEUE_ENABLED = False
+    DATABASE_REPLICA_URLS = ""
+
+
+def create_schema(url):
+    """按模型建表（测试不跑迁移）；简历全文索引虚拟表由应用启动时创建"""
+    engine = sa.create_engine(url)
+    db.metadata.create_all(engine)
+    engine.dispose()
+
+
+def make_app(tmp_path, **overrides):
+    """以 tmp_path 下的 SQLite 文件为主库创建应用，overrides 覆盖配置项"""
+    from app import create_app
+
+    overrides.setdefault("SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path}/app.db")
+    create_schema(overrides["SQLALCHEMY_DATABASE_URI"])
+    config = type("Config", (TestConfig,), overrides)
+    return create_app(config)
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = make_app(tmp_path)
+    yield app
+    with app.app_context():
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def make_user(app):
+    """创建用户，返回 (用户ID, 请求头)；密码哈希无关紧要，令牌直接签发"""
+
+    def make(username, role="interviewee"):
+        with app.app_context():
+            user = models.User(
+                username=username,
+                email=f"{username}@test.local",
+                password_hash="!",
+                role=role,
+            )
+            db.session.add(user)
+            db.session.commit()
+            token = create_access_token(
+                identity=str(user.id), additional_claims={"role": role}
+            )
+            return user.id, {"Authorization": f"Bearer {token}"}
+
+    return make
+
+
+@pytest.fixture
+def queries(app):
+    """记录默认库上执行的 SQL 语句"""
+    statements = []
+    with app.app_context():
+        engine = db.engine
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
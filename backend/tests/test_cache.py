@@ -0,0 +1,56 @@
+import fnmatch
+from datetime import datetime
+import pytest
+from utils.cache import Cache, MemoryBackend, RedisBackend
+
+CREATED_AT = datetime(2026, 10, 18, 9, 30, 15)
+
+
+class DictRedis:
+    """RedisBackend 用到的 Redis 命令的字典实现（不处理过期）"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value if isinstance(value, bytes) else str(value).encode()
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, b"0")) + 1).encode()
+
+    def scan_iter(self, match="*", count=None):
+        return [key for key in list(self.data) if fnmatch.fnmatch(key, match)]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+@pytest.mark.parametrize(
+    "backend", [MemoryBackend(), RedisBackend(DictRedis())], ids=["memory", "redis"]
+)
+def test_cached_values_have_the_same_types_on_every_backend(app, backend):
+    cache = Cache(backend)
+
+    @cache.memoize("jobs")
+    def get_job():
+        return {"id": 1, "created_at": CREATED_AT}
+
+    with app.test_request_context():
+        miss, hit = get_job(), get_job()
+    assert miss == hit == {"id": 1, "created_at": CREATED_AT.isoformat()}
+    assert cache.stats() == {"jobs": {"hits": 1, "misses": 1, "hit_rate": 0.5}}
+
+
+def test_cache_stats_route(client, make_user):
+    _, admin = make_user("admin", "admin")
+    client.get("/api/jobs/")
+    client.get("/api/jobs/")
+    response = client.get("/api/system/cache", headers=admin)
+    assert response.status_code == 200
+    data = response.json["data"]
+    assert data["backend"] == "MemoryBackend"
+    assert data["namespaces"]["jobs"]["hits"] >= 1
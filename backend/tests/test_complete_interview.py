@@ -0,0 +1,91 @@
+import pytest
+from sqlalchemy import event
+from conftest import make_app
+from extensions import db
+from models import BackgroundTask, Interview, InterviewQuestion, JobRequirement
+from services.question_bank_service import QuestionBankService
+from utils.db_routing import RoutingSession
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = make_app(tmp_path, TASK_QUEUE_ENABLED=True)
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+def _interview_in_progress(app, interviewer_id, interviewee_id):
+    with app.app_context():
+        job = JobRequirement(job_title="后端开发")
+        db.session.add(job)
+        db.session.flush()
+        interview = Interview(
+            title="一面",
+            job_requirement_id=job.id,
+            interviewer_id=interviewer_id,
+            interviewee_id=interviewee_id,
+            status="in_progress",
+        )
+        db.session.add(interview)
+        db.session.flush()
+        choice_id, text_id = QuestionBankService.intern_questions(
+            [
+                {
+                    "question_text": "Python 中哈希表对应的类型",
+                    "question_type": "single_choice",
+                    "options": ["list", "dict"],
+                    "reference_answer": "dict",
+                },
+                {"question_text": "解释 GIL", "reference_answer": "全局解释器锁"},
+            ]
+        )
+        db.session.add_all(
+            [
+                InterviewQuestion(
+                    interview_id=interview.id,
+                    bank_question_id=choice_id,
+                    order_index=1,
+                    candidate_answer="B",
+                ),
+                InterviewQuestion(
+                    interview_id=interview.id,
+                    bank_question_id=text_id,
+                    order_index=2,
+                    candidate_answer="全局解释器锁",
+                ),
+            ]
+        )
+        db.session.commit()
+        return interview.id
+
+
+def test_prescore_task_commits_with_status_change(app, client, make_user):
+    interviewer_id, _ = make_user("interviewer", "interviewer")
+    candidate_id, headers = make_user("candidate")
+    interview_id = _interview_in_progress(app, interviewer_id, candidate_id)
+
+    commits = []
+
+    def record(session):
+        commits.append(session)
+
+    event.listen(RoutingSession, "after_commit", record)
+    try:
+        response = client.post(
+            f"/api/interviews/{interview_id}/complete", headers=headers
+        )
+    finally:
+        event.remove(RoutingSession, "after_commit", record)
+
+    assert response.status_code == 200
+    # 状态变更、选择题得分和预评分任务在同一个事务中提交
+    assert len(commits) == 1
+    with app.app_context():
+        assert db.session.get(Interview, interview_id).status == "pending_evaluation"
+        task = BackgroundTask.query.filter_by(name="prescore_interview").one()
+        assert task.payload == {"interview_id": interview_id}
+        assert task.status == "queued"
+        scores = [q.actual_score for q in InterviewQuestion.query.order_by("id")]
+        assert scores == [10, None]
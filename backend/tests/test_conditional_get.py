@@ -0,0 +1,57 @@
+from extensions import db
+from models import Interview, JobRequirement
+
+
+def _interview(app, interviewer_id, interviewee_id):
+    with app.app_context():
+        job = JobRequirement(job_title="后端开发")
+        db.session.add(job)
+        db.session.flush()
+        interview = Interview(
+            title="面试",
+            job_requirement_id=job.id,
+            interviewer_id=interviewer_id,
+            interviewee_id=interviewee_id,
+            status="assigned",
+        )
+        db.session.add(interview)
+        db.session.commit()
+        return interview.id, job.id
+
+
+def test_interview_detail_not_modified_skips_loading(app, client, make_user, queries):
+    interviewer_id, headers = make_user("interviewer", "interviewer")
+    interviewee_id, _ = make_user("candidate")
+    interview_id, job_id = _interview(app, interviewer_id, interviewee_id)
+    url = f"/api/interviews/{interview_id}"
+
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    queries.clear()
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    # 304 只执行版本查询，不加载岗位和用户详情
+    assert not any("job_title" in statement for statement in queries)
+
+    # 岗位信息包含在面试详情中，岗位修改后 ETag 随之变化
+    response = client.put(
+        f"/api/jobs/{job_id}", json={"job_title": "平台开发"}, headers=headers
+    )
+    assert response.status_code == 200
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json["data"]["job_requirement"]["job_title"] == "平台开发"
+
+
+def test_interview_detail_missing_and_forbidden(client, make_user, app):
+    interviewer_id, _ = make_user("interviewer", "interviewer")
+    interviewee_id, _ = make_user("candidate")
+    _, other = make_user("other", "interviewer")
+    interview_id, _ = _interview(app, interviewer_id, interviewee_id)
+
+    assert client.get("/api/interviews/999", headers=other).status_code == 404
+    assert (
+        client.get(f"/api/interviews/{interview_id}", headers=other).status_code == 403
+    )
@@ -0,0 +1,82 @@
+import time
+import pytest
+import sqlalchemy as sa
+from conftest import create_schema, make_app
+from extensions import db
+
+
+@pytest.fixture
+def replica_url(tmp_path):
+    url = f"sqlite:///{tmp_path}/replica.db"
+    create_schema(url)
+    return url
+
+
+@pytest.fixture
+def app(tmp_path, replica_url):
+    app = make_app(
+        tmp_path,
+        DATABASE_REPLICA_URLS=replica_url,
+        REPLICA_STICKY_SECONDS=0.5,
+        REPLICA_CHECK_INTERVAL=0,
+    )
+    yield app
+    with app.app_context():
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+def _seed_replica(url, user_id):
+    """副本中同一用户的用户名与主库不同，用来判断读请求落在哪个库"""
+    engine = sa.create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(
+            sa.text(
+                "INSERT INTO users (id, username, email, password_hash, role) "
+                "VALUES (:id, 'from-replica', 'replica@test.local', '!', 'interviewee')"
+            ),
+            {"id": user_id},
+        )
+    engine.dispose()
+
+
+def _read(client, headers, user_id):
+    response = client.get(f"/api/users/{user_id}", headers=headers)
+    assert response.status_code == 200
+    return response.json["data"]["username"]
+
+
+def test_reads_go_to_replica_and_writers_stick_to_primary(
+    app, client, make_user, replica_url
+):
+    _, writer = make_user("writer", "interviewer")
+    _, reader = make_user("reader", "interviewer")
+    candidate_id, _ = make_user("candidate")
+    _seed_replica(replica_url, candidate_id)
+
+    assert _read(client, writer, candidate_id) == "from-replica"
+
+    response = client.post("/api/jobs/", json={"job_title": "后端开发"}, headers=writer)
+    assert response.status_code == 201
+
+    # 写入后粘滞期内，该用户的读请求走主库；其他用户不受影响
+    assert _read(client, writer, candidate_id) == "candidate"
+    assert _read(client, reader, candidate_id) == "from-replica"
+
+    time.sleep(0.6)
+    assert _read(client, writer, candidate_id) == "from-replica"
+
+
+def test_write_requests_use_primary(app, client, make_user, replica_url):
+    _, headers = make_user("writer", "interviewer")
+    response = client.post(
+        "/api/jobs/", json={"job_title": "后端开发"}, headers=headers
+    )
+    assert response.status_code == 201
+
+    engine = sa.create_engine(replica_url)
+    with engine.connect() as conn:
+        count = conn.execute(sa.text("SELECT count(*) FROM job_requirements")).scalar()
+    engine.dispose()
+    assert count == 0
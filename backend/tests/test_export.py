@@ -0,0 +1,29 @@
+import csv
+import io
+from datetime import datetime
+import pytest
+from utils.export import iter_csv
+
+
+def _rows(rows):
+    text = "".join(iter_csv(["value"], ([value] for value in rows)))
+    return [row[0] for row in csv.reader(io.StringIO(text.lstrip("﻿")))][1:]
+
+
+@pytest.mark.parametrize(
+    "value",
+    ['=HYPERLINK("http://evil","x")', "+1+1", "-2+3", "@SUM(A1)", "\tcmd", "\rcmd"],
+)
+def test_formula_cells_are_escaped(value):
+    assert _rows([value]) == ["'" + value]
+
+
+def test_other_cells_unchanged():
+    assert _rows(["张三", "a=b", -5, 3.5, None, datetime(2026, 1, 2, 3, 4, 5)]) == [
+        "张三",
+        "a=b",
+        "-5",
+        "3.5",
+        "",
+        "2026-01-02 03:04:05",
+    ]
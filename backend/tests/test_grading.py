@@ -0,0 +1,59 @@
+import pytest
+from utils.grading import grade_choice, parse_choices
+
+OPTIONS = ["Use a list", "Use a dict", "Use a set"]
+
+
+@pytest.mark.parametrize(
+    "answer, expected",
+    [
+        ("B", {1}),
+        ("a, c", {0, 2}),
+        ("AC", {0, 2}),
+        ("A、C", {0, 2}),
+        ("Use a dict", {1}),
+        ("use a DICT", {1}),
+        ("Use a list, Use a set", {0, 2}),
+        ("Use a list Use a set", {0, 2}),
+        ("B. Use a dict", {1}),
+        ("b) use a dict", {1}),
+        ("B.", {1}),
+        ("A. Use a list; C. Use a set", {0, 2}),
+    ],
+)
+def test_parse_choices(answer, expected):
+    assert parse_choices(answer, OPTIONS) == frozenset(expected)
+
+
+@pytest.mark.parametrize(
+    "answer", ["D", "Use a tuple", "B. Use a tuple", "Use a list, maybe"]
+)
+def test_parse_choices_unrecognized(answer):
+    assert parse_choices(answer, OPTIONS) is None
+
+
+def test_option_text_containing_separator():
+    options = ["I/O bound", "CPU bound, single core", "CPU bound"]
+    assert parse_choices("CPU bound, single core", options) == frozenset([1])
+    assert parse_choices("i/o bound, cpu bound", options) == frozenset([0, 2])
+
+
+def test_grade_multiple_choice_option_text():
+    reference = "Use a list, Use a set"
+    assert grade_choice("multiple_choice", OPTIONS, reference, reference, 10) == 10
+    assert grade_choice("multiple_choice", OPTIONS, reference, "use a set", 10) == 5
+    assert grade_choice("multiple_choice", OPTIONS, reference, "A, B", 10) == 0
+
+
+def test_grade_single_choice_with_letter_prefix():
+    assert grade_choice("single_choice", OPTIONS, "Use a dict", "B. Use a dict", 5) == 5
+    assert grade_choice("single_choice", OPTIONS, "Use a dict", "use a dict", 5) == 5
+    assert grade_choice("single_choice", OPTIONS, "Use a dict", "A", 5) == 0
+
+
+def test_grade_unanswered_and_unparseable():
+    assert grade_choice("single_choice", OPTIONS, "B", "", 5) == 0
+    assert grade_choice("single_choice", OPTIONS, "B", None, 5) == 0
+    # 无法解析时交给人工评分
+    assert grade_choice("single_choice", OPTIONS, "B", "我选字典", 5) is None
+    assert grade_choice("text", None, "B", "B", 5) is None
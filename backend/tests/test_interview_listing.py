@@ -0,0 +1,97 @@
+from extensions import db
+from models import Interview, JobRequirement
+from services.interview_service import InterviewService
+
+
+def _create_interviews(app, interviewer_id, interviewee_id, count):
+    # 每场面试对应不同的岗位，缺少预加载时懒加载次数随行数增长
+    with app.app_context():
+        jobs = [JobRequirement(job_title="后端开发") for _ in range(count)]
+        db.session.add_all(jobs)
+        db.session.flush()
+        db.session.add_all(
+            Interview(
+                title=f"面试 {i}",
+                job_requirement_id=job.id,
+                interviewer_id=interviewer_id,
+                interviewee_id=interviewee_id,
+                status="assigned",
+            )
+            for i, job in enumerate(jobs)
+        )
+        db.session.commit()
+
+
+def _list_queries(app, queries, interviewer_id):
+    with app.app_context():
+        queries.clear()
+        page, error = InterviewService.get_interviews_by_interviewer(interviewer_id)
+        assert error is None
+        return len(page["items"]), len(queries)
+
+
+def test_listing_query_count_is_constant(app, make_user, queries):
+    interviewer_id, _ = make_user("interviewer", "interviewer")
+    interviewee_id, _ = make_user("candidate")
+
+    _create_interviews(app, interviewer_id, interviewee_id, 3)
+    few = _list_queries(app, queries, interviewer_id)
+    _create_interviews(app, interviewer_id, interviewee_id, 30)
+    many = _list_queries(app, queries, interviewer_id)
+
+    assert few[0] == 3 and many[0] == 33
+    # 岗位、面试官、面试者都随列表一起加载，行数增加不会带来额外查询
+    assert many[1] == few[1]
+
+
+def test_listing_includes_relations(app, make_user):
+    interviewer_id, _ = make_user("interviewer", "interviewer")
+    interviewee_id, _ = make_user("candidate")
+    _create_interviews(app, interviewer_id, interviewee_id, 1)
+
+    with app.app_context():
+        page, _ = InterviewService.get_interviews_by_interviewer(interviewer_id)
+    item = page["items"][0]
+    assert item["job_requirement"]["job_title"] == "后端开发"
+    assert item["interviewer"]["username"] == "interviewer"
+    assert item["interviewee"]["username"] == "candidate"
+
+
+def _walk(client, url, headers, limit):
+    """按 next_cursor 翻完所有页，返回 (各页的 ID 列表)"""
+    pages, cursor = [], None
+    while True:
+        query = f"?limit={limit}" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url + query, headers=headers)
+        assert response.status_code == 200
+        pages.append([item["id"] for item in response.json["data"]])
+        cursor = response.json["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_cursor_pagination_round_trip(app, client, make_user):
+    interviewer_id, interviewer = make_user("interviewer", "interviewer")
+    interviewee_id, interviewee = make_user("candidate")
+    _create_interviews(app, interviewer_id, interviewee_id, 5)
+    with app.app_context():
+        # created_at 相同的行按 id 区分先后，翻页时不重复也不遗漏
+        Interview.query.update({"created_at": Interview.query.first().created_at})
+        db.session.commit()
+        expected = [i.id for i in Interview.query.order_by(Interview.id.desc()).all()]
+
+    for url, headers in (
+        ("/api/interviews/", interviewer),
+        ("/api/interviews/my-interviews", interviewee),
+    ):
+        pages = _walk(client, url, headers, 2)
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [i for page in pages for i in page] == expected
+
+
+def test_invalid_cursor_is_rejected(client, make_user):
+    _, interviewer = make_user("interviewer", "interviewer")
+    response = client.get("/api/interviews/?limit=2&cursor=bogus", headers=interviewer)
+    assert response.status_code == 400
+    response = client.get("/api/interviews/?limit=0", headers=interviewer)
+    assert response.status_code == 400
@@ -0,0 +1,111 @@
+from extensions import db
+from models import Interview, InterviewQuestion, JobRequirement
+
+
+def _interview(app, interviewer_id, interviewee_id, status="draft"):
+    with app.app_context():
+        job = JobRequirement(job_title="后端开发")
+        db.session.add(job)
+        db.session.flush()
+        interview = Interview(
+            title="面试",
+            job_requirement_id=job.id,
+            interviewer_id=interviewer_id,
+            interviewee_id=interviewee_id,
+            status=status,
+        )
+        db.session.add(interview)
+        db.session.commit()
+        return interview.id
+
+
+def _question(i, **extra):
+    return {"question_text": f"第 {i} 题", "question_type": "text", **extra}
+
+
+def test_bulk_add_is_atomic_and_changes_questions_etag(app, client, make_user):
+    interviewer_id, headers = make_user("interviewer", "interviewer")
+    interviewee_id, _ = make_user("candidate")
+    interview_id = _interview(app, interviewer_id, interviewee_id)
+    url = f"/api/interviews/{interview_id}/questions"
+
+    response = client.get(url, headers=headers)
+    etag = response.headers["ETag"]
+    assert (
+        client.get(url, headers={**headers, "If-None-Match": etag}).status_code == 304
+    )
+
+    # 有一道题无效时整批拒绝
+    bad = [_question(1), {"question_type": "text"}]
+    response = client.post(f"{url}/bulk", json={"questions": bad}, headers=headers)
+    assert response.status_code == 400
+    with app.app_context():
+        assert InterviewQuestion.query.count() == 0
+
+    questions = [_question(i, score=5) for i in range(3)]
+    response = client.post(
+        f"{url}/bulk", json={"questions": questions}, headers=headers
+    )
+    assert response.status_code == 201
+    assert [q["order_index"] for q in response.json["data"]] == [1, 2, 3]
+
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert [q["question_text"] for q in response.json["data"]] == [
+        "第 0 题",
+        "第 1 题",
+        "第 2 题",
+    ]
+
+
+def test_batched_answers_only_write_changes(app, client, make_user):
+    interviewer_id, interviewer = make_user("interviewer", "interviewer")
+    interviewee_id, candidate = make_user("candidate")
+    _, stranger = make_user("stranger")
+    interview_id = _interview(app, interviewer_id, interviewee_id, status="assigned")
+    url = f"/api/interviews/{interview_id}"
+    response = client.post(
+        f"{url}/questions/bulk",
+        json={"questions": [_question(i) for i in range(2)]},
+        headers=interviewer,
+    )
+    first, second = [q["id"] for q in response.json["data"]]
+
+    answers = {str(first): "答案一", str(second): "答案二"}
+    response = client.post(
+        f"{url}/answers", json={"answers": answers}, headers=candidate
+    )
+    assert response.status_code == 200
+    assert response.json["data"] == {"changed": [first, second], "unchanged": []}
+
+    etag = client.get(f"{url}/questions", headers=candidate).headers["ETag"]
+    answers[str(second)] = "新答案"
+    response = client.post(
+        f"{url}/answers", json={"answers": answers}, headers=candidate
+    )
+    assert response.json["data"] == {"changed": [second], "unchanged": [first]}
+    response = client.get(
+        f"{url}/questions", headers={**candidate, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+
+    # 重复提交相同答案不写库，题目列表仍然是 304
+    etag = response.headers["ETag"]
+    response = client.post(
+        f"{url}/answers", json={"answers": answers}, headers=candidate
+    )
+    assert response.json["data"]["changed"] == []
+    response = client.get(
+        f"{url}/questions", headers={**candidate, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    for headers, payload in (
+        (stranger, answers),
+        (candidate, {"999": "不属于该面试"}),
+        (candidate, {str(first): ""}),
+    ):
+        response = client.post(
+            f"{url}/answers", json={"answers": payload}, headers=headers
+        )
+        assert response.status_code == 400
@@ -0,0 +1,68 @@
+from extensions import db
+from models import Interview, InterviewEvaluation, JobRequirement
+
+SCORES = [(90, True), (80, True), (80, False), (60, False)]
+
+
+def _evaluated_job(app, interviewer_id, make_user):
+    with app.app_context():
+        job = JobRequirement(job_title="后端开发")
+        db.session.add(job)
+        db.session.commit()
+        job_id = job.id
+    for i, (score, passed) in enumerate(SCORES):
+        interviewee_id, _ = make_user(f"candidate{i}")
+        with app.app_context():
+            interview = Interview(
+                title=f"面试 {i}",
+                job_requirement_id=job_id,
+                interviewer_id=interviewer_id,
+                interviewee_id=interviewee_id,
+                status="completed",
+            )
+            db.session.add(interview)
+            db.session.flush()
+            db.session.add(
+                InterviewEvaluation(
+                    interview_id=interview.id,
+                    evaluator_id=interviewer_id,
+                    total_score=score,
+                    max_score=100,
+                    is_passed=passed,
+                    is_finalized=True,
+                )
+            )
+            db.session.commit()
+    return job_id
+
+
+def test_leaderboard_ranks_ties_and_pages(app, client, make_user):
+    interviewer_id, headers = make_user("interviewer", "interviewer")
+    job_id = _evaluated_job(app, interviewer_id, make_user)
+    url = f"/api/jobs/{job_id}/leaderboard"
+
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200
+    rows = [
+        (r["username"], r["percentage"], r["rank"], r["dense_rank"], r["percentile"])
+        for r in response.json["data"]
+    ]
+    assert rows == [
+        ("candidate0", 90.0, 1, 1, 100.0),
+        ("candidate1", 80.0, 2, 2, 75.0),
+        ("candidate2", 80.0, 2, 2, 75.0),
+        ("candidate3", 60.0, 4, 3, 25.0),
+    ]
+
+    page = client.get(f"{url}?page=2&per_page=2", headers=headers).json
+    assert page["total"] == 4
+    assert [r["username"] for r in page["data"]] == ["candidate2", "candidate3"]
+
+    # 过滤在排名之前进行，排名只在通过的候选人中计算
+    passed = client.get(f"{url}?is_passed=true", headers=headers).json
+    assert [(r["username"], r["rank"]) for r in passed["data"]] == [
+        ("candidate0", 1),
+        ("candidate1", 2),
+    ]
+    assert client.get(f"{url}?is_passed=maybe", headers=headers).status_code == 400
+    assert client.get("/api/jobs/999/leaderboard", headers=headers).status_code == 404
@@ -0,0 +1,84 @@
+from datetime import timedelta
+import pytest
+from conftest import make_app
+from extensions import db
+from models import Resume
+from services.matching_service import MatchingEngine
+from utils.text_search import tokenize
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = make_app(tmp_path, MATCHING_SYNC_INTERVAL=0, MATCHING_SYNC_OVERLAP=60)
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def engine():
+    return MatchingEngine()
+
+
+def _add_resume(app, user_id, content, updated_at=None):
+    with app.app_context():
+        resume = Resume(user_id=user_id, content=content)
+        db.session.add(resume)
+        db.session.commit()
+        if updated_at is not None:
+            resume.updated_at = updated_at
+            db.session.commit()
+        return resume.id, resume.updated_at
+
+
+def _ranked(app, engine, query):
+    with app.app_context():
+        return [doc_id for doc_id, _, _ in engine.rank_resumes(tokenize(query), 10)]
+
+
+def test_late_commit_with_older_timestamp_is_indexed(app, engine, make_user):
+    first, _ = make_user("first")
+    late, _ = make_user("late")
+    first_id, watermark = _add_resume(app, first, "python flask")
+    assert _ranked(app, engine, "python") == [first_id]
+
+    # 事务在水位线之前 flush、之后才提交：updated_at 早于水位线
+    late_id, _ = _add_resume(
+        app, late, "golang kubernetes", watermark - timedelta(seconds=5)
+    )
+    assert _ranked(app, engine, "golang") == [late_id]
+
+
+def test_late_update_with_older_timestamp_is_reindexed(app, engine, make_user):
+    user_id, _ = make_user("candidate")
+    other, _ = make_user("other")
+    resume_id, _ = _add_resume(app, user_id, "python flask")
+    _, watermark = _add_resume(app, other, "java spring")
+    assert _ranked(app, engine, "rust") == []
+
+    with app.app_context():
+        resume = db.session.get(Resume, resume_id)
+        resume.content = "rust tokio"
+        db.session.commit()
+        resume.updated_at = watermark - timedelta(seconds=5)
+        db.session.commit()
+    # 行数没变，只有重新扫描重叠窗口才能发现这次修改
+    assert _ranked(app, engine, "rust") == [resume_id]
+
+
+def test_deletes_are_reconciled_without_rebuild(app, engine, make_user, monkeypatch):
+    first, _ = make_user("first")
+    second, _ = make_user("second")
+    first_id, _ = _add_resume(app, first, "python flask")
+    second_id, _ = _add_resume(app, second, "python django")
+    assert sorted(_ranked(app, engine, "python")) == [first_id, second_id]
+
+    def fail():
+        raise AssertionError("full rebuild in the request path")
+
+    monkeypatch.setattr(engine.resumes, "rebuild", fail)
+    with app.app_context():
+        db.session.delete(db.session.get(Resume, first_id))
+        db.session.commit()
+    assert _ranked(app, engine, "python") == [second_id]
@@ -0,0 +1,54 @@
+from contextlib import contextmanager
+import pytest
+from conftest import make_app
+from extensions import db
+from utils.db_pool import TimedQueuePool
+
+
+@pytest.fixture
+def app(tmp_path):
+    # 只有一个连接且不等待的连接池，测试中占住它来模拟连接池耗尽
+    # 与生产环境一致不向外抛出异常，否则 flask-restx 会把异常交给 Flask 的错误处理器
+    app = make_app(
+        tmp_path,
+        PROPAGATE_EXCEPTIONS=False,
+        SQLALCHEMY_ENGINE_OPTIONS={
+            "poolclass": TimedQueuePool,
+            "pool_size": 1,
+            "max_overflow": 0,
+            "pool_timeout": 0.05,
+            "connect_args": {"check_same_thread": False},
+        },
+    )
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@contextmanager
+def exhausted(app):
+    with app.app_context():
+        conn = db.engine.connect()
+    try:
+        yield
+    finally:
+        conn.close()
+
+
+def test_api_route_returns_503(app, client, make_user):
+    _, headers = make_user("interviewer", "interviewer")
+    with exhausted(app):
+        response = client.get("/api/jobs/1", headers=headers)
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_service_does_not_swallow_pool_timeout(app, client, make_user):
+    _, headers = make_user("candidate")
+    with exhausted(app):
+        response = client.post("/api/interviews/1/start", headers=headers)
+    # 以前服务层把超时当作普通数据库错误返回 400
+    assert response.status_code == 503
+    with app.app_context():
+        assert db.engine.pool.metrics.timeouts == 1
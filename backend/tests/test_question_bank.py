@@ -0,0 +1,95 @@
+from extensions import db
+from models import Interview, InterviewQuestion, JobRequirement
+from services.question_bank_service import QuestionBankService
+
+QUESTION = {
+    "question_text": "Python 中哈希表对应的类型",
+    "question_type": "single_choice",
+    "options": ["list", "dict"],
+    "reference_answer": "dict",
+}
+
+
+def _setup(app, interviewer_id, interviewee_id, statuses):
+    """为每个状态创建一场面试，都引用同一道题库题目，返回 (题库ID, {状态: 面试题目ID})"""
+    with app.app_context():
+        job = JobRequirement(job_title="后端开发")
+        db.session.add(job)
+        db.session.flush()
+        (bank_id,) = QuestionBankService.intern_questions([QUESTION])
+        rows = {}
+        for status in statuses:
+            interview = Interview(
+                title=status,
+                job_requirement_id=job.id,
+                interviewer_id=interviewer_id,
+                interviewee_id=interviewee_id,
+                status=status,
+            )
+            db.session.add(interview)
+            db.session.flush()
+            rows[status] = InterviewQuestion(
+                interview_id=interview.id,
+                bank_question_id=bank_id,
+                candidate_answer="dict",
+                actual_score=10,
+            )
+            db.session.add(rows[status])
+        db.session.commit()
+        return bank_id, {status: row.id for status, row in rows.items()}
+
+
+def _bank_id(app, question_id):
+    with app.app_context():
+        return db.session.get(InterviewQuestion, question_id).bank_question_id
+
+
+def test_edit_without_submitted_interviews_is_in_place(app, client, make_user):
+    interviewer_id, _ = make_user("interviewer", "interviewer")
+    candidate_id, _ = make_user("candidate")
+    _, admin = make_user("root", "admin")
+    bank_id, rows = _setup(app, interviewer_id, candidate_id, ["assigned"])
+
+    response = client.put(
+        f"/api/question-bank/{bank_id}",
+        json={"reference_answer": "list"},
+        headers=admin,
+    )
+    assert response.status_code == 200
+    assert response.json["data"]["id"] == bank_id
+    assert _bank_id(app, rows["assigned"]) == bank_id
+
+
+def test_edit_keeps_submitted_interviews_unchanged(app, client, make_user):
+    interviewer_id, _ = make_user("interviewer", "interviewer")
+    candidate_id, _ = make_user("candidate")
+    _, admin = make_user("root", "admin")
+    bank_id, rows = _setup(
+        app, interviewer_id, candidate_id, ["assigned", "in_progress", "completed"]
+    )
+
+    response = client.put(
+        f"/api/question-bank/{bank_id}",
+        json={"reference_answer": "list"},
+        headers=admin,
+    )
+    assert response.status_code == 200
+    new_id = response.json["data"]["id"]
+    assert new_id != bank_id
+    assert response.json["data"]["reference_answer"] == "list"
+
+    # 已完成的面试仍引用原题，参考答案与自动评分一致
+    assert _bank_id(app, rows["completed"]) == bank_id
+    assert _bank_id(app, rows["assigned"]) == new_id
+    assert _bank_id(app, rows["in_progress"]) == new_id
+    with app.app_context():
+        completed = db.session.get(InterviewQuestion, rows["completed"])
+        assert completed.reference_answer == "dict"
+        assert completed.actual_score == 10
+
+
+def test_bank_list_rejects_invalid_cursor(client, make_user):
+    _, headers = make_user("interviewer", "interviewer")
+    response = client.get("/api/question-bank/?cursor=not-a-cursor", headers=headers)
+    assert response.status_code == 400
+    assert "message" in response.get_json()
@@ -0,0 +1,77 @@
+from extensions import db
+from models import (
+    BankQuestion,
+    Interview,
+    InterviewEvaluation,
+    InterviewQuestion,
+    JobRequirement,
+)
+from services.interview_service import InterviewService
+from services.question_bank_service import QuestionBankService
+
+QUESTIONS = [
+    {
+        "question_text": f"第 {i} 题",
+        "question_type": "single_choice",
+        "options": ["list", "dict"],
+        "reference_answer": "dict",
+    }
+    for i in range(2)
+]
+
+
+def _setup(app, interviewer_id, interviewee_id, status="pending_evaluation"):
+    """两道选择题都答 dict 且已自动评分，评价总分 20；返回 (面试ID, 题目ID列表)"""
+    with app.app_context():
+        job = JobRequirement(job_title="后端开发")
+        db.session.add(job)
+        db.session.flush()
+        bank_ids = QuestionBankService.intern_questions(QUESTIONS)
+        interview = Interview(
+            title="面试",
+            job_requirement_id=job.id,
+            interviewer_id=interviewer_id,
+            interviewee_id=interviewee_id,
+            status=status,
+        )
+        db.session.add(interview)
+        db.session.flush()
+        questions = [
+            InterviewQuestion(
+                interview_id=interview.id,
+                bank_question_id=bank_id,
+                candidate_answer="dict",
+                actual_score=10,
+            )
+            for bank_id in bank_ids
+        ]
+        db.session.add_all(questions)
+        db.session.add(
+            InterviewEvaluation(
+                interview_id=interview.id, evaluator_id=interviewer_id, total_score=20
+            )
+        )
+        db.session.commit()
+        return interview.id, [q.id for q in questions]
+
+
+def test_regrade_keeps_manual_scores_and_refreshes_total(app, make_user):
+    interviewer_id, _ = make_user("interviewer", "interviewer")
+    interviewee_id, _ = make_user("candidate")
+    interview_id, (auto_id, manual_id) = _setup(app, interviewer_id, interviewee_id)
+
+    with app.app_context():
+        _, error = InterviewService.score_question(manual_id, 7, "部分正确")
+        assert error is None
+        # 参考答案改为 list 后两道题的自动评分都是 0 分
+        BankQuestion.query.update({"reference_answer": "list"})
+        db.session.commit()
+
+        assert InterviewService.regrade_choice_questions(interview_id) == 1
+        assert db.session.get(InterviewQuestion, auto_id).actual_score == 0
+        assert db.session.get(InterviewQuestion, manual_id).actual_score == 7
+        evaluation = InterviewEvaluation.query.filter_by(
+            interview_id=interview_id
+        ).one()
+        # 只扣除被重新评分的那道题的差值
+        assert evaluation.total_score == 10
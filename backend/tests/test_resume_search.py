@@ -0,0 +1,16 @@
+def test_search_works_on_create_all_schema(client, make_user):
+    # 测试库只用 db.create_all() 建表，resumes_fts 由应用启动时补建
+    _, candidate = make_user("candidate")
+    _, interviewer = make_user("interviewer", "interviewer")
+
+    response = client.post(
+        "/api/resumes/my",
+        json={"content": "五年 Python 后端经验，熟悉 PostgreSQL 和 Redis"},
+        headers=candidate,
+    )
+    assert response.status_code == 200
+
+    response = client.get("/api/resumes/search?q=postgresql", headers=interviewer)
+    assert response.status_code == 200
+    assert response.json["total"] == 1
+    assert response.json["data"][0]["user"]["username"] == "candidate"
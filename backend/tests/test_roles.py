@@ -0,0 +1,59 @@
+import pytest
+from flask_jwt_extended import create_access_token
+from conftest import make_app
+from extensions import db
+from models import User
+from utils.identity import user_cache
+
+
+@pytest.fixture
+def app(tmp_path):
+    user_cache.invalidate()
+    app = make_app(tmp_path, USER_CACHE_TTL=60)
+    yield app
+    user_cache.invalidate()
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_role_claim_in_token_is_not_trusted(app, client, make_user):
+    user_id, _ = make_user("candidate")
+    with app.app_context():
+        token = create_access_token(
+            identity=str(user_id), additional_claims={"role": "admin"}
+        )
+    response = client.get(
+        "/api/system/db-pool", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 403
+
+
+def test_deleted_user_is_rejected(app, client, make_user):
+    user_id, headers = make_user("interviewer", "interviewer")
+    assert client.get("/api/question-bank/", headers=headers).status_code == 200
+    with app.app_context():
+        db.session.delete(db.session.get(User, user_id))
+        db.session.commit()
+    assert client.get("/api/question-bank/", headers=headers).status_code == 401
+
+
+def test_role_change_invalidates_cache_after_commit(app, client, make_user):
+    user_id, headers = make_user("interviewer", "interviewer")
+    assert client.get("/api/question-bank/", headers=headers).status_code == 200
+
+    with app.app_context():
+        user = db.session.get(User, user_id)
+        user.role = "interviewee"
+        db.session.flush()
+        # 未提交的修改不影响缓存，回滚后仍然有效
+        assert user_cache.get(user_id)["role"] == "interviewer"
+        db.session.rollback()
+        assert user_cache.get(user_id)["role"] == "interviewer"
+
+        user = db.session.get(User, user_id)
+        user.role = "interviewee"
+        db.session.commit()
+        assert user_cache.get(user_id) is None
+
+    assert client.get("/api/question-bank/", headers=headers).status_code == 403
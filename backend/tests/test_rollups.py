@@ -0,0 +1,107 @@
+from extensions import db
+from models import BankQuestion, Interview, InterviewQuestion, JobRequirement
+from services.analytics_service import (
+    interviewer_analytics,
+    job_analytics,
+    rebuild_rollups,
+)
+from services.interview_service import InterviewService
+from services.question_bank_service import QuestionBankService
+
+QUESTION = {
+    "question_text": "Python 中哈希表对应的类型",
+    "question_type": "single_choice",
+    "options": ["list", "dict"],
+    "reference_answer": "dict",
+}
+
+
+def _finalized_interview(app, interviewer_id, interviewee_id):
+    """一场已完成评价的面试（选择题 10 分，总分 60），返回 (面试ID, 两个岗位ID)"""
+    with app.app_context():
+        jobs = [JobRequirement(job_title="后端开发"), JobRequirement(job_title="运维")]
+        db.session.add_all(jobs)
+        db.session.flush()
+        (bank_id,) = QuestionBankService.intern_questions([QUESTION])
+        interview = Interview(
+            title="面试",
+            job_requirement_id=jobs[0].id,
+            interviewer_id=interviewer_id,
+            interviewee_id=interviewee_id,
+            status="pending_evaluation",
+        )
+        db.session.add(interview)
+        db.session.flush()
+        db.session.add(
+            InterviewQuestion(
+                interview_id=interview.id,
+                bank_question_id=bank_id,
+                candidate_answer="dict",
+                actual_score=10,
+            )
+        )
+        db.session.commit()
+        _, error = InterviewService.create_evaluation(
+            interview.id,
+            interviewer_id,
+            {"total_score": 60, "is_passed": True, "complete_evaluation": True},
+        )
+        assert error is None
+        return interview.id, [job.id for job in jobs]
+
+
+def _snapshot():
+    rows = job_analytics() + interviewer_analytics()
+    return sorted(
+        (
+            row["dimension"],
+            row["dimension_id"],
+            row["evaluated_count"],
+            row["passed_count"],
+            row["avg_score"],
+            tuple(row["score_histogram"]),
+        )
+        for row in rows
+        # 增量更新会留下计数为 0 的汇总行，全量重建不会
+        if row["evaluated_count"]
+    )
+
+
+def _assert_matches_rebuild():
+    incremental = _snapshot()
+    rebuild_rollups()
+    assert incremental == _snapshot()
+    return incremental
+
+
+def test_job_change_moves_finalized_evaluation(app, make_user):
+    interviewer_id, _ = make_user("interviewer", "interviewer")
+    interviewee_id, _ = make_user("candidate")
+    interview_id, (old_job, new_job) = _finalized_interview(
+        app, interviewer_id, interviewee_id
+    )
+
+    with app.app_context():
+        _, error = InterviewService.update_interview(
+            interview_id, {"job_requirement_id": new_job}
+        )
+        assert error is None
+        rows = _assert_matches_rebuild()
+    jobs = [dim_id for dim, dim_id, *_ in rows if dim == "job"]
+    assert jobs == [new_job] and old_job != new_job
+
+
+def test_regrade_updates_finalized_rollups(app, make_user):
+    interviewer_id, _ = make_user("interviewer", "interviewer")
+    interviewee_id, _ = make_user("candidate")
+    interview_id, (job_id, _) = _finalized_interview(
+        app, interviewer_id, interviewee_id
+    )
+
+    with app.app_context():
+        BankQuestion.query.update({"reference_answer": "list"})
+        db.session.commit()
+        assert InterviewService.regrade_choice_questions(interview_id) == 1
+        rows = _assert_matches_rebuild()
+    scores = {(dim, dim_id): score for dim, dim_id, _, _, score, _ in rows}
+    assert scores[("job", job_id)] == 50.0
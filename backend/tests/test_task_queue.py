@@ -0,0 +1,96 @@
+import logging
+from datetime import datetime, timedelta
+import pytest
+from extensions import db
+from models import BackgroundTask
+from services import task_queue
+from services.task_queue import LeaseLost, claim, enqueue, renew_lease, run_task
+
+
+@task_queue.task("test_renewing")
+def _renewing(steps):
+    for step in range(steps):
+        renew_lease(result={"step": step})
+    return {"steps": steps}
+
+
+@task_queue.task("test_taken_over")
+def _taken_over():
+    # 模拟执行期间租约过期，任务被另一个 worker 重新领取
+    task_id, _ = task_queue.current_task()
+    BackgroundTask.query.get(task_id).locked_by = "other"
+    db.session.commit()
+    return {"done": True}
+
+
+def _claimed(name, payload=None, worker_id="w1"):
+    task_id = enqueue(name, payload, commit=True).id
+    assert claim(worker_id, visibility_timeout=1) == [task_id]
+    return task_id
+
+
+def test_renew_lease_extends_lease_and_saves_progress(app):
+    with app.app_context():
+        task_id = _claimed("test_renewing", {"steps": 2})
+        leased_until = BackgroundTask.query.get(task_id).locked_until
+        db.session.rollback()
+
+        assert run_task(task_id, "w1") == "done"
+        task_row = BackgroundTask.query.get(task_id)
+        assert task_row.result == {"steps": 2}
+        assert task_row.started_at is not None
+
+        task_id = _claimed("test_renewing", {"steps": 0})
+        renew_lease(task_id, "w1", result={"step": 0})
+        task_row = BackgroundTask.query.get(task_id)
+        assert task_row.locked_until > leased_until + timedelta(seconds=60)
+        assert task_row.result == {"step": 0}
+
+
+def test_renew_lease_raises_when_taken_over(app):
+    with app.app_context():
+        task_id = _claimed("test_renewing", {"steps": 1})
+        with pytest.raises(LeaseLost):
+            renew_lease(task_id, "w2")
+
+        BackgroundTask.query.get(task_id).locked_by = "w2"
+        db.session.commit()
+        # 处理函数续租失败时停止执行，不覆盖新 worker 的结果
+        assert run_task(task_id, "w1") == "lost"
+        assert BackgroundTask.query.get(task_id).status == "running"
+
+
+def test_finish_without_lease_is_logged(app, caplog):
+    with app.app_context():
+        task_id = _claimed("test_taken_over")
+        with caplog.at_level(logging.ERROR):
+            run_task(task_id, "w1")
+        task_row = BackgroundTask.query.get(task_id)
+        assert task_row.status == "running" and task_row.result is None
+    assert "未保存" in caplog.text
+
+
+def test_execution_stats_cover_all_workers(app, make_user, client):
+    _, headers = make_user("admin", "admin")
+    with app.app_context():
+        now = datetime.utcnow()
+        for worker, seconds, attempts in (("a-0", 2, 1), ("a-1", 4, 2)):
+            db.session.add(
+                BackgroundTask(
+                    name="test_renewing",
+                    payload={},
+                    status="done",
+                    attempts=attempts,
+                    locked_by=worker,
+                    run_at=now,
+                    started_at=now - timedelta(seconds=seconds),
+                    finished_at=now,
+                )
+            )
+        db.session.commit()
+
+    response = client.get("/api/system/tasks", headers=headers)
+    assert response.status_code == 200
+    executed = response.get_json()["data"]["executed"]["test_renewing"]
+    assert executed["succeeded"] == 2 and executed["retried"] == 1
+    assert executed["max"] == pytest.approx(4) and executed["avg"] == pytest.approx(3)
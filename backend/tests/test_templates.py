@@ -0,0 +1,83 @@
+from extensions import db
+from models import Interview, InterviewQuestion
+
+
+def _template(client, headers):
+    job = client.post("/api/jobs/", json={"job_title": "后端开发"}, headers=headers)
+    response = client.post(
+        "/api/templates/",
+        json={
+            "title": "后端一面",
+            "job_requirement_id": job.json["id"],
+            "questions": [
+                {"question_text": "解释 GIL", "score": 10},
+                {
+                    "question_text": "以下哪个是不可变类型",
+                    "question_type": "single_choice",
+                    "options": ["list", "tuple"],
+                    "reference_answer": "tuple",
+                    "score": 5,
+                },
+            ],
+        },
+        headers=headers,
+    )
+    assert response.status_code == 201
+    return response.json["data"]["id"]
+
+
+def test_fan_out_creates_interviews_and_is_idempotent(app, client, make_user):
+    interviewer_id, headers = make_user("interviewer", "interviewer")
+    admin_id, _ = make_user("admin", "admin")
+    candidates = [make_user(f"candidate{i}")[0] for i in range(3)]
+    template_id = _template(client, headers)
+    url = f"/api/templates/{template_id}/fanout"
+
+    response = client.post(
+        url,
+        json={"interviewee_ids": candidates[:2] + [admin_id, 999, candidates[0]]},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    assert response.json["data"] == {
+        "total": 4,
+        "created": 2,
+        "skipped": [],
+        "invalid": [admin_id, 999],
+    }
+
+    # 重复分发跳过已有面试，只为新的面试者创建
+    response = client.post(url, json={"interviewee_ids": candidates}, headers=headers)
+    assert response.json["data"]["created"] == 1
+    assert response.json["data"]["skipped"] == candidates[:2]
+
+    with app.app_context():
+        interviews = Interview.query.filter_by(template_id=template_id).all()
+        assert sorted(i.interviewee_id for i in interviews) == sorted(candidates)
+        for interview in interviews:
+            assert interview.status == "assigned"
+            assert interview.interviewer_id == interviewer_id
+            assert interview.question_count == 2
+            questions = (
+                InterviewQuestion.query.filter_by(interview_id=interview.id)
+                .order_by(InterviewQuestion.order_index)
+                .all()
+            )
+            assert [(q.order_index, q.score) for q in questions] == [(1, 10), (2, 5)]
+            assert all(q.bank_question_id for q in questions)
+        db.session.remove()
+
+
+def test_fan_out_rejects_bad_ids(client, make_user):
+    _, headers = make_user("interviewer", "interviewer")
+    template_id = _template(client, headers)
+    url = f"/api/templates/{template_id}/fanout"
+
+    for body in ({}, {"interviewee_ids": []}, {"interviewee_ids": ["1"]}):
+        assert client.post(url, json=body, headers=headers).status_code == 400
+    assert (
+        client.post(
+            "/api/templates/999/fanout", json={"interviewee_ids": [1]}, headers=headers
+        ).status_code
+        == 404
+    )
@@ -0,0 +1,28 @@
+def test_search_and_cursor_round_trip(client, make_user):
+    _, headers = make_user("interviewer", "interviewer")
+    for name in ("zhang_wei", "zhang_li", "wang_fang", "zhang_100%"):
+        make_user(name)
+
+    names, cursor = [], None
+    while True:
+        url = "/api/users?role=interviewee&q=zhang&limit=2"
+        response = client.get(
+            url + (f"&cursor={cursor}" if cursor else ""), headers=headers
+        )
+        assert response.status_code == 200
+        names += [user["username"] for user in response.json["data"]]
+        cursor = response.json["next_cursor"]
+        if cursor is None:
+            break
+    # 按创建时间倒序，只返回匹配的面试者
+    assert names == ["zhang_100%", "zhang_li", "zhang_wei"]
+
+    # % 和 _ 按字面匹配，不作为通配符
+    response = client.get("/api/users?q=100%25", headers=headers)
+    assert [user["username"] for user in response.json["data"]] == ["zhang_100%"]
+
+
+def test_invalid_cursor_is_rejected(client, make_user):
+    _, headers = make_user("interviewer", "interviewer")
+    response = client.get("/api/users?limit=2&cursor=bogus", headers=headers)
+    assert response.status_code == 400
@@ -0,0 +1,123 @@
+import io
+from datetime import datetime, timedelta
+import pytest
+from conftest import make_app
+from extensions import db
+from models import BackgroundTask, User
+from services.task_queue import work
+
+CSV = (
+    "username,email,password,role\n"
+    "alice,alice@example.com,secret1,interviewee\n"
+    "bob,bob@example.com,secret2,interviewer\n"
+    "carol,not-an-email,secret3,\n"
+)
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = make_app(
+        tmp_path,
+        TASK_QUEUE_ENABLED=True,
+        IMPORT_SYNC_LIMIT=1,
+    )
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+def _upload(client, headers, text):
+    return client.post(
+        "/api/users/import",
+        data={"file": (io.BytesIO(text.encode("utf-8")), "users.csv")},
+        headers=headers,
+        content_type="multipart/form-data",
+    )
+
+
+def test_large_import_runs_in_worker(app, client, make_user):
+    _, admin = make_user("admin", "admin")
+
+    response = _upload(client, admin, CSV)
+    assert response.status_code == 202
+    task_id = response.json["task_id"]
+
+    status = client.get(f"/api/users/import/{task_id}", headers=admin).json["data"]
+    assert status["status"] == "queued"
+    assert "payload" not in status
+    with app.app_context():
+        # 请求内没有哈希密码，也没有创建用户
+        assert User.query.filter_by(username="alice").first() is None
+        assert work(max_tasks=1) == 1
+
+    status = client.get(f"/api/users/import/{task_id}", headers=admin).json["data"]
+    assert status["status"] == "done"
+    report = status["result"]
+    assert (report["total"], report["created"], report["failed"]) == (3, 2, 1)
+    assert report["errors"][0]["username"] == "carol"
+    with app.app_context():
+        assert User.query.filter_by(username="bob").one().role == "interviewer"
+        # 含明文密码的 payload 在任务结束后清空
+        assert db.session.get(BackgroundTask, task_id).payload is None
+
+
+def test_small_import_runs_inline(client, make_user):
+    _, admin = make_user("admin", "admin")
+    response = _upload(client, admin, "username,email,password\nx,x@example.com,pw\n")
+    assert response.status_code == 200
+    assert response.json["data"]["created"] == 1
+
+
+def test_import_status_requires_import_task(client, make_user):
+    _, admin = make_user("admin", "admin")
+    assert client.get("/api/users/import/999", headers=admin).status_code == 404
+
+
+def test_reclaimed_import_resumes_from_saved_progress(app, client, make_user):
+    _, admin = make_user("admin", "admin")
+    task_id = _upload(client, admin, CSV).json["task_id"]
+
+    with app.app_context():
+        # 上一个 worker 导入第一行并保存进度后崩溃，租约过期
+        db.session.add(
+            User(username="alice", email="alice@example.com", password_hash="!")
+        )
+        task_row = db.session.get(BackgroundTask, task_id)
+        task_row.status = "running"
+        task_row.attempts = 1
+        task_row.locked_by = "crashed"
+        task_row.locked_until = datetime.utcnow() - timedelta(seconds=1)
+        task_row.result = {"total": 1, "created": 1, "failed": 0, "errors": []}
+        db.session.commit()
+        assert work(max_tasks=1) == 1
+
+    status = client.get(f"/api/users/import/{task_id}", headers=admin).json["data"]
+    assert status["status"] == "done"
+    report = status["result"]
+    # 已导入的行不会被当作 "username already exists" 重新报告
+    assert (report["total"], report["created"], report["failed"]) == (3, 2, 1)
+    assert [e["username"] for e in report["errors"]] == ["carol"]
+
+
+def test_large_import_rejected_without_queue(app, client, make_user):
+    _, admin = make_user("admin", "admin")
+    app.config["TASK_QUEUE_ENABLED"] = False
+    assert _upload(client, admin, CSV).status_code == 400
+    with app.app_context():
+        assert User.query.filter_by(username="alice").first() is None
+
+
+def test_email_is_normalized_on_every_write_path(app, client, make_user):
+    _, admin = make_user("admin", "admin")
+    response = client.post(
+        "/api/auth/register",
+        json={"username": "dave", "email": " Dave@Example.COM ", "password": "pw"},
+    )
+    assert response.status_code == 201
+    assert response.json["user"]["email"] == "dave@example.com"
+
+    text = "username,email,password\ndave2,DAVE@example.com,pw\n"
+    report = _upload(client, admin, text).json["data"]
+    # 大小写不同的同一邮箱按重复处理
+    assert report["errors"][0]["error"] == "email already exists"
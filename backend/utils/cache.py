@@ -0,0 +1,165 @@
+import threading
+import time
+from collections import Counter, OrderedDict
+from functools import wraps
+from utils.db_routing import primary
+from utils.serialization import dumps, loads
+
+MISSING = object()
+
+
+class MemoryBackend:
+    """进程内 LRU + TTL 缓存"""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._items = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return MISSING
+            expires_at, value = item
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._items[key]
+                return MISSING
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._items[key] = (expires_at, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def generation(self, namespace):
+        return self._generations.get(namespace, 0)
+
+    def bump_generation(self, namespace):
+        # 版本号单独保存，不参与 LRU 淘汰，避免被淘汰后回退到旧版本
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+class RedisBackend:
+    """Redis 协议后端，client 需提供 get/set(ex=)/incr/scan_iter/delete，例如 redis.Redis
+
+    测试时可以传入实现相同接口的本地替身（如 fakeredis.FakeRedis）。
+    """
+
+    def __init__(self, client, prefix="cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return MISSING
+        return loads(raw)
+
+    def set(self, key, value, ttl=None):
+        self.client.set(self.prefix + key, dumps(value), ex=ttl or None)
+
+    def generation(self, namespace):
+        value = self.client.get(f"{self.prefix}{namespace}:gen")
+        return int(value) if value is not None else 0
+
+    def bump_generation(self, namespace):
+        self.client.incr(f"{self.prefix}{namespace}:gen")
+
+    def clear(self, batch_size=500):
+        # 只删除本前缀下的键，同一 Redis 库中的其他数据（如 state 后端）不受影响
+        keys = []
+        for key in self.client.scan_iter(match=f"{self.prefix}*", count=batch_size):
+            keys.append(key)
+            if len(keys) >= batch_size:
+                self.client.delete(*keys)
+                keys = []
+        if keys:
+            self.client.delete(*keys)
+
+
+class Cache:
+    """服务层读缓存
+
+    用 memoize(namespace) 装饰服务函数，结果按参数缓存；写操作调用
+    invalidate(namespace) 使整个命名空间失效。失效通过递增命名空间的版本号实现，
+    Redis 后端下多个进程共享同一版本号，不需要扫描删除键。
+    缓存的值必须可以 JSON 序列化，不要缓存 ORM 对象。写入前统一做一次 JSON 往返，
+    datetime 等变为 ISO 字符串，两种后端以及命中/未命中时返回的类型一致；
+    内存后端返回的是同一个对象，调用方不要修改。
+
+    state 是另一个同类后端，保存进程间共享的状态（如读写分离的粘滞标记），
+    与缓存数据分开存放，清空缓存不会影响它。
+    """
+
+    def __init__(self, backend=None, default_ttl=60):
+        self.backend = backend or MemoryBackend()
+        self.state = MemoryBackend()
+        self.default_ttl = default_ttl
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def init_app(self, app):
+        self.default_ttl = app.config.get("CACHE_DEFAULT_TTL", 60)
+        backend = app.config.get("CACHE_BACKEND", "memory")
+        if backend == "memory":
+            self.backend = MemoryBackend(app.config.get("CACHE_MAX_ENTRIES", 1024))
+            self.state = MemoryBackend(app.config.get("CACHE_MAX_ENTRIES", 1024))
+        elif backend == "redis":
+            try:
+                import redis
+            except ImportError:
+                raise RuntimeError("CACHE_BACKEND=redis requires the redis package")
+            client = redis.Redis.from_url(app.config["CACHE_REDIS_URL"])
+            self.backend = RedisBackend(client)
+            self.state = RedisBackend(client, prefix="state:")
+        else:
+            raise ValueError(f"unknown cache backend: {backend}")
+
+    def memoize(self, namespace, ttl=None):
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args):
+                key = f"{namespace}:{self.backend.generation(namespace)}:{fn.__name__}{args!r}"
+                value = self.backend.get(key)
+                if value is not MISSING:
+                    self.hits[namespace] += 1
+                    return value
+                self.misses[namespace] += 1
+                # 未命中时从主库读取，避免把只读副本上的旧数据写入新版本的缓存
+                with primary():
+                    value = loads(dumps(fn(*args)))
+                self.backend.set(key, value, ttl or self.default_ttl)
+                return value
+
+            return wrapper
+
+        return decorator
+
+    def invalidate(self, namespace):
+        self.backend.bump_generation(namespace)
+
+    def stats(self):
+        """当前进程内按命名空间统计的命中和未命中次数"""
+        return {
+            namespace: {
+                "hits": self.hits[namespace],
+                "misses": self.misses[namespace],
+                "hit_rate": round(
+                    self.hits[namespace]
+                    / (self.hits[namespace] + self.misses[namespace]),
+                    4,
+                ),
+            }
+            for namespace in set(self.hits) | set(self.misses)
+        }
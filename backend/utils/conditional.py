@@ -0,0 +1,39 @@
+import hashlib
+from flask import Response, request
+from sqlalchemy import func
+from werkzeug.http import http_date, quote_etag
+
+
+def aggregate_version(query, updated_col):
+    """用一条聚合查询取 (max(updated_at), count)，作为结果集的版本"""
+    return tuple(
+        query.order_by(None).with_entities(func.max(updated_col), func.count()).one()
+    )
+
+
+def weak_etag(*parts):
+    """根据版本信息生成弱 ETag（不含引号）"""
+    raw = "|".join(
+        "" if p is None else p.isoformat() if hasattr(p, "isoformat") else str(p)
+        for p in parts
+    )
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def cache_headers(etag, last_modified=None):
+    """响应头：弱 ETag、Last-Modified，并要求客户端每次重新验证"""
+    headers = {"ETag": quote_etag(etag, weak=True), "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def not_modified(etag, last_modified=None):
+    """If-None-Match 命中时返回 304 响应，否则返回 None
+
+    只依据 ETag 判断；删除行不会改变 max(updated_at)，因此不单独信任
+    If-Modified-Since，Last-Modified 仅作为参考信息返回。
+    """
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    return Response(status=304, headers=cache_headers(etag, last_modified))
@@ -0,0 +1,192 @@
+import logging
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+from sqlalchemy.pool import NullPool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+# 取连接等待时间直方图的桶上界（毫秒），最后一桶为超过最大上界的次数
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+_settings = {"slow_checkout_ms": 200}
+
+
+class PoolMetrics:
+    """单个连接池的累计指标：取连接次数、等待时间分布、超时次数和占用数"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.in_use = 0
+        self.in_use_peak = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.histogram = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def checked_out(self, wait_ms):
+        bucket = next(
+            (i for i, bound in enumerate(WAIT_BUCKETS_MS) if wait_ms <= bound),
+            len(WAIT_BUCKETS_MS),
+        )
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.in_use_peak = max(self.in_use_peak, self.in_use)
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            self.histogram[bucket] += 1
+
+    def checked_in(self):
+        with self._lock:
+            self.in_use -= 1
+
+    def timed_out(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "in_use": self.in_use,
+                "in_use_peak": self.in_use_peak,
+                "wait_avg_ms": (
+                    round(self.wait_total_ms / self.checkouts, 3)
+                    if self.checkouts
+                    else None
+                ),
+                "wait_max_ms": round(self.wait_max_ms, 3),
+                "wait_histogram_ms": dict(
+                    zip(
+                        [f"<={bound}" for bound in WAIT_BUCKETS_MS]
+                        + [f">{WAIT_BUCKETS_MS[-1]}"],
+                        self.histogram,
+                    )
+                ),
+            }
+
+
+class _TimedCheckout:
+    """记录从连接池取连接的等待时间；池耗尽超时的次数单独计数"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeout:
+            self.metrics.timed_out()
+            logger.warning("数据库连接池已耗尽: %s", self.status())
+            raise
+        wait_ms = (time.perf_counter() - started) * 1000
+        self.metrics.checked_out(wait_ms)
+        if wait_ms > _settings["slow_checkout_ms"]:
+            logger.warning("获取数据库连接等待 %.0fms: %s", wait_ms, self.status())
+        return conn
+
+    def _do_return_conn(self, conn):
+        self.metrics.checked_in()
+        super()._do_return_conn(conn)
+
+    def recreate(self):
+        # engine.dispose() 会重建连接池，累计指标沿用到新池
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedNullPool(_TimedCheckout, NullPool):
+    pass
+
+
+def engine_options(config, url):
+    """根据配置生成 create_engine 参数；SQLite 使用 Flask-SQLAlchemy 的默认设置"""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend == "sqlite":
+        return {}
+
+    connect_args = {}
+    statement_timeout = config.get("DB_STATEMENT_TIMEOUT_MS", 0)
+    if backend == "postgresql":
+        connect_args["connect_timeout"] = config.get("DB_CONNECT_TIMEOUT", 10)
+        # PgBouncer 事务池模式不转发启动参数，语句超时改由 install_engine_events 按事务设置
+        if statement_timeout and not config.get("DB_PGBOUNCER"):
+            connect_args["options"] = f"-c statement_timeout={statement_timeout}"
+
+    if config.get("DB_PGBOUNCER"):
+        # 连接复用交给 PgBouncer，应用内每次都新建到 PgBouncer 的连接
+        options = {"poolclass": TimedNullPool}
+    else:
+        options = {
+            "poolclass": TimedQueuePool,
+            "pool_size": config.get("DB_POOL_SIZE", 10),
+            "max_overflow": config.get("DB_MAX_OVERFLOW", 20),
+            "pool_timeout": config.get("DB_POOL_TIMEOUT", 10),
+            "pool_recycle": config.get("DB_POOL_RECYCLE", 1800),
+            "pool_pre_ping": config.get("DB_POOL_PRE_PING", True),
+        }
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def install_engine_events(engine, config):
+    """PgBouncer 模式下在每个事务开始时用 SET LOCAL 设置语句超时"""
+    statement_timeout = config.get("DB_STATEMENT_TIMEOUT_MS", 0)
+    if not (
+        config.get("DB_PGBOUNCER")
+        and statement_timeout
+        and engine.dialect.name == "postgresql"
+    ):
+        return
+
+    @event.listens_for(engine, "begin")
+    def _set_statement_timeout(conn):
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(statement_timeout)}")
+
+
+def init_db_pool(app):
+    """在 db.init_app 之后调用：读取慢取连接阈值并为各引擎注册事件"""
+    _settings["slow_checkout_ms"] = app.config.get("DB_SLOW_CHECKOUT_MS", 200)
+    from extensions import db
+
+    with app.app_context():
+        for engine in db.engines.values():
+            install_engine_events(engine, app.config)
+
+
+def pool_stats(engines):
+    """{bind 名: 连接池状态}，bind 名 None 表示默认库"""
+    stats = {}
+    for key, engine in engines.items():
+        pool = engine.pool
+        item = {
+            "url": engine.url.render_as_string(hide_password=True),
+            "pool_class": type(pool).__name__,
+            "status": pool.status(),
+        }
+        if isinstance(pool, QueuePool):
+            item.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+                checked_in=pool.checkedin(),
+            )
+        metrics = getattr(pool, "metrics", None)
+        if metrics is not None:
+            item.update(metrics.snapshot())
+        stats[key or "default"] = item
+    return stats
@@ -0,0 +1,223 @@
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from flask import g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.selectable import CompoundSelect, Select
+from utils.db_pool import engine_options
+
+logger = logging.getLogger(__name__)
+
+REPLICA_PREFIX = "replica_"
+
+READ_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+# WAL 已全部回放时延迟为 0；否则为距最后一次回放事务的秒数
+_PG_LAG_SQL = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() "
+    "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+def replica_binds(config):
+    """把 DATABASE_REPLICA_URLS（逗号分隔）转换为 SQLALCHEMY_BINDS 中的 replica_N"""
+    urls = [
+        url.strip()
+        for url in (config.get("DATABASE_REPLICA_URLS") or "").split(",")
+        if url.strip()
+    ]
+    return {
+        f"{REPLICA_PREFIX}{i}": {"url": url, **engine_options(config, url)}
+        for i, url in enumerate(urls)
+    }
+
+
+def _is_read(clause):
+    return (
+        isinstance(clause, (Select, CompoundSelect)) and clause._for_update_arg is None
+    )
+
+
+class RoutingSession(Session):
+    """只读请求中的普通 SELECT 发往 g.db_replica；写入、加锁查询和原生 SQL 总是走主库
+
+    请求内一旦发生写入，后续查询也改走主库，保证同一请求读到自己的写入。
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_request_context():
+            if self._flushing or isinstance(clause, UpdateBase):
+                g.db_wrote = True
+            elif (
+                _is_read(clause)
+                and g.get("db_replica") is not None
+                and not g.get("db_wrote")
+                and not g.get("db_primary")
+            ):
+                return g.db_replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@contextmanager
+def primary():
+    """块内的查询都走主库，用于读取后要写入缓存或增量索引的场景"""
+    if not has_request_context():
+        yield
+        return
+    previous = g.get("db_primary", False)
+    g.db_primary = True
+    try:
+        yield
+    finally:
+        g.db_primary = previous
+
+
+class ReplicaRouter:
+    """为只读请求选择只读副本
+
+    - 用户写入后的 REPLICA_STICKY_SECONDS 秒内，该用户的请求都走主库（读到自己的写入），
+      标记保存在 cache.state 中（不随缓存清空），Redis 后端下多进程共享；
+    - 每隔 REPLICA_CHECK_INTERVAL 秒检查一次副本延迟，超过 REPLICA_MAX_LAG_SECONDS
+      或连接失败的副本暂停使用，全部不可用时回退到主库；
+    - 副本上的查询出现连接错误时立即标记为不可用。
+    """
+
+    def __init__(self):
+        self.keys = ()
+        self.sticky_seconds = 5
+        self.max_lag = 10
+        self.check_interval = 5
+        self._state = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        from extensions import db
+
+        config = app.config
+        self.sticky_seconds = config.get("REPLICA_STICKY_SECONDS", 5)
+        self.max_lag = config.get("REPLICA_MAX_LAG_SECONDS", 10)
+        self.check_interval = config.get("REPLICA_CHECK_INTERVAL", 5)
+        with app.app_context():
+            engines = db.engines
+            self.keys = tuple(
+                key
+                for key in engines
+                if key is not None and key.startswith(REPLICA_PREFIX)
+            )
+            for key in self.keys:
+                self._watch_errors(key, engines[key])
+        if self.keys:
+            app.before_request(self._choose)
+            app.after_request(self._remember_write)
+
+    def _watch_errors(self, key, engine):
+        @event.listens_for(engine, "handle_error")
+        def _mark_down(context):
+            if context.is_disconnect or context.connection is None:
+                self._set_state(key, False, None, str(context.original_exception))
+
+    def _set_state(self, key, healthy, lag, error=None):
+        previous = self._state.get(key)
+        if previous and previous["healthy"] and not healthy:
+            logger.warning("只读副本 %s 暂停使用: %s", key, error or f"延迟 {lag}s")
+        self._state[key] = {
+            "healthy": healthy,
+            "lag_seconds": lag,
+            "error": error,
+            "checked_at": time.monotonic(),
+        }
+
+    def _measure(self, key, engine):
+        try:
+            with engine.connect() as conn:
+                if engine.dialect.name == "postgresql":
+                    lag = float(conn.execute(_PG_LAG_SQL).scalar() or 0)
+                else:
+                    # 其他数据库（如本地测试用的两个 SQLite 文件）只检查可连接
+                    conn.execute(text("SELECT 1"))
+                    lag = 0.0
+        except SQLAlchemyError as e:
+            self._set_state(key, False, None, str(e))
+            return
+        self._set_state(key, lag <= self.max_lag, round(lag, 3))
+
+    def _healthy(self, key, engine):
+        state = self._state.get(key)
+        if state and time.monotonic() - state["checked_at"] < self.check_interval:
+            return state["healthy"]
+        # 同一时间只有一个线程做检查，其余线程沿用上次结果
+        if self._lock.acquire(blocking=False):
+            try:
+                self._measure(key, engine)
+            finally:
+                self._lock.release()
+        state = self._state.get(key)
+        return bool(state and state["healthy"])
+
+    @staticmethod
+    def _user_id():
+        from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+
+        try:
+            verify_jwt_in_request(optional=True)
+            return get_jwt_identity()
+        except Exception:
+            # 令牌无效时由接口自身的 jwt_required 返回错误
+            return None
+
+    @staticmethod
+    def _sticky_key(user_id):
+        return f"db:sticky:{user_id}"
+
+    def _choose(self):
+        from extensions import cache, db
+        from utils.cache import MISSING
+
+        g.db_replica = None
+        if request.method not in READ_METHODS:
+            return
+        user_id = self._user_id()
+        if (
+            user_id is not None
+            and cache.state.get(self._sticky_key(user_id)) is not MISSING
+        ):
+            return
+        engines = db.engines
+        healthy = [key for key in self.keys if self._healthy(key, engines[key])]
+        if healthy:
+            g.db_replica = engines[random.choice(healthy)]
+
+    def _remember_write(self, response):
+        from extensions import cache
+
+        if g.get("db_wrote") and self.sticky_seconds > 0:
+            user_id = self._user_id()
+            if user_id is not None:
+                cache.state.set(self._sticky_key(user_id), True, self.sticky_seconds)
+        return response
+
+    def status(self):
+        now = time.monotonic()
+        result = {}
+        for key in self.keys:
+            state = self._state.get(key)
+            result[key] = (
+                {
+                    "healthy": state["healthy"],
+                    "lag_seconds": state["lag_seconds"],
+                    "error": state["error"],
+                    "checked_seconds_ago": round(now - state["checked_at"], 1),
+                }
+                if state
+                else {"healthy": None}
+            )
+        return result
+
+
+router = ReplicaRouter()
@@ -0,0 +1,67 @@
+import csv
+import io
+import tempfile
+
+try:
+    from openpyxl import Workbook
+except ImportError:  # pragma: no cover - openpyxl is optional
+    Workbook = None
+
+XLSX_MIMETYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# 每攒够这么多行输出一次，避免逐行产生过小的响应块
+CSV_FLUSH_ROWS = 500
+
+
+# 以这些字符开头的文本会被 Excel 等当作公式执行（CSV/公式注入）
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _cell(value):
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat(sep=" ", timespec="seconds")
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        # 前置单引号，电子表格按文本显示
+        return "'" + value
+    return value
+
+
+def iter_csv(header, rows):
+    """把行迭代器编码为 CSV 文本块，带 BOM 以便 Excel 正确识别 UTF-8"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("﻿")
+    writer.writerow(header)
+    for count, row in enumerate(rows, 1):
+        writer.writerow([_cell(value) for value in row])
+        if count % CSV_FLUSH_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def xlsx_available():
+    return Workbook is not None
+
+
+def iter_xlsx(header, rows, chunk_size=64 * 1024):
+    """用 openpyxl 的 write_only 模式写入临时文件后分块输出
+
+    xlsx 是 zip 格式，必须写完才能发送；write_only 模式逐行落盘，内存占用不随行数增长。
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(header)
+    for row in rows:
+        sheet.append([_cell(value) for value in row])
+    with tempfile.TemporaryFile() as tmp:
+        workbook.save(tmp)
+        tmp.seek(0)
+        while True:
+            chunk = tmp.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
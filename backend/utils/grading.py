@@ -0,0 +1,104 @@
+import re
+
+CHOICE_TYPES = ("single_choice", "multiple_choice")
+
+_SEPARATORS = ",，、;；/ \t\r\n"
+# 选项字母及其后的标点，如 "B."、"B)"、"B、"、"B："
+_LETTER_PREFIX_RE = re.compile(r"([a-z])\s*[.．)）、:：]\s*")
+_LETTER_RE = re.compile(f"([a-z])(?=$|[{re.escape(_SEPARATORS)}])")
+_LETTERS_RE = re.compile(r"^[a-z]+$")
+
+
+def _ends_token(tail):
+    return not tail or tail[0] in _SEPARATORS
+
+
+def _match_option(rest, by_length):
+    """开头是某个选项原文（最长优先）时返回 (下标, 长度)"""
+    for option, index in by_length:
+        if rest.startswith(option) and _ends_token(rest[len(option) :]):
+            return index, len(option)
+    return None, 0
+
+
+def _match_letter(rest, options):
+    """开头是选项字母（可带 "B." 前缀及该选项原文）时返回 (下标, 长度)"""
+    match = _LETTER_PREFIX_RE.match(rest) or _LETTER_RE.match(rest)
+    if match is None:
+        return None, 0
+    index = ord(match.group(1)) - ord("a")
+    if index >= len(options):
+        return None, 0
+    end = match.end()
+    option = options[index]
+    if (
+        option
+        and rest.startswith(option, end)
+        and _ends_token(rest[end + len(option) :])
+    ):
+        end += len(option)
+    return index, end
+
+
+def parse_choices(text, options):
+    """把答案解析为选项下标集合，无法完整识别时返回 None
+
+    支持选项字母（"A"、"A,C"、"AC"）、选项原文（"选项一, 选项二"，与前端
+    生成 reference_answer 的格式一致）以及带字母前缀的原文（"B. 选项二"），
+    不区分大小写。选项原文本身可能带逗号或空格，按最长选项贪心匹配。
+    """
+    text = (text or "").strip().casefold()
+    if not text or not options:
+        return None
+    options = [str(option).strip().casefold() for option in options]
+    by_length = sorted(
+        ((option, i) for i, option in enumerate(options) if option),
+        key=lambda item: len(item[0]),
+        reverse=True,
+    )
+
+    # 整体就是某个选项原文，或 "AC" 这样连写的字母
+    if text in options:
+        return frozenset([options.index(text)])
+    if _LETTERS_RE.match(text) and all(
+        ord(letter) - ord("a") < len(options) for letter in text
+    ):
+        return frozenset(ord(letter) - ord("a") for letter in text)
+
+    selected = set()
+    rest = text
+    while rest:
+        index, length = _match_option(rest, by_length)
+        if index is None:
+            index, length = _match_letter(rest, options)
+        if index is None:
+            return None
+        selected.add(index)
+        rest = rest[length:].lstrip(_SEPARATORS)
+    return frozenset(selected)
+
+
+def grade_choice(question_type, options, reference_answer, candidate_answer, score):
+    """计算选择题得分，不可自动评分时返回 None
+
+    单选：选对得满分，否则 0 分。
+    多选：有错选得 0 分；无错选时按选对的比例给分（向下取整），全对得满分。
+    未作答得 0 分；答案无法解析时返回 None，留给面试官人工评分。
+    """
+    if question_type not in CHOICE_TYPES:
+        return None
+    correct = parse_choices(reference_answer, options)
+    if not correct:
+        return None
+    if not (candidate_answer or "").strip():
+        return 0
+    selected = parse_choices(candidate_answer, options)
+    if not selected:
+        return None
+
+    full = score or 0
+    if question_type == "single_choice":
+        return full if selected == correct else 0
+    if selected - correct:
+        return 0
+    return full * len(selected) // len(correct)
@@ -0,0 +1,108 @@
+import threading
+import time
+from flask import current_app, g
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from models.user import User
+from utils.db_routing import primary
+
+
+class Identity:
+    """当前请求的身份信息（用户ID + 角色），每个请求最多解析一次"""
+
+    __slots__ = ("id", "role")
+
+    def __init__(self, user_id, role):
+        self.id = user_id
+        self.role = role
+
+
+class UserCache:
+    """进程内的短 TTL 用户缓存，缓存 User.to_dict() 的结果"""
+
+    def __init__(self):
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        with self._lock:
+            item = self._items.get(user_id)
+            if item is None:
+                return None
+            expires_at, payload = item
+            if expires_at < time.monotonic():
+                del self._items[user_id]
+                return None
+            return payload
+
+    def set(self, user_id, payload, ttl):
+        with self._lock:
+            self._items[user_id] = (time.monotonic() + ttl, payload)
+
+    def invalidate(self, user_id=None):
+        with self._lock:
+            if user_id is None:
+                self._items.clear()
+            else:
+                self._items.pop(user_id, None)
+
+
+user_cache = UserCache()
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_changed_users(session, flush_context, instances):
+    changed = session.info.setdefault("changed_user_ids", set())
+    for obj in (*session.dirty, *session.deleted):
+        if isinstance(obj, User) and obj.id is not None:
+            changed.add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session):
+    # 提交后才失效：提交前失效的话，并发请求可能把尚未提交的旧数据重新写回缓存
+    for user_id in session.info.pop("changed_user_ids", ()):
+        user_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session):
+    session.info.pop("changed_user_ids", None)
+
+
+def load_user_info(user_id):
+    """按ID加载用户信息字典，启用 USER_CACHE_TTL 时走进程内缓存"""
+    ttl = current_app.config.get("USER_CACHE_TTL", 0)
+    if ttl > 0:
+        payload = user_cache.get(user_id)
+        if payload is not None:
+            return payload
+
+    # 用于权限判断，不能读到副本上滞后的角色
+    with primary():
+        user = User.query.get(user_id)
+    if not user:
+        return None
+    payload = user.to_dict()
+    if ttl > 0:
+        user_cache.set(user_id, payload, ttl)
+    return payload
+
+
+def current_identity():
+    """获取当前请求的身份，调用前需已通过 JWT 校验
+
+    角色从 load_user_info 读取（USER_CACHE_TTL 秒的进程内缓存），不信任令牌中的
+    role claim，角色变更或删除用户在提交后即对本进程生效。结果保存在 flask.g 中，
+    同一请求内不会重复加载。用户不存在时返回 None。
+    """
+    if "identity" in g:
+        return g.identity
+
+    user_id = int(get_jwt_identity())
+    info = load_user_info(user_id)
+    identity = Identity(user_id, info["role"]) if info else None
+
+    g.identity = identity
+    return identity
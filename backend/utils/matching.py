@@ -0,0 +1,84 @@
+import heapq
+import math
+from collections import Counter, defaultdict
+from operator import itemgetter
+
+
+def term_weights(tokens):
+    """对数词频并做 L2 归一化，得到文档的稀疏向量 {term: weight}"""
+    counts = Counter(tokens)
+    weights = {term: 1.0 + math.log(tf) for term, tf in counts.items()}
+    norm = math.sqrt(sum(w * w for w in weights.values()))
+    if not norm:
+        return {}
+    return {term: w / norm for term, w in weights.items()}
+
+
+class TermIndex:
+    """稀疏词项矩阵的倒排存储
+
+    每行是一个文档的归一化词频向量，按列（词项）保存倒排表。查询向量按本索引的
+    IDF 加权，打分只遍历查询词的倒排表，相当于一次稀疏矩阵-向量乘法，
+    开销与命中的非零元个数成正比，而不是与文档总数成正比。
+    文档可以单独增删，不需要重建整个矩阵。
+    """
+
+    def __init__(self):
+        self._postings = defaultdict(dict)
+        self._docs = {}
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._docs
+
+    def ids(self):
+        return self._docs.keys()
+
+    def add(self, doc_id, tokens):
+        """写入或替换一个文档"""
+        self.remove(doc_id)
+        weights = term_weights(tokens)
+        self._docs[doc_id] = weights
+        for term, weight in weights.items():
+            self._postings[term][doc_id] = weight
+
+    def remove(self, doc_id):
+        weights = self._docs.pop(doc_id, None)
+        if not weights:
+            return
+        for term in weights:
+            posting = self._postings[term]
+            posting.pop(doc_id, None)
+            if not posting:
+                del self._postings[term]
+
+    def clear(self):
+        self._postings.clear()
+        self._docs.clear()
+
+    def terms(self, doc_id):
+        return self._docs.get(doc_id, {})
+
+    def idf(self, term):
+        df = len(self._postings.get(term, ()))
+        return math.log((len(self._docs) + 1) / (df + 1)) + 1.0
+
+    def search(self, tokens, top=50):
+        """返回与查询最相似的 top 个 (doc_id, score)，score 为余弦相似度"""
+        query = {
+            term: weight * self.idf(term)
+            for term, weight in term_weights(tokens).items()
+            if term in self._postings
+        }
+        norm = math.sqrt(sum(w * w for w in query.values()))
+        if not norm:
+            return []
+
+        scores = defaultdict(float)
+        for term, q_weight in query.items():
+            q_weight /= norm
+            for doc_id, weight in self._postings[term].items():
+                scores[doc_id] += q_weight * weight
+        return heapq.nlargest(top, scores.items(), key=itemgetter(1))
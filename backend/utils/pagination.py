@@ -0,0 +1,61 @@
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import and_, or_
+
+MAX_PAGE_LIMIT = 100
+
+
+def encode_cursor(created_at, row_id):
+    """把 (created_at, id) 编码成不透明的游标字符串"""
+    payload = json.dumps([created_at.isoformat() if created_at else None, row_id])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """解析游标，格式错误时抛出 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii"))
+        created_at, row_id = json.loads(raw.decode("utf-8"))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (TypeError, ValueError, UnicodeError):
+        raise ValueError("invalid cursor")
+
+
+def parse_limit(value):
+    """解析 limit 参数，未提供时返回 None（不分页）"""
+    if value in (None, ""):
+        return None
+    limit = int(value)
+    if limit <= 0:
+        raise ValueError("limit must be positive")
+    return min(limit, MAX_PAGE_LIMIT)
+
+
+def keyset_paginate(query, created_col, id_col, limit=None, cursor=None):
+    """按 (created_at desc, id desc) 做键集分页，返回 (rows, next_cursor)
+
+    与 OFFSET 不同，翻到第 N 页只需要从游标位置继续扫描，代价与第一页相同。
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                created_col < created_at,
+                and_(created_col == created_at, id_col < row_id),
+            )
+        )
+    query = query.order_by(created_col.desc(), id_col.desc())
+
+    if limit is None:
+        return query.all(), None
+
+    # 多取一条用来判断是否还有下一页
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(
+        getattr(last, created_col.key), getattr(last, id_col.key)
+    )
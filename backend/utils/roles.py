@@ -1,7 +1,6 @@
 from functools import wraps
-from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
-from models.user import User
-from flask import abort
+from flask_jwt_extended import verify_jwt_in_request
+from utils.identity import current_identity
 
 
 def roles_required(*allowed_roles):
@@ -13,11 +12,11 @@ def roles_required(*allowed_roles):
             except Exception:
                 # return plain payload and status rather than a Response object
                 return {"message": "missing or invalid token"}, 401
-            user_id = int(get_jwt_identity())
-            user = User.query.get(user_id)
-            if not user:
-                return {"message": "user not found"}, 404
-            if user.role not in allowed_roles:
+            # role is looked up (through the user cache), not trusted from the token
+            identity = current_identity()
+            if not identity:
+                return {"message": "user not found"}, 401
+            if identity.role not in allowed_roles:
                 return {"message": "forbidden"}, 403
             return fn(*args, **kwargs)
 
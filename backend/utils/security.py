@@ -1,16 +1,214 @@
 import hashlib
+import hmac
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class HashingBusy(Exception):
+    """密码哈希队列已满"""
+
+
+class LegacySHA256Hasher:
+    """旧格式 `salt$sha256hex`，只用于校验，登录成功后会被升级"""
+
+    name = "sha256"
+
+    def hash(self, password):
+        salt = os.urandom(8).hex()
+        hashed = hashlib.sha256((salt + password).encode("utf-8")).hexdigest()
+        return f"{salt}${hashed}"
+
+    def verify(self, password, stored):
+        try:
+            salt, hashed = stored.split("$", 1)
+        except ValueError:
+            return False
+        computed = hashlib.sha256((salt + password).encode("utf-8")).hexdigest()
+        return hmac.compare_digest(computed, hashed)
+
+    def needs_rehash(self, stored):
+        return True
+
+
+class PBKDF2Hasher:
+    """格式 `pbkdf2_sha256$<iterations>$<salt>$<hash>`"""
+
+    name = "pbkdf2_sha256"
+
+    def __init__(self, iterations=600_000):
+        self.iterations = iterations
+
+    def hash(self, password):
+        salt = os.urandom(16).hex()
+        hashed = self._derive(password, salt, self.iterations)
+        return f"{self.name}${self.iterations}${salt}${hashed}"
+
+    def verify(self, password, stored):
+        try:
+            _, iterations, salt, hashed = stored.split("$")
+            iterations = int(iterations)
+        except ValueError:
+            return False
+        return hmac.compare_digest(self._derive(password, salt, iterations), hashed)
+
+    def needs_rehash(self, stored):
+        try:
+            return int(stored.split("$")[1]) != self.iterations
+        except (IndexError, ValueError):
+            return True
+
+    @staticmethod
+    def _derive(password, salt, iterations):
+        return hashlib.pbkdf2_hmac(
+            "sha256", password.encode("utf-8"), salt.encode("ascii"), iterations
+        ).hex()
+
+
+class ScryptHasher:
+    """格式 `scrypt$<n>$<r>$<p>$<salt>$<hash>`"""
+
+    name = "scrypt"
+
+    def __init__(self, n=2**14, r=8, p=1):
+        self.n, self.r, self.p = n, r, p
+
+    def hash(self, password):
+        salt = os.urandom(16).hex()
+        hashed = self._derive(password, salt, self.n, self.r, self.p)
+        return f"{self.name}${self.n}${self.r}${self.p}${salt}${hashed}"
+
+    def verify(self, password, stored):
+        try:
+            _, n, r, p, salt, hashed = stored.split("$")
+            n, r, p = int(n), int(r), int(p)
+        except ValueError:
+            return False
+        return hmac.compare_digest(self._derive(password, salt, n, r, p), hashed)
+
+    def needs_rehash(self, stored):
+        try:
+            params = tuple(int(v) for v in stored.split("$")[1:4])
+        except ValueError:
+            return True
+        return params != (self.n, self.r, self.p)
+
+    @staticmethod
+    def _derive(password, salt, n, r, p):
+        return hashlib.scrypt(
+            password.encode("utf-8"),
+            salt=salt.encode("ascii"),
+            n=n,
+            r=r,
+            p=p,
+            maxmem=128 * n * r * p + 1024 * 1024,
+            dklen=32,
+        ).hex()
+
+
+HASHERS = {
+    hasher.name: hasher
+    for hasher in (LegacySHA256Hasher(), PBKDF2Hasher(), ScryptHasher())
+}
+
+_settings = {"default": PBKDF2Hasher.name, "workers": 4, "queue_size": 64}
+_executor = None
+_slots = None
+_lock = threading.Lock()
+
+
+def init_password_hashing(app):
+    """根据配置设置默认哈希算法和哈希线程池大小"""
+    global _executor, _slots
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _settings["default"] = app.config.get("PASSWORD_HASHER", PBKDF2Hasher.name)
+        _settings["workers"] = app.config.get("PASSWORD_HASH_WORKERS", 4)
+        _settings["queue_size"] = app.config.get("PASSWORD_HASH_QUEUE_SIZE", 64)
+        if _settings["default"] not in HASHERS:
+            raise ValueError(f"unknown password hasher: {_settings['default']}")
+        _executor = None
+        _slots = None
+
+
+def _pool():
+    global _executor, _slots
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_settings["workers"], thread_name_prefix="pwhash"
+            )
+            _slots = threading.BoundedSemaphore(
+                _settings["workers"] + _settings["queue_size"]
+            )
+        return _executor, _slots
+
+
+def _submit(fn, *args):
+    """在有界线程池中执行 KDF，排队数超过上限时抛出 HashingBusy
+
+    hashlib 的 pbkdf2_hmac/scrypt 计算期间会释放 GIL，所以线程池即可并行，
+    同时请求线程数不会被登录高峰占满。
+    """
+    executor, slots = _pool()
+    if not slots.acquire(blocking=False):
+        raise HashingBusy("password hashing queue is full")
+    try:
+        future = executor.submit(fn, *args)
+    except Exception:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    return future.result()
+
+
+def _identify(stored):
+    prefix = stored.split("$", 1)[0]
+    return HASHERS.get(prefix, HASHERS[LegacySHA256Hasher.name])
 
 
 def hash_password(password: str) -> str:
-    salt = os.urandom(8).hex()
-    hashed = hashlib.sha256((salt + password).encode("utf-8")).hexdigest()
-    return f"{salt}${hashed}"
+    return _submit(HASHERS[_settings["default"]].hash, password)
+
+
+def hash_passwords(passwords):
+    """批量哈希（导入用），与登录共用有界线程池和排队名额
+
+    同时最多占用 workers 个名额，名额不足时等待而不是抛出 HashingBusy，
+    其余名额留给登录请求。
+    """
+    hasher = HASHERS[_settings["default"]]
+    executor, slots = _pool()
+    window = threading.Semaphore(_settings["workers"])
+
+    def release(_):
+        slots.release()
+        window.release()
+
+    futures = []
+    for password in passwords:
+        window.acquire()
+        slots.acquire()
+        try:
+            future = executor.submit(hasher.hash, password)
+        except Exception:
+            release(None)
+            raise
+        future.add_done_callback(release)
+        futures.append(future)
+    return [future.result() for future in futures]
 
 
 def check_password(password: str, stored: str) -> bool:
-    try:
-        salt, hashed = stored.split("$", 1)
-    except ValueError:
+    if not stored:
         return False
-    return hashlib.sha256((salt + password).encode("utf-8")).hexdigest() == hashed
+    return _submit(_identify(stored).verify, password, stored)
+
+
+def needs_rehash(stored: str) -> bool:
+    """存储的哈希不是当前默认算法/参数时返回 True"""
+    hasher = _identify(stored)
+    if hasher.name != _settings["default"]:
+        return True
+    return hasher.needs_rehash(stored)
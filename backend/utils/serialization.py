@@ -0,0 +1,75 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from operator import attrgetter
+from flask import make_response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def _default(obj):
+    """处理 orjson/json 不能直接编码的类型"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(data):
+    """序列化为 JSON bytes；安装了 orjson 时使用 orjson，datetime 原生编码"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_default, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data):
+    """dumps 的逆操作"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def output_json(data, code, headers=None):
+    """flask-restx 的 application/json representation"""
+    resp = make_response(dumps(data), code)
+    resp.headers.extend(headers or {})
+    resp.mimetype = "application/json"
+    return resp
+
+
+def compile_serializer(fields, nested=None):
+    """预先编译模型字段序列化函数，替代手写的 to_dict 字典构造
+
+    fields 为直接读取的列属性；nested 为 {属性名: 序列化函数}，关联对象为 None 时
+    输出 None。datetime 字段原样保留，由 dumps 负责编码。
+    """
+    fields = tuple(fields)
+    getter = attrgetter(*fields)
+    nested = tuple((nested or {}).items())
+
+    if len(fields) == 1:
+        (name,) = fields
+
+        def read(obj):
+            return {name: getter(obj)}
+
+    else:
+
+        def read(obj):
+            return dict(zip(fields, getter(obj)))
+
+    if not nested:
+        return read
+
+    def serialize(obj):
+        data = read(obj)
+        for name, fn in nested:
+            value = getattr(obj, name)
+            data[name] = fn(value) if value is not None else None
+        return data
+
+    return serialize
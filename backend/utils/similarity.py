@@ -0,0 +1,146 @@
+import ast
+import re
+from utils.text_search import tokenize
+
+FEATURES_VERSION = 1
+
+# 编辑距离按词计算并截断，保证单题开销有上限
+MAX_EDIT_TOKENS = 300
+
+_CODE_TOKEN_RE = re.compile(r"[A-Za-z_]\w*|\d+|\S")
+
+
+def jaccard(a, b):
+    a, b = set(a), set(b)
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def shingles(tokens, k=3):
+    """长度为 k 的连续词组；不足 k 个词时退化为整体"""
+    if len(tokens) < k:
+        return {tuple(tokens)} if tokens else set()
+    return {tuple(tokens[i : i + k]) for i in range(len(tokens) - k + 1)}
+
+
+def edit_similarity(a, b):
+    """1 - 归一化 Levenshtein 距离，按词序列计算"""
+    a, b = a[:MAX_EDIT_TOKENS], b[:MAX_EDIT_TOKENS]
+    longest = max(len(a), len(b))
+    if not longest:
+        return 1.0
+    # 去掉公共前后缀，只对中间不同的部分做动态规划
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a, b = a[start : len(a) - end], b[start : len(b) - end]
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i]
+        left = i
+        for j, y in enumerate(b):
+            cost = previous[j] if x == y else previous[j] + 1
+            up = previous[j + 1] + 1
+            left = left + 1
+            if up < left:
+                left = up
+            if cost < left:
+                left = cost
+            current.append(left)
+        previous = current
+    return 1.0 - previous[-1] / longest
+
+
+class _Normalizer(ast.NodeTransformer):
+    """把标识符按出现顺序改写为占位名，去掉文档字符串，使变量改名不影响比较"""
+
+    def __init__(self):
+        self.names = {}
+
+    def _rename(self, name):
+        return self.names.setdefault(name, f"v{len(self.names)}")
+
+    def visit_Name(self, node):
+        node.id = self._rename(node.id)
+        return node
+
+    def visit_arg(self, node):
+        node.arg = self._rename(node.arg)
+        node.annotation = None
+        return node
+
+    def _visit_def(self, node):
+        node.name = self._rename(node.name)
+        body = node.body
+        if (
+            body
+            and isinstance(body[0], ast.Expr)
+            and isinstance(body[0].value, ast.Constant)
+            and isinstance(body[0].value.value, str)
+        ):
+            node.body = body[1:] or [ast.Pass()]
+        self.generic_visit(node)
+        return node
+
+    visit_FunctionDef = visit_AsyncFunctionDef = visit_ClassDef = _visit_def
+
+
+def _ast_nodes(source):
+    """解析 Python 代码并返回归一化后的节点类型序列，语法错误时返回 None"""
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+    tree = _Normalizer().visit(tree)
+    return [getattr(node, "id", None) or type(node).__name__ for node in ast.walk(tree)]
+
+
+def ast_similarity(reference, answer):
+    """Python 代码的结构相似度：归一化 AST 节点序列的 3-gram Jaccard
+
+    任一方不能解析为 Python 时返回 None。
+    """
+    ref_nodes, ans_nodes = _ast_nodes(reference), _ast_nodes(answer)
+    if ref_nodes is None or ans_nodes is None:
+        return None
+    if ref_nodes == ans_nodes:
+        return 1.0
+    return jaccard(shingles(ref_nodes), shingles(ans_nodes))
+
+
+def similarity_features(question_type, reference, answer):
+    """计算参考答案与面试者答案的相似度特征，供评价界面参考"""
+    reference, answer = reference or "", answer or ""
+    if question_type == "code":
+        ref_tokens = _CODE_TOKEN_RE.findall(reference)
+        ans_tokens = _CODE_TOKEN_RE.findall(answer)
+    else:
+        ref_tokens, ans_tokens = tokenize(reference), tokenize(answer)
+
+    features = {
+        "version": FEATURES_VERSION,
+        "token_jaccard": round(jaccard(ref_tokens, ans_tokens), 4),
+        "shingle_jaccard": round(
+            jaccard(shingles(ref_tokens), shingles(ans_tokens)), 4
+        ),
+        "edit_similarity": round(edit_similarity(ref_tokens, ans_tokens), 4),
+    }
+    if question_type == "code":
+        score = ast_similarity(reference, answer)
+        features["ast_similarity"] = None if score is None else round(score, 4)
+    return features
+
+
+def similarity_batch(rows):
+    """批量计算 [(question_id, question_type, reference, answer)]，可在子进程中执行"""
+    return [
+        (qid, similarity_features(qtype, reference, answer))
+        for qid, qtype, reference, answer in rows
+    ]
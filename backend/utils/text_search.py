@@ -0,0 +1,57 @@
+import html
+import re
+
+_TOKEN_RE = re.compile(r"[0-9a-z]+|[㐀-鿿豈-﫿]+")
+_CJK_RE = re.compile(r"[㐀-鿿豈-﫿]")
+
+
+def tokenize(text):
+    """把文本切成检索词：英文/数字按词小写，中文按相邻二字切分
+
+    Postgres 和 SQLite 的分词器都不能切分中文，所以在应用层预先分好词，
+    索引和查询使用同一套规则。
+    """
+    tokens = []
+    for match in _TOKEN_RE.finditer((text or "").lower()):
+        word = match.group()
+        if _CJK_RE.match(word):
+            if len(word) == 1:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def index_text(text):
+    """生成写入 search_tokens 列的检索词串"""
+    return " ".join(tokenize(text))
+
+
+def query_terms(query):
+    """查询中的原始关键词，用于生成高亮摘要"""
+    return [term for term in (query or "").split() if term]
+
+
+def build_snippet(content, terms, width=40):
+    """截取第一个命中关键词附近的原文，并用 <mark> 高亮所有关键词"""
+    content = content or ""
+    lowered = content.lower()
+    positions = [lowered.find(term.lower()) for term in terms]
+    positions = [p for p in positions if p >= 0]
+    start = max(min(positions) - width, 0) if positions else 0
+    end = min(start + width * 3, len(content))
+
+    snippet = html.escape(content[start:end])
+    if terms:
+        pattern = "|".join(
+            re.escape(html.escape(term))
+            for term in sorted(terms, key=len, reverse=True)
+        )
+        snippet = re.sub(
+            pattern, lambda m: f"<mark>{m.group()}</mark>", snippet, flags=re.I
+        )
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(content) else ""
+    return prefix + snippet + suffix
@@ -17,6 +17,11 @@ export const interviewApi = {
     return api.get(`/interviews/${id}`)
   },
 
+  // 获取面试详情（含题目、评价和简历）
+  getInterviewFull(id) {
+    return api.get(`/interviews/${id}/full`)
+  },
+
   // 更新面试
   updateInterview(id, data) {
     return api.put(`/interviews/${id}`, data)
@@ -11,6 +11,17 @@ export const userAPI = {
     }
   },
 
+  // 搜索用户（按用户名/邮箱，服务端分页）
+  async searchUsers({ role, q, limit = 20, cursor } = {}) {
+    const response = await api.get('/users', { params: { role, q, limit, cursor } })
+    return {
+      data: {
+        users: response.data.data || [],
+        nextCursor: response.data.next_cursor || null
+      }
+    }
+  },
+
   // 获取所有用户
   async getAllUsers() {
     const response = await api.get('/users')